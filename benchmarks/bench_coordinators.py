@@ -0,0 +1,184 @@
+"""Benchmark the cloud and local coordinators against the offline stand-in server.
+
+Starts ``benchmarks.fake_meural`` in its own thread, then for each fleet size
+runs the integration's setup sequence (cloud refresh, local first refreshes,
+gallery refresh) followed by a series of poll rounds. Each round stands for one
+LOCAL_UPDATE_INTERVAL; the cloud coordinator is polled every
+CLOUD_UPDATE_INTERVAL of simulated time. Reports setup time, per-poll update
+latency, requests per simulated minute and event loop lag.
+
+Run from the repository root in a Home Assistant development environment:
+
+    python -m benchmarks.bench_coordinators --frames 1 10 100 --latency 0.02
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from typing import Any
+
+import aiohttp
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.meural import pymeural
+from custom_components.meural.const import CLOUD_UPDATE_INTERVAL, LOCAL_UPDATE_INTERVAL
+from custom_components.meural.coordinator import CloudDataUpdateCoordinator, LocalDataUpdateCoordinator
+
+from .fake_meural import FakeMeuralConfig, ThreadedFakeMeuralServer
+
+LAG_INTERVAL = 0.005
+
+
+class LoopLagMonitor:
+    """Measure how late the event loop wakes up a periodic sleeper."""
+
+    def __init__(self) -> None:
+        self.samples: list[float] = []
+        self._task: asyncio.Task[None] | None = None
+
+    async def _run(self) -> None:
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(LAG_INTERVAL)
+            self.samples.append(max(0.0, time.perf_counter() - started - LAG_INTERVAL))
+
+    def start(self) -> None:
+        self.samples.clear()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+async def run(frames: int, polls: int, cloud_rate: float, config: FakeMeuralConfig) -> dict[str, Any]:
+    """Set up and poll a fleet of frames, returning the measurements."""
+    config.frames = frames
+    threaded = ThreadedFakeMeuralServer(config)
+    server = threaded.start()
+    hass = HomeAssistant(tempfile.mkdtemp())
+    session = aiohttp.ClientSession()
+    monitor = LoopLagMonitor()
+    username = f"bench-{frames}@example.com"
+    pymeural._RATE_LIMITERS[username] = pymeural.CloudRateLimiter(rate=cloud_rate)
+    try:
+        meural = pymeural.PyMeural(
+            username, "password", "bench-token", lambda *_: None, session, base_url=server.cloud_url
+        )
+        cloud = CloudDataUpdateCoordinator(hass, meural, None)
+        # Keep polls from starting their own gallery refresh; it is timed separately.
+        cloud._last_gallery_fetch = time.monotonic()
+
+        monitor.start()
+        started = time.perf_counter()
+        await cloud.async_refresh()
+        if not cloud.last_update_success:
+            raise RuntimeError(f"Cloud refresh failed: {cloud.last_exception}")
+        locals_ = [
+            LocalDataUpdateCoordinator(hass, device, session) for device in cloud.data["devices"].values()
+        ]
+        for local in locals_:
+            cloud.register_local_coordinator(local.device_id, local)
+            local.cloud_coordinator = cloud
+        await asyncio.gather(*(local.async_refresh() for local in locals_))
+        setup_time = time.perf_counter() - started
+
+        started = time.perf_counter()
+        await cloud.async_refresh_galleries()
+        gallery_time = time.perf_counter() - started
+        setup_lag = list(monitor.samples)
+
+        server.requests.clear()
+        monitor.samples.clear()
+        round_times = []
+        polls_per_cloud = max(1, CLOUD_UPDATE_INTERVAL // LOCAL_UPDATE_INTERVAL)
+        for index in range(polls):
+            started = time.perf_counter()
+            refreshes = [local.async_refresh() for local in locals_]
+            if index % polls_per_cloud == 0:
+                refreshes.append(cloud.async_refresh())
+            await asyncio.gather(*refreshes)
+            round_times.append(time.perf_counter() - started)
+        poll_lag = list(monitor.samples)
+        await monitor.stop()
+
+        local_latencies = [local.update_stats.last_duration or 0.0 for local in locals_]
+        simulated_minutes = polls * LOCAL_UPDATE_INTERVAL / 60
+        cloud_requests = sum(count for key, count in server.requests.items() if key.startswith("cloud:"))
+        local_requests = sum(count for key, count in server.requests.items() if key.startswith("local:"))
+        return {
+            "frames": frames,
+            "setup_s": setup_time,
+            "gallery_refresh_s": gallery_time,
+            "setup_lag_max_ms": 1000 * max(setup_lag, default=0.0),
+            "poll_round_p50_ms": 1000 * statistics.median(round_times),
+            "poll_round_max_ms": 1000 * max(round_times),
+            "local_update_mean_ms": 1000 * sum(local.update_stats.total_time for local in locals_)
+            / max(1, sum(local.update_stats.count for local in locals_)),
+            "local_update_last_max_ms": 1000 * max(local_latencies, default=0.0),
+            "cloud_requests_per_min": cloud_requests / simulated_minutes,
+            "local_requests_per_min": local_requests / simulated_minutes,
+            "loop_lag_p99_ms": 1000 * _percentile(poll_lag, 0.99),
+            "loop_lag_max_ms": 1000 * max(poll_lag, default=0.0),
+        }
+    finally:
+        await monitor.stop()
+        await session.close()
+        threaded.stop()
+        pymeural._RATE_LIMITERS.pop(username, None)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--polls", type=int, default=30, help="poll rounds per fleet size")
+    parser.add_argument("--latency", type=float, default=0.02, help="simulated response time in seconds")
+    parser.add_argument("--jitter", type=float, default=0.01)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--galleries-per-frame", type=int, default=5)
+    parser.add_argument("--items-per-gallery", type=int, default=20)
+    parser.add_argument(
+        "--cloud-rate",
+        type=float,
+        default=pymeural.CLOUD_RATE_LIMIT,
+        help="cloud requests per second allowed by the rate limiter",
+    )
+    args = parser.parse_args()
+
+    for frames in args.frames:
+        config = FakeMeuralConfig(
+            latency=args.latency,
+            jitter=args.jitter,
+            failure_rate=args.failure_rate,
+            galleries_per_frame=args.galleries_per_frame,
+            items_per_gallery=args.items_per_gallery,
+        )
+        result = asyncio.run(run(frames, args.polls, args.cloud_rate, config))
+        print(f"Frames: {frames}")
+        print(f"  Setup (cloud + local first refresh): {result['setup_s']:8.2f} s")
+        print(f"  Gallery refresh:                     {result['gallery_refresh_s']:8.2f} s")
+        print(f"  Loop lag max during setup:           {result['setup_lag_max_ms']:8.1f} ms")
+        print(f"  Poll round p50 / max:                {result['poll_round_p50_ms']:8.1f} / {result['poll_round_max_ms']:.1f} ms")
+        print(f"  Local update mean:                   {result['local_update_mean_ms']:8.1f} ms")
+        print(f"  Cloud requests per minute:           {result['cloud_requests_per_min']:8.1f}")
+        print(f"  Local requests per minute:           {result['local_requests_per_min']:8.1f}")
+        print(f"  Loop lag p99 / max:                  {result['loop_lag_p99_ms']:8.1f} / {result['loop_lag_max_ms']:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
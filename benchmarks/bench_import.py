@@ -0,0 +1,79 @@
+"""Benchmark the import time of the integration's modules.
+
+Imports each module in a fresh interpreter, so nothing is cached in
+``sys.modules``, and reports the median wall time over several runs. Home
+Assistant itself is imported before the clock starts, as it is always loaded
+before the integration. Fails if importing the integration pulls in boto3 or
+botocore, which are only needed once authentication actually runs.
+
+Run from the repository root in a Home Assistant development environment:
+
+    python -m benchmarks.bench_import --runs 5
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+MODULES = (
+    "custom_components.meural.pymeural",
+    "custom_components.meural.config_flow",
+    "custom_components.meural",
+    "custom_components.meural.media_player",
+    "custom_components.meural.sensor",
+    "custom_components.meural.light",
+)
+REFERENCE_MODULES = ("boto3",)
+DEFERRED_MODULES = ("boto3", "botocore")
+
+PRELOAD = "import homeassistant.core, homeassistant.helpers.update_coordinator, aiohttp"
+
+SNIPPET = """
+import json, sys, time
+{preload}
+started = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - started
+print(json.dumps({{"elapsed": elapsed, "loaded": sorted(name for name in {deferred!r} if name in sys.modules)}}))
+"""
+
+
+def measure(module: str, runs: int) -> tuple[float, list[str]]:
+    """Return the median import time of a module and the deferred modules it loaded."""
+    times = []
+    loaded: list[str] = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", SNIPPET.format(preload=PRELOAD, module=module, deferred=DEFERRED_MODULES)],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        times.append(result["elapsed"])
+        loaded = result["loaded"]
+    return statistics.median(times), loaded
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    failed = False
+    for module in (*MODULES, *REFERENCE_MODULES):
+        elapsed, loaded = measure(module, args.runs)
+        note = ""
+        if module in MODULES and loaded:
+            failed = True
+            note = f"  loads {', '.join(loaded)}"
+        print(f"  {module:40s} {1000 * elapsed:8.1f} ms{note}")
+    if failed:
+        sys.exit("Importing the integration must not import boto3 or botocore")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Benchmark how quickly local polling recovers after a Canvas changes IP address.
+
+Sets up the cloud and local coordinators against ``benchmarks.fake_meural``,
+then moves every frame to a new port, as after a DHCP change, and runs a
+series of poll rounds. Each round stands for one LOCAL_UPDATE_INTERVAL; the
+cloud coordinator is polled every CLOUD_UPDATE_INTERVAL of simulated time and
+hands its device records to the local coordinators, as the media player does.
+The change happens right after a cloud poll, the worst case.
+Reports the failed local polls per frame until every frame is reachable again.
+
+With ``--no-cloud-poll`` only the rediscovery after consecutive connection
+failures can pick up the new address.
+
+Run from the repository root in a Home Assistant development environment:
+
+    python -m benchmarks.bench_ip_change --frames 10 --polls 30
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import tempfile
+import time
+from typing import Any
+
+import aiohttp
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.meural import pymeural
+from custom_components.meural.const import CLOUD_UPDATE_INTERVAL, LOCAL_UPDATE_INTERVAL
+from custom_components.meural.coordinator import CloudDataUpdateCoordinator, LocalDataUpdateCoordinator
+
+from .fake_meural import FakeMeuralConfig, FakeMeuralServer
+
+USERNAME = "bench-ip@example.com"
+
+
+async def run(frames: int, polls: int, cloud_poll: bool) -> dict[str, Any]:
+    """Move every frame to a new address and count failed polls until they recover."""
+    async with FakeMeuralServer(FakeMeuralConfig(frames=frames)) as server:
+        hass = HomeAssistant(tempfile.mkdtemp())
+        pymeural._RATE_LIMITERS[USERNAME] = pymeural.CloudRateLimiter(rate=1e9, burst=10**9)
+        async with aiohttp.ClientSession() as session:
+            meural = pymeural.PyMeural(
+                USERNAME, "password", "bench-token", lambda *_: None, session, base_url=server.cloud_url
+            )
+            cloud = CloudDataUpdateCoordinator(hass, meural, None)
+            cloud._last_gallery_fetch = time.monotonic()
+            await cloud.async_refresh()
+            locals_ = [
+                LocalDataUpdateCoordinator(hass, dict(device), session) for device in cloud.data["devices"].values()
+            ]
+            for local in locals_:
+                cloud.register_local_coordinator(local.device_id, local)
+                local.cloud_coordinator = cloud
+            await asyncio.gather(*(local.async_refresh() for local in locals_))
+
+            for device_id in server.devices:
+                await server.move_frame(device_id)
+
+            failed = {local.device_id: 0 for local in locals_}
+            recovered_round: dict[str, int] = {}
+            polls_per_cloud = max(1, CLOUD_UPDATE_INTERVAL // LOCAL_UPDATE_INTERVAL)
+            for index in range(polls):
+                if cloud_poll and index % polls_per_cloud == polls_per_cloud - 1:
+                    await cloud.async_refresh()
+                    for local in locals_:
+                        local.update_device(cloud.data["devices"][local.device_id])
+                await asyncio.gather(*(local.async_refresh() for local in locals_))
+                for local in locals_:
+                    if local.last_fetch_error is not None:
+                        failed[local.device_id] += 1
+                    else:
+                        recovered_round.setdefault(local.device_id, index + 1)
+
+            return {
+                "frames": frames,
+                "failed_polls_mean": sum(failed.values()) / max(1, len(failed)),
+                "failed_polls_max": max(failed.values(), default=0),
+                "recovered": len(recovered_round),
+                "ip_changes": sum(local.ip_changes for local in locals_),
+            }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=10)
+    parser.add_argument("--polls", type=int, default=30)
+    parser.add_argument("--no-cloud-poll", dest="cloud_poll", action="store_false")
+    args = parser.parse_args()
+
+    result = asyncio.run(run(args.frames, args.polls, args.cloud_poll))
+    print(f"Frames: {result['frames']}, recovered: {result['recovered']}, IP changes: {result['ip_changes']}")
+    print(f"  Failed polls per frame: mean {result['failed_polls_mean']:.1f}, max {result['failed_polls_max']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Benchmark building and querying the library search index.
+
+Indexes the items and galleries of a ``benchmarks.fake_meural`` account, then
+reports the time to build the index, to refresh it when a few records changed,
+and the median and maximum time of a set of queries.
+
+Run from the repository root in a Home Assistant development environment:
+
+    python -m benchmarks.bench_library --galleries 100 --items-per-gallery 50
+"""
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import statistics
+import time
+from typing import Any
+
+from custom_components.meural.library import KIND_GALLERY, KIND_ITEM, LibraryIndex
+from custom_components.meural.records import Gallery, Item
+
+from .fake_meural import FakeMeuralConfig, FakeMeuralServer
+
+QUERIES = ("artist 42", "artwork 1001", "playlist", "18", "a", "artist 9 artwork", "missing")
+
+
+def run(galleries: int, items_per_gallery: int, changed: int) -> dict[str, Any]:
+    """Build an index of the simulated account and time refreshes and queries."""
+    server = FakeMeuralServer(FakeMeuralConfig(user_galleries=galleries, items_per_gallery=items_per_gallery))
+    items = [Item.from_api(item) for item in server.items.values()]
+    index = LibraryIndex()
+
+    start = time.perf_counter()
+    for gallery in server.galleries.values():
+        index.update(KIND_GALLERY, Gallery.from_api(gallery))
+    for item in items:
+        index.update(KIND_ITEM, item)
+    build = time.perf_counter() - start
+
+    for position, item in enumerate(items[:changed]):
+        items[position] = dataclasses.replace(item, name=f"{item.name} (restored)")
+    start = time.perf_counter()
+    updated = sum(index.update(KIND_ITEM, item) for item in items)
+    index.retain(KIND_ITEM, (item.id for item in items))
+    refresh = time.perf_counter() - start
+
+    query_times = []
+    for query in QUERIES:
+        start = time.perf_counter()
+        index.search(query)
+        query_times.append(time.perf_counter() - start)
+
+    return {
+        "records": len(index),
+        "build_ms": build * 1000,
+        "refresh_ms": refresh * 1000,
+        "updated": updated,
+        "query_median_ms": statistics.median(query_times) * 1000,
+        "query_max_ms": max(query_times) * 1000,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--galleries", type=int, default=100)
+    parser.add_argument("--items-per-gallery", type=int, default=50)
+    parser.add_argument("--changed", type=int, default=10)
+    args = parser.parse_args()
+
+    result = run(args.galleries, args.items_per_gallery, args.changed)
+    print(f"Records: {result['records']}, build {result['build_ms']:.1f} ms")
+    print(f"  Refresh with {result['updated']} changed records: {result['refresh_ms']:.1f} ms")
+    print(f"  Query: median {result['query_median_ms']:.2f} ms, max {result['query_max_ms']:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
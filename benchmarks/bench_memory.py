@@ -0,0 +1,119 @@
+"""Benchmark the memory held by the cloud coordinator's devices, galleries and items.
+
+Builds a ``benchmarks.fake_meural`` account and compares the memory retained by
+the raw API payloads, as decoded from JSON, with the compact records the
+coordinator keeps: device payloads trimmed to the fields in use, gallery
+records shared between the device and user gallery lists, and item records
+for a full item cache. Memory is measured with ``tracemalloc``.
+
+Real cloud payloads carry more fields than the fake server's; ``--extra-fields``
+adds that many unused fields to every payload to approximate them.
+
+Run from the repository root in a Home Assistant development environment:
+
+    python -m benchmarks.bench_memory --galleries 1000 --frames 20
+"""
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable
+import json
+import tracemalloc
+from typing import Any
+
+from custom_components.meural.const import ITEM_CACHE_SIZE
+from custom_components.meural.records import Gallery, Item, compact_device
+
+from .fake_meural import FakeMeuralConfig, FakeMeuralServer
+
+
+def decode(payload: list[dict[str, Any]], extra_fields: int) -> list[dict[str, Any]]:
+    """Return a fresh copy of an API response, as the client decodes it."""
+    records = json.loads(json.dumps(payload))
+    for record in records:
+        for index in range(extra_fields):
+            record[f"unusedField{index}"] = f"value {index} of {record['id']}"
+    return records
+
+
+def retained(build: Callable[[], Any]) -> tuple[int, Any]:
+    """Return the bytes still allocated by build() once it returns, and its result."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = build()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return after - before, result
+
+
+def run(galleries: int, frames: int, galleries_per_frame: int, extra_fields: int) -> dict[str, tuple[int, int]]:
+    """Return the raw payload and record bytes of devices, galleries and cached items."""
+    server = FakeMeuralServer(
+        FakeMeuralConfig(frames=frames, galleries_per_frame=galleries_per_frame, user_galleries=galleries)
+    )
+    devices = list(server.devices.values())
+    user_galleries = [server.galleries[gallery_id] for gallery_id in range(1, galleries + 1)]
+    device_galleries = {
+        str(device_id): [server.galleries[gallery_id] for gallery_id in gallery_ids]
+        for device_id, gallery_ids in server.device_galleries.items()
+    }
+    items = list(server.items.values())[:ITEM_CACHE_SIZE]
+
+    def raw_galleries() -> dict[str, Any]:
+        return {
+            "device_galleries": {
+                device_id: decode(payload, extra_fields) for device_id, payload in device_galleries.items()
+            },
+            "user_galleries": decode(user_galleries, extra_fields),
+        }
+
+    def gallery_records() -> dict[str, Any]:
+        # The coordinator keeps one record per gallery ID for all lists
+        shared: dict[int, Gallery] = {}
+
+        def to_records(payload: list[dict[str, Any]]) -> list[Gallery]:
+            return [
+                shared.setdefault(int(gallery["id"]), Gallery.from_api(gallery))
+                for gallery in decode(payload, extra_fields)
+            ]
+
+        return {
+            "device_galleries": {device_id: to_records(payload) for device_id, payload in device_galleries.items()},
+            "user_galleries": to_records(user_galleries),
+        }
+
+    parts = {
+        "devices": (
+            lambda: {str(device["id"]): device for device in decode(devices, extra_fields)},
+            lambda: {str(device["id"]): compact_device(device) for device in decode(devices, extra_fields)},
+        ),
+        "galleries": (raw_galleries, gallery_records),
+        "items": (
+            lambda: {str(item["id"]): item for item in decode(items, extra_fields)},
+            lambda: {str(item["id"]): Item.from_api(item) for item in decode(items, extra_fields)},
+        ),
+    }
+    return {name: (retained(raw)[0], retained(compact)[0]) for name, (raw, compact) in parts.items()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--galleries", type=int, default=1000)
+    parser.add_argument("--frames", type=int, default=20)
+    parser.add_argument("--galleries-per-frame", type=int, default=5)
+    parser.add_argument("--extra-fields", type=int, default=0)
+    args = parser.parse_args()
+
+    result = run(args.galleries, args.frames, args.galleries_per_frame, args.extra_fields)
+    print(
+        f"Frames: {args.frames}, galleries: {args.galleries} + {args.galleries_per_frame} per frame, "
+        f"cached items: {ITEM_CACHE_SIZE}"
+    )
+    for name, (raw, compact) in {**result, "total": tuple(map(sum, zip(*result.values())))}.items():
+        print(f"  {name:<10} raw {raw / 1024:8.0f} KiB, records {compact / 1024:8.0f} KiB ({compact / raw:.0%})")
+
+
+if __name__ == "__main__":
+    main()
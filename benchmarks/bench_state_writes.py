@@ -0,0 +1,198 @@
+"""Benchmark Home Assistant state writes per minute for a multi-frame setup.
+
+Sets up the real cloud and local coordinators and the entities of every frame
+against ``benchmarks.fake_meural``, polls them for a simulated period, and
+counts the ``async_write_ha_state`` calls the entities actually make. These are
+compared to the number of entity notifications, which is what writing on every
+coordinator update would cost.
+
+Polls are driven by the benchmark on a simulated clock, so an hour runs in
+seconds and the sensors' minimum write interval and thresholds apply as they
+would in an hour of real time. Only the entities enabled by default are set up
+unless ``--all-entities`` is given. During the period each Canvas moves to its
+next artwork every ``imageDuration``, its backlight drifts now and then, the
+fake server reports a noisy ambient light and WiFi signal, and the cloud
+reports a new last-seen time every minute.
+
+Run from the repository root in a Home Assistant development environment:
+
+    python -m benchmarks.bench_state_writes --frames 20 --minutes 60
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from unittest.mock import MagicMock
+
+import aiohttp
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import restore_state
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from custom_components.meural import coordinator, media_player, pymeural, sensor
+from custom_components.meural.const import (
+    CLOUD_UPDATE_INTERVAL,
+    DEFAULT_LATENCY_THRESHOLD,
+    DEFAULT_LUX_THRESHOLD,
+    DEFAULT_SENSOR_MIN_WRITE_INTERVAL,
+    DEFAULT_WIFI_SIGNAL_THRESHOLD,
+    LOCAL_UPDATE_INTERVAL,
+)
+from custom_components.meural.coordinator import CloudDataUpdateCoordinator, LocalDataUpdateCoordinator
+from custom_components.meural.light import MeuralBacklightLight
+from custom_components.meural.media_player import MeuralEntity
+from custom_components.meural.sensor import (
+    MeuralFreeSpaceSensor,
+    MeuralLastSeenSensor,
+    MeuralLocalLatencySensor,
+    MeuralLuxSensor,
+    MeuralWifiSignalSensor,
+)
+
+from .fake_meural import FakeMeuralConfig, FakeMeuralServer
+
+# Modules whose time.monotonic() calls follow the simulated clock
+CLOCK_MODULES = (coordinator, media_player, sensor)
+
+
+class SimulatedClock:
+    """Stand-in for the time module with a monotonic clock advanced by the benchmark."""
+
+    def __init__(self) -> None:
+        """Start the clock at the current monotonic time."""
+        self.now = time.monotonic()
+
+    def monotonic(self) -> float:
+        """Return the simulated monotonic time."""
+        return self.now
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(time, name)
+
+
+def _entities(
+    meural: pymeural.PyMeural,
+    cloud: CloudDataUpdateCoordinator,
+    local: LocalDataUpdateCoordinator,
+    device: dict[str, Any],
+    all_entities: bool,
+) -> list[CoordinatorEntity]:
+    """Return the entities of one frame, as the platforms create them."""
+    entities: list[CoordinatorEntity] = [
+        MeuralEntity(meural, cloud, local, device),
+        MeuralBacklightLight(local, device),
+        MeuralLuxSensor(local, device, DEFAULT_LUX_THRESHOLD, DEFAULT_SENSOR_MIN_WRITE_INTERVAL),
+    ]
+    if all_entities:
+        entities += [
+            MeuralFreeSpaceSensor(local, device),
+            MeuralWifiSignalSensor(local, device, DEFAULT_WIFI_SIGNAL_THRESHOLD, DEFAULT_SENSOR_MIN_WRITE_INTERVAL),
+            MeuralLastSeenSensor(cloud, device),
+            MeuralLocalLatencySensor(local, device, DEFAULT_LATENCY_THRESHOLD, DEFAULT_SENSOR_MIN_WRITE_INTERVAL),
+        ]
+    return entities
+
+
+async def run(frames: int, minutes: int, all_entities: bool, seed: int) -> dict[str, int]:
+    """Poll a fleet of frames for the simulated period and count notifications and state writes."""
+    rng = random.Random(seed)
+    clock = SimulatedClock()
+    for module in CLOCK_MODULES:
+        module.time = clock
+    hass = HomeAssistant(tempfile.mkdtemp())
+    username = f"bench-writes-{frames}@example.com"
+    pymeural._RATE_LIMITERS[username] = pymeural.CloudRateLimiter(rate=1e6, burst=10**6)
+    try:
+        await restore_state.async_load(hass)
+        async with FakeMeuralServer(FakeMeuralConfig(frames=frames)) as server, aiohttp.ClientSession() as session:
+            meural = pymeural.PyMeural(
+                username, "password", "bench-token", lambda *_: None, session, base_url=server.cloud_url
+            )
+            cloud = CloudDataUpdateCoordinator(hass, meural, None)
+            cloud._last_gallery_fetch = clock.now
+            await cloud.async_refresh()
+            locals_ = {
+                device_id: LocalDataUpdateCoordinator(hass, device, session)
+                for device_id, device in cloud.data["devices"].items()
+            }
+            for local in (cloud, *locals_.values()):
+                # Polls are driven below on the simulated clock
+                local._schedule_refresh = lambda: None
+            await asyncio.gather(*(local.async_refresh() for local in locals_.values()))
+
+            writes = 0
+
+            def count_write() -> None:
+                nonlocal writes
+                writes += 1
+
+            local_listeners = cloud_listeners = 0
+            for device_id, local in locals_.items():
+                for index, entity in enumerate(
+                    _entities(meural, cloud, local, cloud.data["devices"][device_id], all_entities)
+                ):
+                    entity.hass = hass
+                    entity.platform = MagicMock()
+                    entity.entity_id = f"meural.bench_{device_id}_{index}"
+                    entity.async_write_ha_state = count_write
+                    await entity.async_added_to_hass()
+                    if isinstance(entity, MeuralEntity):
+                        local_listeners += 1
+                        cloud_listeners += 1
+                    elif entity.coordinator is cloud:
+                        cloud_listeners += 1
+                    else:
+                        local_listeners += 1
+            await hass.async_block_till_done()
+            writes = 0
+
+            notifications = 0
+            started = datetime(2026, 1, 1, tzinfo=timezone.utc)
+            for seconds in range(LOCAL_UPDATE_INTERVAL, minutes * 60 + 1, LOCAL_UPDATE_INTERVAL):
+                clock.now += LOCAL_UPDATE_INTERVAL
+                for device_id, state in server.frame_state.items():
+                    if seconds % server.devices[device_id]["imageDuration"] == 0:
+                        server._step(device_id, 1)
+                    if rng.random() < 0.05:
+                        state["backlight"] = max(0, min(100, state["backlight"] + rng.choice((-1, 1))))
+                refreshes = [local.async_refresh() for local in locals_.values()]
+                notifications += local_listeners // frames * frames
+                if seconds % CLOUD_UPDATE_INTERVAL == 0:
+                    last_seen = (started + timedelta(seconds=seconds)).isoformat()
+                    for device in server.devices.values():
+                        device["frameStatus"] = {"lastSeen": last_seen}
+                    refreshes.append(cloud.async_refresh())
+                    notifications += cloud_listeners
+                await asyncio.gather(*refreshes)
+                await hass.async_block_till_done()
+            return {"notifications": notifications, "writes": writes}
+    finally:
+        for module in CLOCK_MODULES:
+            module.time = time
+        pymeural._RATE_LIMITERS.pop(username, None)
+        await hass.async_stop(force=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=20)
+    parser.add_argument("--minutes", type=int, default=60)
+    parser.add_argument("--all-entities", action="store_true", help="include entities disabled by default")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    result = asyncio.run(run(args.frames, args.minutes, args.all_entities, args.seed))
+    print(f"Frames: {args.frames}, simulated minutes: {args.minutes}")
+    print(f"Entity notifications/minute:  {result['notifications'] / args.minutes:8.1f}")
+    print(f"State writes/minute:          {result['writes'] / args.minutes:8.1f}")
+    print(f"Reduction: {100 * (1 - result['writes'] / result['notifications']):.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,433 @@
+"""Offline stand-in for the Meural cloud API and the Canvas local API.
+
+Serves the ``v0`` cloud endpoints used by ``PyMeural`` and the ``/remote/``
+endpoints used by ``LocalMeural`` for any number of simulated frames, with
+configurable latency, payload sizes and failure injection. Every frame listens
+on its own port, so ``LocalMeural`` reaches it through a ``localIp`` of the form
+``127.0.0.1:<port>``.
+
+Start it standalone to point a development Home Assistant at it:
+
+    python -m benchmarks.fake_meural --frames 10 --latency 0.05
+
+or use ``FakeMeuralServer`` (in the current event loop) or
+``ThreadedFakeMeuralServer`` (in a thread with its own loop) from benchmarks.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import socket
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any
+
+from aiohttp import web
+
+CLOUD_PREFIX = "/v0/"
+
+
+@dataclass
+class FakeMeuralConfig:
+    """Shape and behaviour of the simulated account."""
+
+    frames: int = 1
+    galleries_per_frame: int = 5
+    user_galleries: int = 20
+    items_per_gallery: int = 20
+    # Filler added to every item and gallery description, in bytes
+    description_size: int = 200
+    # Response delay in seconds, plus up to `jitter` seconds of random delay
+    latency: float = 0.0
+    jitter: float = 0.0
+    # Fraction of requests answered with HTTP 503 (cloud) or 500 (local)
+    failure_rate: float = 0.0
+    # Fraction of requests that never answer, to exercise client timeouts
+    hang_rate: float = 0.0
+    seed: int = 0
+
+
+class FakeMeuralServer:
+    """Cloud and local Meural endpoints for a simulated account."""
+
+    def __init__(self, config: FakeMeuralConfig | None = None, host: str = "127.0.0.1") -> None:
+        """Initialize the simulated account data."""
+        self.config = config or FakeMeuralConfig()
+        self.host = host
+        self.requests: Counter[str] = Counter()
+        self._rng = random.Random(self.config.seed)
+        self._runner: web.AppRunner | None = None
+        self._cloud_port = 0
+        self._frame_ports: dict[int, int] = {}
+        self._sites: dict[int, web.SockSite] = {}
+        self._build_account()
+
+    # -- Simulated data -------------------------------------------------------
+
+    def _build_account(self) -> None:
+        config = self.config
+        filler = "x" * config.description_size
+        self.items: dict[int, dict[str, Any]] = {}
+        self.galleries: dict[int, dict[str, Any]] = {}
+        self.gallery_items: dict[int, list[int]] = {}
+
+        next_item_id = 100000
+
+        def add_gallery(gallery_id: int) -> None:
+            nonlocal next_item_id
+            item_ids = []
+            for index in range(config.items_per_gallery):
+                item_id = next_item_id
+                next_item_id += 1
+                self.items[item_id] = {
+                    "id": item_id,
+                    "name": f"Artwork {item_id}",
+                    "author": f"Artist {item_id % 97}",
+                    "artistName": f"Artist {item_id % 97}",
+                    "year": str(1800 + item_id % 200),
+                    "description": filler,
+                    "image": f"https://netstorage.meural.com/images/{item_id}.jpg",
+                    "updatedAt": "2026-01-01T00:00:00.000Z",
+                }
+                item_ids.append(item_id)
+            self.gallery_items[gallery_id] = item_ids
+            self.galleries[gallery_id] = {
+                "id": gallery_id,
+                "name": f"Playlist {gallery_id}",
+                "description": filler,
+                "cover": self.items[item_ids[0]]["image"] if item_ids else None,
+                "itemCount": len(item_ids),
+                "updatedAt": "2026-01-01T00:00:00.000Z",
+            }
+
+        for gallery_id in range(1, config.user_galleries + 1):
+            add_gallery(gallery_id)
+
+        # Personal fields of the account holder, which recordings must redact
+        self.user: dict[str, Any] = {
+            "id": 1,
+            "name": "Bench User",
+            "firstName": "Bench",
+            "lastName": "User",
+            "email": "bench@example.com",
+            "contactEmail": "bench+contact@example.com",
+        }
+        owner = {"id": 1, "name": self.user["name"], "email": self.user["email"]}
+
+        self.devices: dict[int, dict[str, Any]] = {}
+        self.device_galleries: dict[int, list[int]] = {}
+        self.frame_state: dict[int, dict[str, Any]] = {}
+        for frame in range(config.frames):
+            device_id = 5000 + frame
+            gallery_ids = []
+            for index in range(config.galleries_per_frame):
+                gallery_id = 10000 + frame * 1000 + index
+                add_gallery(gallery_id)
+                gallery_ids.append(gallery_id)
+            self.device_galleries[device_id] = gallery_ids
+            self.devices[device_id] = {
+                "id": device_id,
+                "alias": f"Canvas {frame}",
+                "name": f"Canvas {frame}",
+                "productKey": f"fake-{device_id}",
+                "serialNumber": f"SN{device_id}",
+                "frameModel": {"name": "Canvas II"},
+                "version": "2.5.0",
+                "localIp": None,
+                "status": "online",
+                "orientation": "horizontal",
+                "orientationMatch": False,
+                "imageDuration": 1800,
+                "imageShuffle": False,
+                "gestureFlip": False,
+                "frameStatus": {"lastSeen": "2026-01-01T00:00:00.000Z"},
+                "owner": owner,
+            }
+            first_gallery = gallery_ids[0] if gallery_ids else 0
+            self.frame_state[device_id] = {
+                "sleeping": False,
+                "backlight": 50,
+                "current_gallery": first_gallery,
+                "current_item": self.gallery_items.get(first_gallery, [0])[0],
+            }
+
+    # -- Server lifecycle -----------------------------------------------------
+
+    @property
+    def cloud_url(self) -> str:
+        """Return the base URL to pass to PyMeural."""
+        return f"http://{self.host}:{self._cloud_port}{CLOUD_PREFIX}"
+
+    async def start(self) -> None:
+        """Start listening on the cloud port and one port per frame."""
+        app = web.Application()
+        app.router.add_route("*", CLOUD_PREFIX + "{path:.*}", self._handle_cloud)
+        app.router.add_route("*", "/remote/{path:.*}", self._handle_local)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+
+        self._cloud_port = await self._add_site()
+        for device_id, device in self.devices.items():
+            port = await self._add_site()
+            self._frame_ports[port] = device_id
+            device["localIp"] = f"{self.host}:{port}"
+
+    async def _add_site(self) -> int:
+        """Listen on a free port and return it."""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((self.host, 0))
+        site = web.SockSite(self._runner, sock)
+        await site.start()
+        port = sock.getsockname()[1]
+        self._sites[port] = site
+        return port
+
+    async def move_frame(self, device_id: int) -> str:
+        """Move a frame to a new port, as after a DHCP change, and return its new localIp.
+
+        The old port stops listening; the cloud device record reports the new address.
+        """
+        device = self.devices[device_id]
+        old_port = int(device["localIp"].rpartition(":")[2])
+        port = await self._add_site()
+        self._frame_ports[port] = device_id
+        del self._frame_ports[old_port]
+        await self._sites.pop(old_port).stop()
+        device["localIp"] = f"{self.host}:{port}"
+        return device["localIp"]
+
+    async def stop(self) -> None:
+        """Stop all listeners."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> FakeMeuralServer:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.stop()
+
+    # -- Request handling -----------------------------------------------------
+
+    async def _simulate_network(self, kind: str) -> web.Response | None:
+        """Delay the response and return an injected failure, if any."""
+        config = self.config
+        delay = config.latency + (self._rng.uniform(0, config.jitter) if config.jitter else 0.0)
+        if delay:
+            await asyncio.sleep(delay)
+        if config.hang_rate and self._rng.random() < config.hang_rate:
+            await asyncio.sleep(3600)
+        if config.failure_rate and self._rng.random() < config.failure_rate:
+            self.requests[f"{kind}:failed"] += 1
+            return web.Response(status=503 if kind == "cloud" else 500, text="Injected failure")
+        return None
+
+    def _page(self, request: web.Request, records: list[dict[str, Any]]) -> web.Response:
+        """Return a page of records the way the cloud API paginates lists."""
+        count = int(request.query.get("count", 10))
+        page = int(request.query.get("page", 1))
+        start = (page - 1) * count
+        chunk = records[start:start + count]
+        return web.json_response(
+            {"data": chunk, "page": page, "count": count, "isLast": start + count >= len(records)}
+        )
+
+    async def _handle_cloud(self, request: web.Request) -> web.Response:
+        path = request.match_info["path"].strip("/")
+        parts = path.split("/")
+        self.requests[f"cloud:{request.method} {_template(parts)}"] += 1
+        if (failure := await self._simulate_network("cloud")) is not None:
+            return failure
+        if not request.headers.get("Authorization", "").startswith("Token "):
+            return web.Response(status=401)
+
+        method = request.method
+        if parts == ["user"]:
+            return web.json_response({"data": self.user})
+        if parts == ["user", "devices"]:
+            return self._page(request, list(self.devices.values()))
+        if parts == ["user", "galleries"]:
+            return self._page(request, [self.galleries[i] for i in range(1, self.config.user_galleries + 1)])
+        if parts == ["user", "items"]:
+            return self._page(request, list(self.items.values()))
+        if parts == ["user", "feedback"]:
+            return web.json_response({"data": {}})
+        if parts[0] == "items" and len(parts) == 2:
+            item = self.items.get(int(parts[1]))
+            if item is None:
+                return web.Response(status=404)
+            return web.json_response({"data": item})
+        if parts[0] == "galleries" and len(parts) == 3 and parts[2] == "items":
+            item_ids = self.gallery_items.get(int(parts[1]))
+            if item_ids is None:
+                return web.Response(status=404)
+            return self._page(request, [self.items[item_id] for item_id in item_ids])
+        if parts[0] == "devices" and len(parts) >= 2:
+            device = self.devices.get(int(parts[1]))
+            if device is None:
+                return web.Response(status=404)
+            if len(parts) == 2 and method == "GET":
+                return web.json_response({"data": device})
+            if len(parts) == 2 and method == "PUT":
+                device.update(await request.json())
+                return web.json_response({"data": device})
+            if parts[2:] == ["galleries"]:
+                return self._page(
+                    request, [self.galleries[gallery_id] for gallery_id in self.device_galleries[device.get("id")]]
+                )
+            if parts[2:] == ["sync"]:
+                return web.json_response({"data": {}})
+            if len(parts) == 4 and parts[2] == "galleries":
+                gallery_id = int(parts[3])
+                if gallery_id not in self.device_galleries[device["id"]]:
+                    self.device_galleries[device["id"]].append(gallery_id)
+                self._select(device["id"], gallery_id)
+                return web.json_response({"data": {}})
+            if len(parts) == 4 and parts[2] == "items":
+                self.frame_state[device["id"]]["current_item"] = int(parts[3])
+                return web.json_response({"data": {}})
+        return web.Response(status=404)
+
+    def _select(self, device_id: int, gallery_id: int) -> None:
+        state = self.frame_state[device_id]
+        state["current_gallery"] = gallery_id
+        state["current_item"] = self.gallery_items.get(gallery_id, [0])[0]
+
+    def _step(self, device_id: int, offset: int) -> None:
+        state = self.frame_state[device_id]
+        item_ids = self.gallery_items.get(state["current_gallery"]) or [state["current_item"]]
+        try:
+            index = item_ids.index(state["current_item"])
+        except ValueError:
+            index = 0
+        state["current_item"] = item_ids[(index + offset) % len(item_ids)]
+
+    async def _handle_local(self, request: web.Request) -> web.Response:
+        port = request.transport.get_extra_info("sockname")[1]
+        device_id = self._frame_ports.get(port)
+        if device_id is None:
+            # A kept-alive connection to the old port of a moved frame
+            request.transport.close()
+            return web.Response(status=404)
+        path = request.match_info["path"].strip("/")
+        parts = path.split("/")
+        self.requests[f"local:{_template(parts)}"] += 1
+        if (failure := await self._simulate_network("local")) is not None:
+            return failure
+
+        state = self.frame_state[device_id]
+        response: Any = None
+        if parts == ["control_check", "sleep"]:
+            response = state["sleeping"]
+        elif parts == ["control_check", "system"]:
+            response = {
+                "gsensor": "landscape",
+                "lux": 20 + self._rng.randint(-2, 2),
+                "backlight": state["backlight"],
+                "free_space": 1024,
+                "wifi_status": {"signal": -55 - self._rng.randint(0, 3)},
+                "version": self.devices[device_id]["version"],
+            }
+        elif parts == ["get_backlight"]:
+            response = state["backlight"]
+        elif parts == ["get_galleries_json"]:
+            response = [
+                {"id": str(gallery_id), "name": self.galleries[gallery_id]["name"]}
+                for gallery_id in self.device_galleries[device_id]
+            ]
+        elif parts == ["get_gallery_status_json"]:
+            gallery = self.galleries.get(state["current_gallery"], {})
+            response = {
+                "current_gallery": str(state["current_gallery"]),
+                "current_gallery_name": gallery.get("name"),
+                "current_item": str(state["current_item"]),
+            }
+        elif parts[0] == "get_frame_items_by_gallery_json" and len(parts) == 2:
+            response = [
+                {"id": str(item_id), "title": self.items[item_id]["name"]}
+                for item_id in self.gallery_items.get(int(parts[1]), [])
+            ]
+        elif parts[:2] == ["control_command", "suspend"]:
+            state["sleeping"] = True
+        elif parts[:2] == ["control_command", "resume"]:
+            state["sleeping"] = False
+        elif parts[:3] == ["control_command", "set_key", "right"]:
+            self._step(device_id, 1)
+        elif parts[:3] == ["control_command", "set_key", "left"]:
+            self._step(device_id, -1)
+        elif parts[:2] == ["control_command", "set_backlight"]:
+            state["backlight"] = int(parts[2])
+        elif parts[:2] == ["control_command", "change_gallery"]:
+            self._select(device_id, int(parts[2]))
+        elif parts[:2] == ["control_command", "change_item"]:
+            state["current_item"] = int(parts[2])
+        elif parts[0] in ("control_command", "identify", "get_wifi_connections_json", "postcard"):
+            response = {}
+        else:
+            return web.Response(status=404)
+        return web.json_response({"status": "pass", "response": response})
+
+
+def _template(parts: list[str]) -> str:
+    return "/".join("{id}" if part.isdigit() else part for part in parts)
+
+
+class ThreadedFakeMeuralServer:
+    """Run a FakeMeuralServer in a thread with its own event loop.
+
+    Keeps the server's own work out of the event loop being measured.
+    """
+
+    def __init__(self, config: FakeMeuralConfig | None = None) -> None:
+        """Initialize the server; call start() to begin serving."""
+        self.server = FakeMeuralServer(config)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="fake_meural", daemon=True)
+
+    def start(self) -> FakeMeuralServer:
+        """Start serving and return the server once it listens."""
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self.server.start(), self._loop).result()
+        return self.server
+
+    def stop(self) -> None:
+        """Stop serving and end the thread."""
+        asyncio.run_coroutine_threadsafe(self.server.stop(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+
+async def _serve(config: FakeMeuralConfig) -> None:
+    async with FakeMeuralServer(config) as server:
+        print(f"Cloud API: {server.cloud_url}")
+        for device in server.devices.values():
+            print(f"{device['alias']}: http://{device['localIp']}/remote/")
+        await asyncio.Event().wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=1)
+    parser.add_argument("--galleries-per-frame", type=int, default=5)
+    parser.add_argument("--user-galleries", type=int, default=20)
+    parser.add_argument("--items-per-gallery", type=int, default=20)
+    parser.add_argument("--description-size", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--hang-rate", type=float, default=0.0)
+    args = parser.parse_args()
+    try:
+        asyncio.run(_serve(FakeMeuralConfig(**{key: value for key, value in vars(args).items()})))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""Replay recorded Meural API traffic to the coordinators and media browser.
+
+Fixtures are written by the ``meural.record_traffic`` service. ``ReplaySession``
+stands in for the aiohttp session of ``PyMeural`` and ``LocalMeural`` and
+answers every request with the recorded response for the same host, method,
+path and parameters, in recorded order, repeating the last one once a
+sequence is used up. Responses are served instantly, or with their recorded
+durations with ``timing="recorded"``.
+
+Run from the repository root in a Home Assistant development environment:
+
+    python -m benchmarks.traffic_replay meural_traffic_20260101_120000.json --polls 30 --profile
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import cProfile
+import json
+import pstats
+import tempfile
+import time
+from collections import defaultdict, deque
+from typing import Any
+from unittest.mock import MagicMock
+from urllib.parse import urlsplit
+
+from aiohttp import ClientResponseError, RequestInfo
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.meural import pymeural
+from custom_components.meural.coordinator import CloudDataUpdateCoordinator, LocalDataUpdateCoordinator
+from custom_components.meural.media_player import MeuralEntity
+
+CLOUD_URL = "https://cloud.invalid/v0/"
+USERNAME = "replay@example.com"
+
+
+def _key(host: str, method: str, path: str, params: dict[str, Any] | None) -> tuple[str, str, str, str]:
+    return host, method.lower(), path.strip("/"), json.dumps(params or {}, sort_keys=True)
+
+
+class ReplayResponse:
+    """Recorded response with the parts of aiohttp.ClientResponse the clients use."""
+
+    def __init__(self, entry: dict[str, Any]) -> None:
+        self.status = entry["status"]
+        self._body = json.dumps(entry["response"]).encode() if entry["response"] is not None else b""
+
+    async def read(self) -> bytes:
+        return self._body
+
+    async def text(self) -> str:
+        return self._body.decode()
+
+
+class ReplaySession:
+    """Serve recorded responses in place of an aiohttp.ClientSession."""
+
+    def __init__(self, fixture: dict[str, Any], timing: str = "instant") -> None:
+        self.timing = timing
+        self.misses: list[tuple[str, str, str, str]] = []
+        self._responses: dict[tuple[str, str, str, str], deque[dict[str, Any]]] = defaultdict(deque)
+        for entry in fixture["entries"]:
+            key = _key(entry["host"], entry["method"], entry["path"], entry["params"])
+            self._responses[key].append(entry)
+
+    @classmethod
+    def from_file(cls, path: str, timing: str = "instant") -> ReplaySession:
+        with open(path, encoding="utf-8") as fixture:
+            return cls(json.load(fixture), timing)
+
+    def _lookup(self, method: str, url: str, params: dict[str, Any] | None) -> dict[str, Any] | None:
+        parts = urlsplit(url)
+        if url.startswith(CLOUD_URL):
+            host, path = "cloud", url[len(CLOUD_URL):]
+        else:
+            host, path = parts.hostname or "", parts.path.removeprefix("/remote/")
+        key = _key(host, method, path, params)
+        queue = self._responses.get(key)
+        if not queue:
+            self.misses.append(key)
+            return None
+        # Keep the last response of a sequence for all later requests
+        return queue.popleft() if len(queue) > 1 else queue[0]
+
+    async def request(self, method: str, url: str, *, raise_for_status: bool = False, **kwargs: Any) -> ReplayResponse:
+        entry = self._lookup(method, url, kwargs.get("params") or kwargs.get("json") or kwargs.get("data"))
+        if entry is None:
+            entry = {"status": 404, "response": None, "duration": 0.0}
+        if self.timing == "recorded" and entry["duration"]:
+            await asyncio.sleep(entry["duration"])
+        if raise_for_status and entry["status"] >= 400:
+            raise ClientResponseError(
+                RequestInfo(URL(url), method.upper(), CIMultiDictProxy(CIMultiDict())),
+                (),
+                status=entry["status"],
+                message="Replayed error",
+            )
+        return ReplayResponse(entry)
+
+    async def get(self, url: str, **kwargs: Any) -> ReplayResponse:
+        return await self.request("get", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> ReplayResponse:
+        return await self.request("post", url, **kwargs)
+
+
+async def replay(path: str, polls: int, timing: str, browse: int) -> dict[str, Any]:
+    """Replay a fixture through setup, polls and media browsing."""
+    session = ReplaySession.from_file(path, timing)
+    hass = HomeAssistant(tempfile.mkdtemp())
+    # Replay at full speed; pacing by the rate limiter is measured by bench_coordinators.
+    pymeural._RATE_LIMITERS[USERNAME] = pymeural.CloudRateLimiter(rate=1e9, burst=10**9)
+    meural = pymeural.PyMeural(USERNAME, "password", "replay-token", lambda *_: None, session, base_url=CLOUD_URL)
+    cloud = CloudDataUpdateCoordinator(hass, meural, None)
+    cloud._last_gallery_fetch = time.monotonic()
+
+    started = time.perf_counter()
+    await cloud.async_refresh()
+    if not cloud.last_update_success:
+        raise RuntimeError(f"Cloud refresh failed: {cloud.last_exception}")
+    locals_ = {
+        device_id: LocalDataUpdateCoordinator(hass, device, session)
+        for device_id, device in cloud.data["devices"].items()
+    }
+    for device_id, local in locals_.items():
+        cloud.register_local_coordinator(device_id, local)
+        local.cloud_coordinator = cloud
+    await asyncio.gather(*(local.async_refresh() for local in locals_.values()))
+    await cloud.async_refresh_galleries()
+    setup_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for _ in range(polls):
+        await asyncio.gather(*(local.async_refresh() for local in locals_.values()), cloud.async_refresh())
+    poll_time = time.perf_counter() - started
+
+    browse_time = 0.0
+    if browse and locals_:
+        device_id, local = next(iter(locals_.items()))
+        entity = MeuralEntity(meural, cloud, local, cloud.data["devices"][device_id])
+        entity.hass = hass
+        entity.platform = MagicMock()
+        started = time.perf_counter()
+        for _ in range(browse):
+            await entity.async_browse_media("meuralplaylists", "")
+        browse_time = time.perf_counter() - started
+
+    return {
+        "frames": len(locals_),
+        "setup_s": setup_time,
+        "poll_round_ms": 1000 * poll_time / max(1, polls),
+        "browse_ms": 1000 * browse_time / max(1, browse),
+        "misses": len(session.misses),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("fixture")
+    parser.add_argument("--polls", type=int, default=30)
+    parser.add_argument("--browse", type=int, default=10, help="media browser openings to time")
+    parser.add_argument("--timing", choices=("instant", "recorded"), default="instant")
+    parser.add_argument("--profile", action="store_true", help="print the hottest functions")
+    args = parser.parse_args()
+
+    profiler = cProfile.Profile() if args.profile else None
+    if profiler:
+        profiler.enable()
+    result = asyncio.run(replay(args.fixture, args.polls, args.timing, args.browse))
+    if profiler:
+        profiler.disable()
+
+    print(f"Frames: {result['frames']}, unmatched requests: {result['misses']}")
+    print(f"  Setup:               {result['setup_s']:8.3f} s")
+    print(f"  Poll round:          {result['poll_round_ms']:8.2f} ms")
+    print(f"  Browse playlists:    {result['browse_ms']:8.2f} ms")
+    if profiler:
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(25)
+
+
+if __name__ == "__main__":
+    main()
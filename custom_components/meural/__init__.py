@@ -3,14 +3,46 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import shutil
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.storage import Store
 
-from .const import DOMAIN
+from .const import (
+    CONF_IMAGE_CACHE,
+    CONF_IMAGE_CACHE_SIZE,
+    CONF_LOCAL_FIRST,
+    CONF_LOCAL_HOSTS,
+    CONF_SENSOR_SMOOTHING,
+    CONF_SLOW_CALL_THRESHOLD,
+    CONF_WATCHDOG,
+    DEFAULT_IMAGE_CACHE,
+    DEFAULT_IMAGE_CACHE_SIZE,
+    DEFAULT_LOCAL_FIRST,
+    DEFAULT_LOCAL_HOSTS,
+    DEFAULT_SENSOR_SMOOTHING,
+    DEFAULT_SLOW_CALL_THRESHOLD,
+    DEFAULT_WATCHDOG,
+    DEVICE_STORE_SAVE_DELAY,
+    DEVICE_STORE_VERSION,
+    DOMAIN,
+    TOKEN_SAVE_DELAY,
+)
 from . import pymeural
-from .coordinator import CloudDataUpdateCoordinator, LocalDataUpdateCoordinator
+from .coordinator import (
+    CloudDataUpdateCoordinator,
+    LocalDataUpdateCoordinator,
+    configured_host,
+    parse_local_hosts,
+)
+from .image_cache import ImageCache
+from .services import async_setup_services
+from .watchdog import Watchdog
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -20,22 +52,74 @@ PLATFORMS = ["media_player", "sensor", "light"]
 async def async_setup(hass: HomeAssistant, config: dict):
     """Set up the Meural component."""
     hass.data.setdefault(DOMAIN, {})
+    async_setup_services(hass)
     return True
 
 
+def _image_cache_directory(hass: HomeAssistant, entry: ConfigEntry) -> str:
+    """Return the directory of the image cache of a config entry."""
+    return hass.config.path(".cache", DOMAIN, entry.entry_id)
+
+
+def _device_store(hass: HomeAssistant, entry: ConfigEntry) -> Store[dict[str, Any]]:
+    """Return the store of the devices saved after the last cloud sync of a config entry."""
+    return Store(hass, DEVICE_STORE_VERSION, f"{DOMAIN}.{entry.entry_id}.devices")
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Meural from a config entry."""
     if "email" not in entry.data:
         _LOGGER.warning("Authentication changed. Please set up Meural again")
         return False
 
+    # Tokens waiting to be written to the config entry. Every write rewrites
+    # core.config_entries on disk, so a refreshed access token alone is only
+    # saved on shutdown or unload: it expires within the hour and can always be
+    # recovered from the stored refresh token. A new refresh token is saved
+    # after a short debounce, since it is required to recover after a restart.
+    pending_tokens: dict[str, str] = {}
+
+    @callback
+    def async_save_tokens(*_: Any) -> None:
+        """Write pending tokens to the config entry."""
+        if not pending_tokens:
+            return
+        data = {**entry.data, **pending_tokens}
+        pending_tokens.clear()
+        if data != entry.data:
+            _LOGGER.debug("Saving tokens to config entry.")
+            hass.config_entries.async_update_entry(entry, data=data)
+
+    token_save_debouncer = Debouncer(
+        hass,
+        _LOGGER,
+        cooldown=TOKEN_SAVE_DELAY,
+        immediate=False,
+        function=async_save_tokens,
+    )
+
     def token_update_callback(token: str, refresh_token: str) -> None:
-        """Update both access token and refresh token in config entry."""
-        _LOGGER.debug("Tokens updated. Saving to config entry.")
-        hass.config_entries.async_update_entry(
-            entry,
-            data={**entry.data, "token": token, "refresh_token": refresh_token}
-        )
+        """Queue updated access and refresh tokens for saving to the config entry."""
+        pending_tokens.update(token=token, refresh_token=refresh_token)
+        if refresh_token != entry.data.get("refresh_token"):
+            _LOGGER.debug("Refresh token updated. Scheduling save to config entry.")
+            token_save_debouncer.async_schedule_call()
+        else:
+            _LOGGER.debug("Access token updated. Deferring save to config entry.")
+
+    @callback
+    def async_flush_tokens(*_: Any) -> None:
+        """Save pending tokens immediately."""
+        token_save_debouncer.async_cancel()
+        async_save_tokens()
+
+    # Tokens are flushed on unload and at shutdown. A regular listener is used
+    # because a once-listener removes itself when it fires, and removing it
+    # again on unload would log an error.
+    entry.async_on_unload(async_flush_tokens)
+    entry.async_on_unload(
+        hass.bus.async_listen(EVENT_HOMEASSISTANT_STOP, async_flush_tokens)
+    )
 
     # Create PyMeural instance with token refresh callback
     meural = pymeural.PyMeural(
@@ -47,25 +131,74 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         refresh_token=entry.data.get("refresh_token"),
     )
 
+    # Optional watchdog timing coordinator updates, entity handlers and loop lag
+    watchdog = None
+    if entry.options.get(CONF_WATCHDOG, DEFAULT_WATCHDOG):
+        watchdog = Watchdog(
+            hass, entry.options.get(CONF_SLOW_CALL_THRESHOLD, DEFAULT_SLOW_CALL_THRESHOLD) / 1000
+        )
+        entry.async_create_background_task(hass, watchdog.async_monitor_loop_lag(), "meural_loop_lag")
+
+    # Optional on-disk cache serving artwork through Home Assistant
+    image_cache = None
+    if entry.options.get(CONF_IMAGE_CACHE, DEFAULT_IMAGE_CACHE):
+        image_cache = ImageCache(
+            hass,
+            _image_cache_directory(hass, entry),
+            entry.options.get(CONF_IMAGE_CACHE_SIZE, DEFAULT_IMAGE_CACHE_SIZE) * 1024 * 1024,
+        )
+        entry.async_create_background_task(hass, image_cache.async_evict(), "meural_image_cache_evict")
+
     # Create and initialize CloudDataUpdateCoordinator
     cloud_coordinator = CloudDataUpdateCoordinator(hass, meural, entry)
+    cloud_coordinator.watchdog = watchdog
+
+    # In local-first mode, setup starts from the device records saved after the
+    # last cloud sync and the cloud refresh runs in the background, so startup
+    # does not depend on the cloud. Otherwise the cloud device list is
+    # required before entities can be created.
+    local_first = entry.options.get(CONF_LOCAL_FIRST, DEFAULT_LOCAL_FIRST)
+    cloud_coordinator.local_first = local_first
+    device_store = _device_store(hass, entry)
+    stored_devices = (await device_store.async_load() or {}).get("devices") if local_first else None
+    if stored_devices:
+        _LOGGER.debug("Starting from %d saved Meural devices", len(stored_devices))
+        cloud_coordinator.data = {"devices": stored_devices, "device_galleries": {}, "user_galleries": []}
+        entry.async_create_background_task(
+            hass, cloud_coordinator.async_refresh(), "meural_cloud_refresh"
+        )
+    else:
+        await cloud_coordinator.async_config_entry_first_refresh()
 
-    # Perform first refresh
-    await cloud_coordinator.async_config_entry_first_refresh()
+    if local_first:
 
-    # Populate gallery data synchronously so it is available immediately
-    await cloud_coordinator.async_refresh_galleries()
+        @callback
+        def async_save_devices() -> None:
+            """Save device records after a successful cloud update."""
+            if cloud_coordinator.last_update_success and cloud_coordinator.data:
+                device_store.async_delay_save(
+                    lambda: {"devices": cloud_coordinator.data["devices"]}, DEVICE_STORE_SAVE_DELAY
+                )
 
-    # Create and initialize a LocalDataUpdateCoordinator for each device
+        entry.async_on_unload(cloud_coordinator.async_add_listener(async_save_devices))
+        if not stored_devices:
+            async_save_devices()
+
+    # Create a LocalDataUpdateCoordinator for each device. Their first refresh,
+    # like the gallery refresh, runs in the background so slow frames do not
+    # block setup; entities report their restored state until data arrives.
     devices = list(cloud_coordinator.data["devices"].values())
+    local_hosts = parse_local_hosts(entry.options.get(CONF_LOCAL_HOSTS, DEFAULT_LOCAL_HOSTS))
     local_coordinators = {}
     for device in devices:
         local_coordinator = LocalDataUpdateCoordinator(
             hass,
             device,
             async_get_clientsession(hass),
+            entry.options.get(CONF_SENSOR_SMOOTHING, DEFAULT_SENSOR_SMOOTHING),
+            configured_host(device, local_hosts),
         )
-        await local_coordinator.async_config_entry_first_refresh()
+        local_coordinator.watchdog = watchdog
         local_coordinators[str(device["id"])] = local_coordinator
 
     # Register local coordinators with the cloud coordinator so it can
@@ -80,14 +213,35 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         "meural": meural,
         "cloud_coordinator": cloud_coordinator,
         "local_coordinators": local_coordinators,
+        "watchdog": watchdog,
+        "image_cache": image_cache,
+        "options": dict(entry.options),
     }
 
+    entry.async_create_background_task(
+        hass, cloud_coordinator.async_refresh_galleries(), "meural_gallery_refresh"
+    )
+    for device_id, local_coordinator in local_coordinators.items():
+        entry.async_create_background_task(
+            hass, local_coordinator.async_refresh(), f"meural_local_refresh_{device_id}"
+        )
+
     # Forward to platform setup
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
+
     return True
 
 
+async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the config entry when its options change."""
+    # Update listeners also fire when tokens are saved to the entry data; only
+    # an actual options change needs a reload.
+    if entry.options != hass.data[DOMAIN][entry.entry_id]["options"]:
+        await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     """Unload a config entry."""
     unload_ok = all(
@@ -105,3 +259,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
             cloud_coordinator.unregister_local_coordinator(device_id)
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the saved devices and the image cache of a removed config entry."""
+    await _device_store(hass, entry).async_remove()
+    await hass.async_add_executor_job(shutil.rmtree, _image_cache_directory(hass, entry), True)
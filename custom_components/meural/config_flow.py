@@ -9,11 +9,33 @@ import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .const import DOMAIN  # pylint:disable=unused-import
+from .const import (  # pylint:disable=unused-import
+    CONF_IMAGE_CACHE,
+    CONF_IMAGE_CACHE_SIZE,
+    CONF_LOCAL_FIRST,
+    CONF_LOCAL_HOSTS,
+    CONF_LUX_THRESHOLD,
+    CONF_SENSOR_MIN_WRITE_INTERVAL,
+    CONF_SENSOR_SMOOTHING,
+    CONF_SLOW_CALL_THRESHOLD,
+    CONF_WATCHDOG,
+    CONF_WIFI_SIGNAL_THRESHOLD,
+    DEFAULT_IMAGE_CACHE,
+    DEFAULT_IMAGE_CACHE_SIZE,
+    DEFAULT_LOCAL_FIRST,
+    DEFAULT_LOCAL_HOSTS,
+    DEFAULT_LUX_THRESHOLD,
+    DEFAULT_SENSOR_MIN_WRITE_INTERVAL,
+    DEFAULT_SENSOR_SMOOTHING,
+    DEFAULT_SLOW_CALL_THRESHOLD,
+    DEFAULT_WATCHDOG,
+    DEFAULT_WIFI_SIGNAL_THRESHOLD,
+    DOMAIN,
+)
 from . import pymeural
 
 _LOGGER = logging.getLogger(__name__)
@@ -38,6 +60,12 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     _reauth_entry: ConfigEntry | None = None
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlowHandler:
+        """Return the options flow for this handler."""
+        return OptionsFlowHandler()
+
     async def async_step_user(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         """Handle the initial step."""
         errors: dict[str, str] = {}
@@ -122,3 +150,61 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             description_placeholders={"email": email},
             errors=errors,
         )
+
+
+class OptionsFlowHandler(config_entries.OptionsFlow):
+    """Handle Meural options."""
+
+    async def async_step_init(self, user_input: dict[str, Any] | None = None) -> FlowResult:
+        """Manage sensor write thresholds, smoothing, the slow call watchdog, local-first mode and the image cache."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        options = self.config_entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_LUX_THRESHOLD,
+                        default=options.get(CONF_LUX_THRESHOLD, DEFAULT_LUX_THRESHOLD),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                    vol.Optional(
+                        CONF_WIFI_SIGNAL_THRESHOLD,
+                        default=options.get(CONF_WIFI_SIGNAL_THRESHOLD, DEFAULT_WIFI_SIGNAL_THRESHOLD),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                    vol.Optional(
+                        CONF_SENSOR_MIN_WRITE_INTERVAL,
+                        default=options.get(CONF_SENSOR_MIN_WRITE_INTERVAL, DEFAULT_SENSOR_MIN_WRITE_INTERVAL),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=3600)),
+                    vol.Optional(
+                        CONF_SENSOR_SMOOTHING,
+                        default=options.get(CONF_SENSOR_SMOOTHING, DEFAULT_SENSOR_SMOOTHING),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0.05, max=1.0)),
+                    vol.Optional(
+                        CONF_WATCHDOG,
+                        default=options.get(CONF_WATCHDOG, DEFAULT_WATCHDOG),
+                    ): bool,
+                    vol.Optional(
+                        CONF_SLOW_CALL_THRESHOLD,
+                        default=options.get(CONF_SLOW_CALL_THRESHOLD, DEFAULT_SLOW_CALL_THRESHOLD),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=10000)),
+                    vol.Optional(
+                        CONF_LOCAL_FIRST,
+                        default=options.get(CONF_LOCAL_FIRST, DEFAULT_LOCAL_FIRST),
+                    ): bool,
+                    vol.Optional(
+                        CONF_LOCAL_HOSTS,
+                        default=options.get(CONF_LOCAL_HOSTS, DEFAULT_LOCAL_HOSTS),
+                    ): str,
+                    vol.Optional(
+                        CONF_IMAGE_CACHE,
+                        default=options.get(CONF_IMAGE_CACHE, DEFAULT_IMAGE_CACHE),
+                    ): bool,
+                    vol.Optional(
+                        CONF_IMAGE_CACHE_SIZE,
+                        default=options.get(CONF_IMAGE_CACHE_SIZE, DEFAULT_IMAGE_CACHE_SIZE),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=10, max=10000)),
+                }
+            ),
+        )
@@ -6,7 +6,100 @@ DOMAIN = "meural"
 CLOUD_UPDATE_INTERVAL = 60
 CLOUD_UPDATE_INTERVAL_SLEEPING = 3600
 GALLERY_UPDATE_INTERVAL = 1800
+# Gallery refreshes only replace galleries and items whose updatedAt changed;
+# everything is resynced at least once per interval
+FULL_SYNC_INTERVAL = 86400
 LOCAL_UPDATE_INTERVAL = 10
+# System information refresh when no enabled entity needs live sensor values
+SYSTEM_INFO_SLOW_INTERVAL = 600
+
+# After this many consecutive failed local polls, the local IP of a Canvas is
+# looked up again in the cloud, at most once per interval (in seconds)
+LOCAL_REDISCOVERY_FAILURES = 3
+LOCAL_REDISCOVERY_INTERVAL = 300
+
+# Delay (in seconds) before a new refresh token is saved to the config entry, so
+# back-to-back token updates result in a single write
+TOKEN_SAVE_DELAY = 10
+
+# Device records saved for local-first setup, written at most once per delay (in seconds)
+DEVICE_STORE_VERSION = 1
+DEVICE_STORE_SAVE_DELAY = 60
+
+# Media browser: playlist items per page, cloud item metadata kept in memory,
+# concurrent item metadata requests, and how long (in seconds) opening a page
+# waits for thumbnails before showing the items without them
+BROWSE_PAGE_SIZE = 50
+ITEM_CACHE_SIZE = 2000
+ITEM_PREFETCH_CONCURRENCY = 4
+BROWSE_PREFETCH_TIMEOUT = 2
+
+# Library search: records indexed between event loop yields, and the default
+# and maximum number of search results
+LIBRARY_INDEX_CHUNK = 500
+DEFAULT_SEARCH_LIMIT = 20
+MAX_SEARCH_LIMIT = 100
+
+# How long (in seconds) an item shown optimistically after next/previous is kept
+# while the Canvas still reports the previous item
+OPTIMISTIC_ITEM_GRACE = 15
+
+# Image cache: artwork is served through Home Assistant scaled to fit these sizes
+# (in pixels), files unused for the max age (in seconds) are removed, the cache is
+# trimmed at most once per eviction interval (in seconds), and a file's last use is
+# recorded at most once per touch interval (in seconds)
+MEDIA_IMAGE_SIZE = 1024
+BROWSE_THUMBNAIL_SIZE = 320
+IMAGE_CACHE_MAX_AGE = 30 * 86400
+IMAGE_CACHE_EVICT_INTERVAL = 60
+IMAGE_CACHE_TOUCH_INTERVAL = 3600
+IMAGE_DOWNLOAD_TIMEOUT = 30
 
 # SD card folder max ID
 SD_CARD_FOLDER_MAX_ID = 4
+
+# Options
+CONF_LUX_THRESHOLD = "lux_threshold"
+CONF_WIFI_SIGNAL_THRESHOLD = "wifi_signal_threshold"
+CONF_SENSOR_MIN_WRITE_INTERVAL = "sensor_min_write_interval"
+CONF_SENSOR_SMOOTHING = "sensor_smoothing"
+CONF_WATCHDOG = "watchdog"
+CONF_SLOW_CALL_THRESHOLD = "slow_call_threshold"
+CONF_LOCAL_FIRST = "local_first"
+CONF_LOCAL_HOSTS = "local_hosts"
+CONF_IMAGE_CACHE = "image_cache"
+CONF_IMAGE_CACHE_SIZE = "image_cache_size"
+
+# Sensors only write state when the value moved by at least the threshold, and
+# at most once per minimum write interval (in seconds). Smoothing is the weight
+# of each new reading in an exponential moving average; 1.0 disables smoothing.
+DEFAULT_LUX_THRESHOLD = 2.0
+DEFAULT_WIFI_SIGNAL_THRESHOLD = 3.0
+DEFAULT_SENSOR_MIN_WRITE_INTERVAL = 60
+DEFAULT_SENSOR_SMOOTHING = 1.0
+# The watchdog reports handlers and event loop lag above the threshold (in milliseconds)
+DEFAULT_WATCHDOG = False
+DEFAULT_SLOW_CALL_THRESHOLD = 100
+# In local-first mode setup starts from the device records saved after the last
+# cloud sync; local hosts override the local IP of a Canvas by alias or serial number
+DEFAULT_LOCAL_FIRST = False
+DEFAULT_LOCAL_HOSTS = ""
+# The image cache serves artwork from disk, limited to this size (in megabytes)
+DEFAULT_IMAGE_CACHE = False
+DEFAULT_IMAGE_CACHE_SIZE = 200
+# Local API Latency sensor change threshold (in milliseconds)
+DEFAULT_LATENCY_THRESHOLD = 20.0
+
+# Traffic recording service
+SERVICE_RECORD_TRAFFIC = "record_traffic"
+DEFAULT_RECORD_DURATION = 300
+MAX_RECORD_DURATION = 3600
+
+# Profiling service
+SERVICE_PROFILE = "profile"
+DEFAULT_PROFILE_DURATION = 30
+MAX_PROFILE_DURATION = 600
+DEFAULT_PROFILE_TOP = 15
+
+# Library search service
+SERVICE_SEARCH = "search"
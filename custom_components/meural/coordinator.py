@@ -4,30 +4,107 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
+from collections import Counter, OrderedDict
+from collections.abc import Iterable
 from datetime import timedelta
 from typing import Any
 
 import aiohttp
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
 from .const import (
+    BROWSE_PAGE_SIZE,
     CLOUD_UPDATE_INTERVAL,
     CLOUD_UPDATE_INTERVAL_SLEEPING,
+    DEFAULT_SENSOR_SMOOTHING,
+    FULL_SYNC_INTERVAL,
     GALLERY_UPDATE_INTERVAL,
+    ITEM_CACHE_SIZE,
+    ITEM_PREFETCH_CONCURRENCY,
+    LIBRARY_INDEX_CHUNK,
+    LOCAL_REDISCOVERY_FAILURES,
+    LOCAL_REDISCOVERY_INTERVAL,
     LOCAL_UPDATE_INTERVAL,
+    SYSTEM_INFO_SLOW_INTERVAL,
 )
-from .pymeural import CannotConnect, DeviceTurnedOff, InvalidAuth, LocalMeural, PyMeural
+from .library import KIND_GALLERY, KIND_ITEM, LibraryIndex
+from .records import Gallery, Item, compact_device
+from .pymeural import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_POLL,
+    CannotConnect,
+    DeviceTurnedOff,
+    InvalidAuth,
+    LocalMeural,
+    PyMeural,
+)
+from .stats import CacheStats, UpdateStats
+from .watchdog import Watchdog, watched
 
 _LOGGER = logging.getLogger(__name__)
 
+# Local data fields smoothed with an exponential moving average when enabled
+SMOOTHED_FIELDS = ("lux", "wifi_signal")
+
+# Local data fields filled from the system information endpoint. Fast fields are
+# fetched on every poll while an enabled entity renders them, and the backlight
+# on every poll while the Canvas is awake; otherwise system information is only
+# refreshed every SYSTEM_INFO_SLOW_INTERVAL seconds.
+SYSTEM_FIELDS = ("gsensor", "lux", "backlight", "free_space", "wifi_signal", "version")
+FAST_SYSTEM_FIELDS = ("lux", "wifi_signal")
+
+
+def diff_fields(old: dict[str, Any] | None, new: dict[str, Any]) -> set[str] | None:
+    """Return the top-level keys whose values differ, or None if there is no previous data."""
+    if old is None:
+        return None
+    return {key for key in old.keys() | new.keys() if old.get(key) != new.get(key)}
+
+
+def unchanged_record(old: Gallery | Item | None, new: Gallery | Item) -> bool:
+    """Return True if a gallery or item did not change since old was fetched.
+
+    Compares the updatedAt timestamps, or the whole records if there are none.
+    """
+    if old is None:
+        return False
+    if new.updated_at is not None:
+        return old.updated_at == new.updated_at
+    return old == new
+
+
+def parse_local_hosts(value: str) -> dict[str, str]:
+    """Parse comma-separated alias=IP pairs into a dict keyed by lowercase alias."""
+    hosts = {}
+    for pair in value.split(","):
+        name, sep, host = pair.partition("=")
+        if sep and name.strip() and host.strip():
+            hosts[name.strip().lower()] = host.strip()
+    return hosts
+
+
+def configured_host(device: dict[str, Any], hosts: dict[str, str]) -> str | None:
+    """Return the configured local host of a device by alias or serial number, if any."""
+    for key in (device.get("alias"), device.get("serialNumber")):
+        if key and (host := hosts.get(str(key).lower())):
+            return host
+    return None
+
 
 class CloudDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Class to manage fetching Meural cloud API data."""
 
+    # Slow call watchdog, set by setup when enabled in the options
+    watchdog: Watchdog | None = None
+    # Set by setup in local-first mode, where local controls stay available
+    # while the cloud is unreachable
+    local_first: bool = False
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -41,6 +118,29 @@ class CloudDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._local_coordinators: dict[str, Any] = {}
         self._last_gallery_fetch: float = 0.0
         self._gallery_refresh_in_progress: bool = False
+        # Changed fields per device ID in the last update, or None when every
+        # listener should treat all data as changed (first refresh, failures).
+        self.changed_devices: dict[str, set[str]] | None = None
+        self._device_listeners: dict[str, list[CALLBACK_TYPE]] = {}
+        self._remove_device_dispatcher: CALLBACK_TYPE | None = None
+        self.update_stats = UpdateStats()
+        self.gallery_stats = UpdateStats()
+        # Cloud item metadata by item ID, least recently used first, and the
+        # item IDs of cloud gallery pages, which are dropped on every gallery refresh
+        self._items: OrderedDict[str, Item] = OrderedDict()
+        self._gallery_pages: dict[tuple[str, int], list[str]] = {}
+        self.item_cache = CacheStats()
+        # Search index of the account's items and galleries, refreshed in the
+        # background after every gallery refresh
+        self.library = LibraryIndex()
+        self.library_stats = UpdateStats()
+        self._library_refresh_in_progress: bool = False
+        # Delta sync: galleries and items whose updatedAt did not change keep
+        # their existing records, cached pages and index entries. Everything is
+        # resynced every FULL_SYNC_INTERVAL seconds.
+        self._item_versions: dict[str, Any] = {}
+        self._last_full_sync: float = 0.0
+        self.last_sync_changes: dict[str, Any] = {}
 
         super().__init__(
             hass,
@@ -63,7 +163,10 @@ class CloudDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
     def _update_polling_interval(self) -> None:
         """Update polling interval based on all devices' sleep states."""
-        awake_count = sum(1 for coord in self._local_coordinators.values() if not coord.sleeping)
+        # Devices without local data yet count as awake until their first refresh
+        awake_count = sum(
+            1 for coord in self._local_coordinators.values() if coord.data is None or not coord.sleeping
+        )
         new_interval = timedelta(seconds=CLOUD_UPDATE_INTERVAL if awake_count else CLOUD_UPDATE_INTERVAL_SLEEPING)
 
         if self.update_interval != new_interval:
@@ -78,6 +181,64 @@ class CloudDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Called when a local coordinator's sleep state may have changed."""
         self._update_polling_interval()
 
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> CALLBACK_TYPE:
+        """Listen for data updates.
+
+        A device ID passed as context (as CoordinatorEntity does with its
+        coordinator_context) subscribes to that device's updates only.
+        """
+        if context is None:
+            return super().async_add_listener(update_callback)
+        return self.async_add_device_listener(str(context), update_callback)
+
+    @callback
+    def async_add_device_listener(
+        self, device_id: str, update_callback: CALLBACK_TYPE
+    ) -> CALLBACK_TYPE:
+        """Listen for updates of a single device. Returns a function to remove the listener."""
+        listeners = self._device_listeners.setdefault(device_id, [])
+        listeners.append(update_callback)
+        # A single regular listener dispatches to all device listeners, so the
+        # coordinator keeps scheduling refreshes while any device is subscribed.
+        if self._remove_device_dispatcher is None:
+            self._remove_device_dispatcher = super().async_add_listener(
+                self._async_dispatch_device_listeners
+            )
+
+        @callback
+        def remove_listener() -> None:
+            listeners.remove(update_callback)
+            if not listeners:
+                self._device_listeners.pop(device_id, None)
+            if not self._device_listeners and self._remove_device_dispatcher is not None:
+                self._remove_device_dispatcher()
+                self._remove_device_dispatcher = None
+
+        return remove_listener
+
+    @callback
+    def _async_dispatch_device_listeners(self) -> None:
+        """Call the listeners of devices that changed in the last update."""
+        if self.changed_devices is None:
+            device_ids = list(self._device_listeners)
+        else:
+            device_ids = [device_id for device_id in self.changed_devices if device_id in self._device_listeners]
+        for device_id in device_ids:
+            for update_callback in list(self._device_listeners.get(device_id, ())):
+                update_callback()
+
+    def device_changed(self, device_id: str, fields: Iterable[str] | None = None) -> bool:
+        """Return True if the device (or any of the given fields) changed in the last update."""
+        if self.changed_devices is None:
+            return True
+        changed = self.changed_devices.get(device_id)
+        if not changed:
+            return False
+        return fields is None or not changed.isdisjoint(fields)
+
     @property
     def galleries_stale(self) -> bool:
         """Return True if gallery data should be refreshed."""
@@ -90,31 +251,100 @@ class CloudDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         Called after synchronize() service, when media browser opens with stale data,
         or as a background task when the regular poll detects stale gallery data.
+        Galleries whose updatedAt did not change keep their existing records and
+        cached item pages, unless a full resync is due.
         """
         if self._gallery_refresh_in_progress:
             return
         self._gallery_refresh_in_progress = True
+        started = None
+        success = False
         try:
             existing = self.data or {}
             devices = list(existing.get("devices", {}).values())
             if not devices:
                 return
 
-            device_galleries_by_device: dict[str, list[dict[str, Any]]] = {}
+            started = dt_util.utcnow()
+            start = time.monotonic()
+            full = self.full_sync_due
+            # Galleries from the previous sync, reused when their updatedAt is
+            # unchanged so unchanged records are not replaced
+            previous: dict[str, Gallery] = {}
+            if not full:
+                for gallery in existing.get("user_galleries", []):
+                    previous[str(gallery.id)] = gallery
+                for galleries in existing.get("device_galleries", {}).values():
+                    for gallery in galleries:
+                        previous.setdefault(str(gallery.id), gallery)
+            changed_ids: set[str] = set()
+            # Galleries of this sync, shared between the lists they appear in
+            merged_galleries: dict[str, Gallery] = {}
+
+            def merge(page: list[dict[str, Any]]) -> list[Gallery]:
+                merged = []
+                for raw in page:
+                    gallery_id = str(raw["id"])
+                    gallery = merged_galleries.get(gallery_id)
+                    if gallery is None:
+                        gallery = Gallery.from_api(raw)
+                        old = previous.get(gallery_id)
+                        if unchanged_record(old, gallery):
+                            gallery = old
+                        else:
+                            changed_ids.add(gallery_id)
+                        merged_galleries[gallery_id] = gallery
+                    merged.append(gallery)
+                return merged
+
+            device_galleries_by_device: dict[str, list[Gallery]] = {}
             for device in devices:
-                device_id = device["id"]
-                device_galleries = await self.meural.get_device_galleries(device_id)
-                device_galleries_by_device[str(device_id)] = device_galleries
+                device_galleries = device_galleries_by_device[str(device["id"])] = []
+                async for page in self.meural.iter_device_galleries(device["id"]):
+                    device_galleries.extend(merge(page))
 
-            user_galleries = await self.meural.get_user_galleries()
+            user_galleries: list[Gallery] = []
+            async for page in self.meural.iter_user_galleries():
+                user_galleries.extend(merge(page))
 
             self._last_gallery_fetch = time.monotonic()
+            stale_ids = changed_ids | (previous.keys() - merged_galleries.keys())
+            if full:
+                self._gallery_pages.clear()
+                self._last_full_sync = time.monotonic()
+            else:
+                for key in [key for key in self._gallery_pages if key[0] in stale_ids]:
+                    del self._gallery_pages[key]
+            self.last_sync_changes = {
+                "full": full,
+                "galleries": len(merged_galleries),
+                "changed_galleries": len(stale_ids),
+            }
 
             if self.data:
+
+                def gallery_list_changed(old: list[Gallery] | None, new: list[Gallery]) -> bool:
+                    if old is None or len(old) != len(new):
+                        return True
+                    return any(a is not b and a != b for a, b in zip(old, new))
+
+                previous_device_galleries = self.data.get("device_galleries", {})
+                user_galleries_changed = gallery_list_changed(self.data.get("user_galleries"), user_galleries)
+                self.changed_devices = {
+                    device_id: {"galleries"}
+                    for device_id in self.data["devices"]
+                    if user_galleries_changed
+                    or device_id not in device_galleries_by_device
+                    or gallery_list_changed(
+                        previous_device_galleries.get(device_id), device_galleries_by_device[device_id]
+                    )
+                }
                 self.data["device_galleries"] = device_galleries_by_device
                 self.data["user_galleries"] = user_galleries
                 self.async_set_updated_data(self.data)
+                self.hass.async_create_task(self.async_refresh_library(full))
 
+            success = True
             _LOGGER.debug(
                 "Meural Cloud: Gallery data refreshed (%d user galleries)",
                 len(user_galleries),
@@ -123,8 +353,187 @@ class CloudDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             _LOGGER.warning("Meural Cloud: Failed to refresh gallery data: %s", err)
         finally:
             self._gallery_refresh_in_progress = False
+            if started is not None:
+                self.gallery_stats.record(started, time.monotonic() - start, success)
+
+    async def async_refresh_library(self, full: bool = False) -> None:
+        """Update the search index with the account's galleries and items.
+
+        Galleries come from the last gallery refresh; the user's items are
+        streamed page by page as background work. Items whose updatedAt did
+        not change since the last sync are skipped unless full is set. Changed
+        records are indexed in chunks of LIBRARY_INDEX_CHUNK with the event
+        loop released in between, and records that disappeared are removed.
+        """
+        if self._library_refresh_in_progress or not self.data:
+            return
+        self._library_refresh_in_progress = True
+        started = dt_util.utcnow()
+        start = time.monotonic()
+        success = False
+        try:
+            galleries: dict[str, Gallery] = {}
+            for gallery in self.data.get("user_galleries", []):
+                galleries[str(gallery.id)] = gallery
+            for device_galleries in self.data.get("device_galleries", {}).values():
+                for gallery in device_galleries:
+                    galleries.setdefault(str(gallery.id), gallery)
+            changed = await self._async_index(KIND_GALLERY, list(galleries.values()))
+
+            # Items are indexed page by page as they arrive, so only one page
+            # of raw item payloads is held at a time
+            if full:
+                self._item_versions.clear()
+            item_ids: set[str] = set()
+            changed_items = 0
+            async for page in self.meural.iter_user_items():
+                changed_page = []
+                for raw in page:
+                    item_id = str(raw["id"])
+                    item_ids.add(item_id)
+                    version = raw.get("updatedAt")
+                    if version is not None and self._item_versions.get(item_id) == version:
+                        continue
+                    if item_id in self._item_versions:
+                        # Cached metadata of an item that changed is fetched again
+                        self._items.pop(item_id, None)
+                    self._item_versions[item_id] = version
+                    changed_page.append(Item.from_api(raw))
+                changed_items += len(changed_page)
+                changed += await self._async_index(KIND_ITEM, changed_page)
+            for item_id in self._item_versions.keys() - item_ids:
+                del self._item_versions[item_id]
+            removed = self.library.retain(KIND_GALLERY, galleries) + self.library.retain(KIND_ITEM, item_ids)
+            self.last_sync_changes.update(items=len(item_ids), changed_items=changed_items)
+            success = True
+            _LOGGER.debug(
+                "Meural Cloud: Library index refreshed (%d records, %d changed, %d removed)",
+                len(self.library),
+                changed,
+                removed,
+            )
+        except (InvalidAuth, CannotConnect, aiohttp.ClientError, asyncio.TimeoutError) as err:
+            _LOGGER.warning("Meural Cloud: Failed to refresh library index: %s", err)
+        finally:
+            self._library_refresh_in_progress = False
+            self.library_stats.record(started, time.monotonic() - start, success)
+
+    async def _async_index(self, kind: str, records: list[Gallery] | list[Item]) -> int:
+        """Index records in chunks, yielding to the event loop. Returns the number changed."""
+        changed = 0
+        for index, record in enumerate(records, 1):
+            changed += self.library.update(kind, record)
+            if index % LIBRARY_INDEX_CHUNK == 0:
+                await asyncio.sleep(0)
+        return changed
+
+    def cached_item(self, item_id: str | int) -> Item | None:
+        """Return cached cloud metadata of an item, or None."""
+        item_id = str(item_id)
+        item = self._items.get(item_id)
+        if item is not None:
+            self._items.move_to_end(item_id)
+        return item
+
+    def _cache_item(self, item: Item) -> None:
+        item_id = str(item.id)
+        self._items[item_id] = item
+        self._items.move_to_end(item_id)
+        while len(self._items) > ITEM_CACHE_SIZE:
+            self._items.popitem(last=False)
+
+    async def async_get_item(self, item_id: str | int, priority: int = PRIORITY_POLL) -> Item:
+        """Return cloud metadata of an item, from cache when possible."""
+        if (item := self.cached_item(item_id)) is not None:
+            self.item_cache.hits += 1
+            return item
+        self.item_cache.misses += 1
+        item = Item.from_api(await self.meural.get_item(item_id, priority))
+        self._cache_item(item)
+        return item
+
+    async def async_get_gallery_page(
+        self, gallery_id: str | int, page: int, priority: int = PRIORITY_POLL
+    ) -> list[Item]:
+        """Return a page of BROWSE_PAGE_SIZE items of a cloud gallery, from cache when possible."""
+        key = (str(gallery_id), page)
+        item_ids = self._gallery_pages.get(key)
+        if item_ids is not None and all(item_id in self._items for item_id in item_ids):
+            self.item_cache.hits += 1
+            return [self._items[item_id] for item_id in item_ids]
+        self.item_cache.misses += 1
+        items = [
+            Item.from_api(raw)
+            for raw in await self.meural.get_gallery_items(gallery_id, page, BROWSE_PAGE_SIZE, priority)
+        ]
+        for item in items:
+            self._cache_item(item)
+        self._gallery_pages[key] = [str(item.id) for item in items]
+        return items
+
+    async def async_prefetch_items(self, item_ids: Iterable[str | int]) -> None:
+        """Fetch cloud metadata of uncached items as background work.
+
+        At most ITEM_PREFETCH_CONCURRENCY requests are in flight at a time.
+        Items that cannot be fetched are skipped.
+        """
+        missing = [str(item_id) for item_id in item_ids if str(item_id) not in self._items]
+        if not missing:
+            return
+        semaphore = asyncio.Semaphore(ITEM_PREFETCH_CONCURRENCY)
+
+        async def fetch(item_id: str) -> None:
+            async with semaphore:
+                try:
+                    await self.async_get_item(item_id, PRIORITY_BACKGROUND)
+                except (InvalidAuth, CannotConnect, aiohttp.ClientError, asyncio.TimeoutError, KeyError) as err:
+                    _LOGGER.debug("Meural Cloud: Could not fetch item %s: %s", item_id, err)
+
+        await asyncio.gather(*(fetch(item_id) for item_id in missing))
 
+    @property
+    def full_sync_due(self) -> bool:
+        """Return True if the next gallery refresh should resync everything."""
+        return not self._last_full_sync or time.monotonic() - self._last_full_sync > FULL_SYNC_INTERVAL
+
+    @property
+    def last_gallery_refresh(self) -> float:
+        """Return the monotonic time of the last successful gallery refresh, or 0."""
+        return self._last_gallery_fetch
+
+    @watched
     async def _async_update_data(self) -> dict[str, Any]:
+        """Fetch data from Meural cloud API and record the duration of the update."""
+        started = dt_util.utcnow()
+        start = time.monotonic()
+        success = False
+        # Listeners treat everything as changed unless this update succeeds after
+        # a previous success; recovering entities must rewrite their availability.
+        # The diff is only set once the outcome is known, with no await before the
+        # listeners are called, so a gallery refresh that finished during the
+        # fetch cannot leave its own changes behind for this update.
+        changed_devices = None
+        try:
+            data = await self._async_fetch_data()
+            success = True
+            if self.data is not None and self.last_update_success:
+                changed_devices = self._changed_devices(data["devices"])
+            return data
+        finally:
+            self.changed_devices = changed_devices
+            self.update_stats.record(started, time.monotonic() - start, success)
+
+    def _changed_devices(self, devices_by_id: dict[str, dict[str, Any]]) -> dict[str, set[str]]:
+        """Return the changed fields of each device that changed since the last update."""
+        previous_devices = self.data.get("devices", {})
+        changed_devices = {}
+        for device_id, device in devices_by_id.items():
+            changed = diff_fields(previous_devices.get(device_id), device)
+            if changed is None or changed:
+                changed_devices[device_id] = changed if changed is not None else set(device)
+        return changed_devices
+
+    async def _async_fetch_data(self) -> dict[str, Any]:
         """Fetch data from Meural cloud API."""
         try:
             # Only fetch device settings on the regular poll interval.
@@ -141,7 +550,7 @@ class CloudDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 self.hass.async_create_task(self.async_refresh_galleries())
 
             return {
-                "devices": {str(device["id"]): device for device in devices},
+                "devices": {str(device["id"]): compact_device(device) for device in devices},
                 "device_galleries": device_galleries,
                 "user_galleries": user_galleries,
             }
@@ -165,18 +574,42 @@ class CloudDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 class LocalDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Class to manage fetching Meural local device data."""
 
+    # Slow call watchdog, set by setup when enabled in the options
+    watchdog: Watchdog | None = None
+
     def __init__(
         self,
         hass: HomeAssistant,
         device: dict[str, Any],
         session: aiohttp.ClientSession,
+        smoothing: float = DEFAULT_SENSOR_SMOOTHING,
+        host: str | None = None,
     ) -> None:
-        """Initialize the coordinator."""
+        """Initialize the coordinator, with a configured host overriding the device's localIp."""
         self.device = device
+        self.smoothing = smoothing
         self.device_id = str(device["id"])
-        self.local_meural = LocalMeural(device, session)
+        self.local_meural = LocalMeural(device, session, host)
         self._sleeping = True
         self.cloud_coordinator: CloudDataUpdateCoordinator | None = None
+        # Fields that changed in the last update, or None when listeners should
+        # treat all data as changed (first refresh).
+        self.changed_fields: set[str] | None = None
+        self._field_consumers: Counter[str] = Counter()
+        self._last_system_fetch = 0.0
+        self.update_stats = UpdateStats()
+        self.system_info_cache = CacheStats()
+        # Items of galleries on the Canvas by gallery ID, keyed by item ID in
+        # playlist order; see async_get_gallery_items()
+        self._gallery_items: dict[str, dict[str, dict[str, Any]]] = {}
+        self.gallery_items_cache = CacheStats()
+        # Error of the last failed fetch, cleared by the next successful one
+        self.last_fetch_error: Exception | None = None
+        # Consecutive polls that could not reach the Canvas, and local IP
+        # changes picked up from the cloud
+        self.connection_failures = 0
+        self.ip_changes = 0
+        self._last_rediscovery = 0.0
 
         super().__init__(
             hass,
@@ -189,20 +622,187 @@ class LocalDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Update device reference with latest cloud data."""
         self.device = device
         self.local_meural.device = device
+        self._use_local_ip(device.get("localIp"))
+
+    def _use_local_ip(self, local_ip: str | None) -> bool:
+        """Switch the local client to a new IP reported by the cloud. Returns True if it changed."""
+        if not local_ip or self.local_meural.configured_host or local_ip == self.local_meural.ip:
+            return False
+        _LOGGER.info(
+            "Meural device %s: Local IP changed from %s to %s",
+            self.device.get("alias", self.device_id),
+            self.local_meural.ip,
+            local_ip,
+        )
+        self.local_meural.ip = local_ip
+        self.connection_failures = 0
+        self.ip_changes += 1
+        return True
+
+    async def _async_rediscover(self) -> bool:
+        """Look up the local IP in the cloud after repeated connection failures.
+
+        Returns True if the Canvas has moved to a new address.
+        """
+        if (
+            self.cloud_coordinator is None
+            or self.local_meural.configured_host
+            or self.connection_failures < LOCAL_REDISCOVERY_FAILURES
+            or time.monotonic() - self._last_rediscovery < LOCAL_REDISCOVERY_INTERVAL
+        ):
+            return False
+        self._last_rediscovery = time.monotonic()
+        try:
+            device = await self.cloud_coordinator.meural.get_device(self.device_id)
+        except (InvalidAuth, CannotConnect, aiohttp.ClientError, asyncio.TimeoutError) as err:
+            _LOGGER.debug(
+                "Meural device %s: Could not look up local IP: %s", self.device.get("alias", self.device_id), err
+            )
+            return False
+        return self._use_local_ip(device.get("localIp"))
 
     @property
     def sleeping(self) -> bool:
         """Return if device is sleeping."""
         return self._sleeping
 
+    def has_changed(self, fields: Iterable[str]) -> bool:
+        """Return True if any of the given fields changed in the last update."""
+        return self.changed_fields is None or not self.changed_fields.isdisjoint(fields)
+
     def set_sleeping_optimistic(self, sleeping: bool) -> None:
         """Set sleep state optimistically and notify all subscribed entities."""
         self._sleeping = sleeping
         if self.cloud_coordinator is not None:
             self.cloud_coordinator.notify_sleep_state_changed()
+        self.changed_fields = {"sleeping"}
         self.async_update_listeners()
 
+    @watched
     async def _async_update_data(self) -> dict[str, Any]:
+        """Fetch data from Meural local device API and record which fields changed."""
+        prev_sleeping = self._sleeping
+        started = dt_util.utcnow()
+        start = time.monotonic()
+        self.last_fetch_error = None
+        data = await self._async_fetch_data()
+        self.update_stats.record(started, time.monotonic() - start, self.last_fetch_error is None)
+        self._apply_smoothing(data)
+        changed = diff_fields(self.data, data)
+        if changed is not None and prev_sleeping != self._sleeping:
+            # The previous state may have been set optimistically without data.
+            changed.add("sleeping")
+        self.changed_fields = changed
+        self._invalidate_gallery_items(data)
+        return data
+
+    def _invalidate_gallery_items(self, data: dict[str, Any]) -> None:
+        """Drop cached gallery items the latest data shows to be outdated.
+
+        All galleries are dropped when the gallery list changed. The current
+        gallery is dropped when its current item is not among the cached items.
+        """
+        if not self._gallery_items:
+            return
+        if self.changed_fields is None or "galleries" in self.changed_fields:
+            self._gallery_items.clear()
+            return
+        gallery_status = data.get("gallery_status") or {}
+        gallery_id = str(gallery_status.get("current_gallery"))
+        items = self._gallery_items.get(gallery_id)
+        if items is not None and str(gallery_status.get("current_item")) not in items:
+            del self._gallery_items[gallery_id]
+
+    def cached_gallery_items(self, gallery_id: str | int) -> dict[str, dict[str, Any]] | None:
+        """Return the cached items of a gallery on the Canvas, or None if not cached."""
+        return self._gallery_items.get(str(gallery_id))
+
+    async def async_get_gallery_items(
+        self, gallery_id: str | int, require_item: str | None = None
+    ) -> dict[str, dict[str, Any]]:
+        """Return the items of a gallery on the Canvas keyed by item ID, in playlist order.
+
+        Served from cache unless it was invalidated by a change of the gallery
+        list or gallery status. A cached gallery without require_item is
+        fetched again, in case the item was added since it was cached.
+        """
+        gallery_id = str(gallery_id)
+        items = self._gallery_items.get(gallery_id)
+        if items is not None and (require_item is None or require_item in items):
+            self.gallery_items_cache.hits += 1
+            return items
+        self.gallery_items_cache.misses += 1
+        items = {
+            str(item["id"]): item for item in await self.local_meural.send_get_items_by_gallery(gallery_id)
+        }
+        self._gallery_items[gallery_id] = items
+        return items
+
+    def _apply_smoothing(self, data: dict[str, Any]) -> None:
+        """Blend noisy sensor readings into their previous values in-place."""
+        if self.smoothing >= 1.0 or not self.data:
+            return
+        for key in SMOOTHED_FIELDS:
+            try:
+                new = float(data[key])
+                previous = float(self.data[key])
+            except (KeyError, TypeError, ValueError):
+                continue
+            data[key] = round(self.smoothing * new + (1 - self.smoothing) * previous, 2)
+
+    @callback
+    def async_add_field_consumer(self, fields: Iterable[str]) -> CALLBACK_TYPE:
+        """Register an enabled entity that renders the given fields.
+
+        Returns a function to unregister it. Disabled entities are never added to
+        Home Assistant, so they never register and their data is not polled.
+        """
+        fields = tuple(fields)
+        self._field_consumers.update(fields)
+
+        @callback
+        def remove_consumer() -> None:
+            self._field_consumers.subtract(fields)
+
+        return remove_consumer
+
+    def _system_info_due(self) -> bool:
+        """Return True if system information should be fetched in this poll."""
+        if any(self._field_consumers[field] > 0 for field in FAST_SYSTEM_FIELDS):
+            return True
+        if self._field_consumers["gsensor"] > 0 and self.device.get("orientationMatch"):
+            return True
+        # The backlight is off while the Canvas sleeps, so it is only read while awake
+        if self._field_consumers["backlight"] > 0 and not self._sleeping:
+            return True
+        # Nobody needs live values; refresh firmware version and free space slowly.
+        return time.monotonic() - self._last_system_fetch >= SYSTEM_INFO_SLOW_INTERVAL
+
+    async def _async_fetch_system_info(self, fallback: dict[str, Any]) -> dict[str, Any]:
+        """Fetch system information fields, or reuse cached values when not due.
+
+        Falls back to the given values if the request fails.
+        """
+        if not self._system_info_due():
+            self.system_info_cache.hits += 1
+            cached = self.data or {}
+            return {field: cached.get(field) for field in SYSTEM_FIELDS}
+        self.system_info_cache.misses += 1
+        try:
+            system_info = await self.local_meural.send_get_system()
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return {field: fallback.get(field) for field in SYSTEM_FIELDS}
+        self._last_system_fetch = time.monotonic()
+        return {
+            "gsensor": system_info.get("gsensor"),
+            "lux": system_info.get("lux"),
+            "backlight": system_info.get("backlight"),
+            "free_space": system_info.get("free_space"),
+            "wifi_signal": system_info.get("wifi_status", {}).get("signal"),
+            "version": system_info.get("version"),
+        }
+
+    async def _async_fetch_data(self) -> dict[str, Any]:
         """Fetch data from Meural local device API."""
         try:
             # Get sleep status
@@ -215,33 +815,14 @@ class LocalDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 # Device is sleeping; skip gallery fetches but still poll sensor data —
                 # the local web server remains running during sleep mode.
                 cached = self.data or {}
-                gsensor = cached.get("gsensor")
-                lux = cached.get("lux")
-                backlight = cached.get("backlight")
-                free_space = cached.get("free_space")
-                wifi_signal = cached.get("wifi_signal")
-                version = cached.get("version")
-                try:
-                    system_info = await self.local_meural.send_get_system()
-                    gsensor = system_info.get("gsensor")
-                    lux = system_info.get("lux")
-                    backlight = system_info.get("backlight")
-                    free_space = system_info.get("free_space")
-                    wifi_status = system_info.get("wifi_status", {})
-                    wifi_signal = wifi_status.get("signal")
-                    version = system_info.get("version")
-                except (aiohttp.ClientError, asyncio.TimeoutError):
-                    pass  # Fall back to cached values initialized above
+                # Fall back to cached values if fetching system info fails
+                system_info = await self._async_fetch_system_info(cached)
+                self.connection_failures = 0
                 return {
                     "sleeping": True,
                     "galleries": cached.get("galleries", []),
                     "gallery_status": cached.get("gallery_status", {}),
-                    "gsensor": gsensor,
-                    "lux": lux,
-                    "backlight": backlight,
-                    "free_space": free_space,
-                    "wifi_signal": wifi_signal,
-                    "version": version,
+                    **system_info,
                 }
 
             # Device is awake, get full data
@@ -249,38 +830,25 @@ class LocalDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             gallery_status = await self.local_meural.send_get_gallery_status()
 
             # Get gsensor orientation for orientationMatch detection and lux for illuminance sensor.
-            # Failure here is non-critical; omit the keys so callers can detect absence.
-            gsensor = None
-            lux = None
-            backlight = None
-            free_space = None
-            wifi_signal = None
-            version = None
-            try:
-                system_info = await self.local_meural.send_get_system()
-                gsensor = system_info.get("gsensor")
-                lux = system_info.get("lux")
-                backlight = system_info.get("backlight")
-                free_space = system_info.get("free_space")
-                wifi_status = system_info.get("wifi_status", {})
-                wifi_signal = wifi_status.get("signal")
-                version = system_info.get("version")
-            except (aiohttp.ClientError, asyncio.TimeoutError):
-                pass
+            # Failure here is non-critical; omit the values so callers can detect absence.
+            system_info = await self._async_fetch_system_info({})
 
+            self.connection_failures = 0
             return {
                 "sleeping": False,
                 "galleries": sorted(galleries, key=lambda i: i["name"]),
                 "gallery_status": gallery_status,
-                "gsensor": gsensor,
-                "lux": lux,
-                "backlight": backlight,
-                "free_space": free_space,
-                "wifi_signal": wifi_signal,
-                "version": version,
+                **system_info,
             }
 
         except (DeviceTurnedOff, aiohttp.ClientError, asyncio.TimeoutError) as err:
+            if isinstance(err, (DeviceTurnedOff, aiohttp.ClientConnectionError, asyncio.TimeoutError)):
+                # The Canvas may have a new address after a DHCP change; retry
+                # this poll right away if the cloud reports one.
+                self.connection_failures += 1
+                if await self._async_rediscover():
+                    return await self._async_fetch_data()
+            self.last_fetch_error = err
             # Network or connection error - preserve last known sleeping state to avoid
             # flickering between STATE_PLAYING and STATE_OFF on transient failures.
             # DeviceTurnedOff (ClientConnectorError) is also transient - the local web
@@ -296,12 +864,16 @@ class LocalDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 self.device.get("alias", self.device_id),
             )
             cached = self.data or {}
+            # Keep the system fields too; they are only refetched when due, so
+            # later polls would otherwise read them back as None.
             return {
                 "sleeping": self._sleeping,
                 "galleries": cached.get("galleries", []),
                 "gallery_status": cached.get("gallery_status", {}),
+                **{field: cached.get(field) for field in SYSTEM_FIELDS},
             }
         except Exception as err:
+            self.last_fetch_error = err
             # Unexpected error
             _LOGGER.exception(
                 "Unexpected error updating Meural local device %s",
@@ -0,0 +1,121 @@
+"""Diagnostics support for Meural."""
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceEntry
+
+from .const import DOMAIN
+from .coordinator import CloudDataUpdateCoordinator, LocalDataUpdateCoordinator
+from .library import KIND_GALLERY, KIND_ITEM
+
+TO_REDACT = {
+    "email",
+    "password",
+    "token",
+    "refresh_token",
+    "username",
+    "localIp",
+    "serialNumber",
+    "productKey",
+}
+
+
+def _cloud_coordinator_diagnostics(coordinator: CloudDataUpdateCoordinator) -> dict[str, Any]:
+    """Return update timing of the cloud coordinator."""
+    last_gallery_refresh = coordinator.last_gallery_refresh
+    return {
+        "last_update_success": coordinator.last_update_success,
+        "update_interval": coordinator.update_interval.total_seconds() if coordinator.update_interval else None,
+        "updates": coordinator.update_stats.as_dict(),
+        "gallery_refresh": {
+            **coordinator.gallery_stats.as_dict(),
+            "age": round(time.monotonic() - last_gallery_refresh) if last_gallery_refresh else None,
+            "stale": coordinator.galleries_stale,
+            "full_sync_due": coordinator.full_sync_due,
+            "last_sync": coordinator.last_sync_changes,
+        },
+        "item_cache": coordinator.item_cache.as_dict(),
+        "library": {
+            **coordinator.library_stats.as_dict(),
+            "galleries": coordinator.library.count(KIND_GALLERY),
+            "items": coordinator.library.count(KIND_ITEM),
+        },
+    }
+
+
+def _local_coordinator_diagnostics(coordinator: LocalDataUpdateCoordinator) -> dict[str, Any]:
+    """Return update timing, cache and request statistics of a local coordinator."""
+    return {
+        "last_update_success": coordinator.last_update_success,
+        "last_fetch_error": repr(coordinator.last_fetch_error) if coordinator.last_fetch_error else None,
+        "sleeping": coordinator.sleeping,
+        "connection_failures": coordinator.connection_failures,
+        "ip_changes": coordinator.ip_changes,
+        "configured_host": coordinator.local_meural.configured_host is not None,
+        "update_interval": coordinator.update_interval.total_seconds() if coordinator.update_interval else None,
+        "updates": coordinator.update_stats.as_dict(),
+        "system_info_cache": coordinator.system_info_cache.as_dict(),
+        "gallery_items_cache": coordinator.gallery_items_cache.as_dict(),
+        "requests": coordinator.local_meural.stats.as_dict(),
+    }
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    meural = entry_data["meural"]
+    cloud_coordinator = entry_data["cloud_coordinator"]
+    watchdog = entry_data["watchdog"]
+    image_cache = entry_data["image_cache"]
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "auth_backoff": meural.auth_backoff_as_dict(),
+        "cloud_coordinator": _cloud_coordinator_diagnostics(cloud_coordinator),
+        "cloud_requests": meural.stats.as_dict(),
+        "cloud_rate_limiter": meural.rate_limiter.as_dict(),
+        "local_coordinators": {
+            device_id: _local_coordinator_diagnostics(local_coordinator)
+            for device_id, local_coordinator in entry_data["local_coordinators"].items()
+        },
+        "watchdog": watchdog.as_dict() if watchdog is not None else None,
+        "image_cache": image_cache.as_dict() if image_cache is not None else None,
+    }
+
+
+async def async_get_device_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry, device: DeviceEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a single Canvas."""
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    cloud_coordinator = entry_data["cloud_coordinator"]
+    product_keys = {identifier for domain, identifier in device.identifiers if domain == DOMAIN}
+    devices = (cloud_coordinator.data or {}).get("devices", {})
+    device_id = next(
+        (device_id for device_id, data in devices.items() if data.get("productKey") in product_keys),
+        None,
+    )
+    if device_id is None:
+        return {"error": "Device not found in cloud data"}
+
+    diagnostics: dict[str, Any] = {
+        "device": async_redact_data(devices[device_id], TO_REDACT),
+        "galleries": len(cloud_coordinator.data.get("device_galleries", {}).get(device_id, [])),
+        "cloud_changed_fields": sorted((cloud_coordinator.changed_devices or {}).get(device_id, ())),
+    }
+    local_coordinator = entry_data["local_coordinators"].get(device_id)
+    if local_coordinator is not None:
+        diagnostics["local_coordinator"] = _local_coordinator_diagnostics(local_coordinator)
+        diagnostics["local_changed_fields"] = (
+            sorted(local_coordinator.changed_fields) if local_coordinator.changed_fields is not None else None
+        )
+    return diagnostics
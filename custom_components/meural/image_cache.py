@@ -0,0 +1,228 @@
+"""Opt-in on-disk cache of resized Meural artwork."""
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from collections.abc import Iterable
+import contextlib
+import hashlib
+import logging
+import os
+import time
+from typing import Any
+
+import aiohttp
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .const import (
+    IMAGE_CACHE_EVICT_INTERVAL,
+    IMAGE_CACHE_MAX_AGE,
+    IMAGE_CACHE_TOUCH_INTERVAL,
+    IMAGE_DOWNLOAD_TIMEOUT,
+)
+from .stats import CacheStats
+
+_LOGGER = logging.getLogger(__name__)
+
+JPEG_QUALITY = 85
+TEMPORARY_SUFFIX = ".tmp"
+
+
+def _content_type(data: bytes) -> str:
+    """Return the content type of image data from its signature."""
+    if data.startswith(b"\x89PNG"):
+        return "image/png"
+    if data.startswith(b"GIF8"):
+        return "image/gif"
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "image/webp"
+    return "image/jpeg"
+
+
+def _read(path: str) -> bytes | None:
+    """Read a cached image and mark it as recently used. Does blocking I/O.
+
+    The modification time records the last use, and is only updated once per
+    IMAGE_CACHE_TOUCH_INTERVAL so cache hits do not each cost a metadata write.
+    """
+    try:
+        with open(path, "rb") as image:
+            data = image.read()
+            modified = os.fstat(image.fileno()).st_mtime
+    except FileNotFoundError:
+        return None
+    if time.time() - modified > IMAGE_CACHE_TOUCH_INTERVAL:
+        with contextlib.suppress(FileNotFoundError):
+            os.utime(path)
+    return data
+
+
+def _resize(data: bytes, size: int) -> bytes:
+    """Return the image scaled down to fit size x size pixels as JPEG.
+
+    Returns the original data if Pillow is not installed or cannot read it.
+    """
+    try:
+        from PIL import Image  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return data
+    import io  # pylint: disable=import-outside-toplevel
+
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            if image.width <= size and image.height <= size:
+                return data
+            image.thumbnail((size, size))
+            output = io.BytesIO()
+            image.convert("RGB").save(output, "JPEG", quality=JPEG_QUALITY)
+    except (OSError, ValueError):
+        return data
+    return output.getvalue()
+
+
+def _resize_and_write(path: str, data: bytes, size: int) -> bytes:
+    """Resize an image and write it to the cache atomically. Does blocking I/O."""
+    resized = _resize(data, size)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temporary = f"{path}{TEMPORARY_SUFFIX}"
+    with open(temporary, "wb") as image:
+        image.write(resized)
+    os.replace(temporary, path)
+    return resized
+
+
+def _evict(directory: str, max_bytes: int, max_age: float) -> tuple[int, int]:
+    """Remove images unused for max_age seconds, then the least recently used ones
+    until the cache fits max_bytes. Returns the remaining files and bytes. Does blocking I/O.
+
+    Temporary files may still be written by another job and are only removed
+    once expired. Files removed concurrently are skipped.
+    """
+    try:
+        entries = [entry for entry in os.scandir(directory) if entry.is_file()]
+    except FileNotFoundError:
+        return 0, 0
+    now = time.time()
+    files = []
+    for entry in entries:
+        with contextlib.suppress(FileNotFoundError):
+            stat = entry.stat()
+            if now - stat.st_mtime > max_age:
+                os.remove(entry.path)
+            elif not entry.name.endswith(TEMPORARY_SUFFIX):
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+    files.sort()
+    total = sum(size for _, size, _ in files)
+    while files and total > max_bytes:
+        _, size, path = files.pop(0)
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(path)
+        total -= size
+    return len(files), total
+
+
+class ImageCache:
+    """Serve artwork through Home Assistant from a bounded on-disk cache.
+
+    Images are downloaded once per URL and kept in resized variants, one file
+    per URL and size, scaled with Pillow when it is installed. Files unused
+    for IMAGE_CACHE_MAX_AGE seconds are removed, then the least recently used
+    ones until the cache fits its size limit.
+    """
+
+    def __init__(self, hass: HomeAssistant, directory: str, max_bytes: int) -> None:
+        """Initialize the cache in a directory with a size limit in bytes."""
+        self.hass = hass
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self.files: int | None = None
+        self.bytes: int | None = None
+        # Per-file locks so concurrent requests for an image download it once,
+        # kept while any request holds or waits for them
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._lock_users: Counter[str] = Counter()
+        self._last_eviction = 0.0
+
+    def _path(self, url: str, size: int) -> str:
+        return os.path.join(self.directory, f"{hashlib.sha1(url.encode()).hexdigest()}_{size}")
+
+    async def async_get(self, url: str, size: int) -> tuple[bytes | None, str | None]:
+        """Return an image scaled to fit size x size pixels and its content type.
+
+        Returns (None, None) if the image is not cached and cannot be downloaded.
+        If the cache cannot be read or written, the downloaded image is returned
+        without caching it.
+        """
+        path = self._path(url, size)
+        lock = self._locks.setdefault(path, asyncio.Lock())
+        self._lock_users[path] += 1
+        try:
+            async with lock:
+                data = await self._async_read(path)
+                if data is not None:
+                    self.stats.hits += 1
+                    return data, _content_type(data)
+                self.stats.misses += 1
+                original = await self._async_download(url)
+                if original is None:
+                    return None, None
+                try:
+                    data = await self.hass.async_add_executor_job(_resize_and_write, path, original, size)
+                except OSError as err:
+                    _LOGGER.warning("Meural: Could not write image %s to the image cache: %s", url, err)
+                    return original, _content_type(original)
+        finally:
+            self._lock_users[path] -= 1
+            if not self._lock_users[path]:
+                del self._lock_users[path]
+                del self._locks[path]
+        self._async_schedule_eviction()
+        return data, _content_type(data)
+
+    async def _async_read(self, path: str) -> bytes | None:
+        try:
+            return await self.hass.async_add_executor_job(_read, path)
+        except OSError as err:
+            _LOGGER.warning("Meural: Could not read image cache file %s: %s", path, err)
+            return None
+
+    async def async_prefetch(self, urls: Iterable[str], size: int) -> None:
+        """Download and cache images that are likely to be shown next."""
+        for url in urls:
+            await self.async_get(url, size)
+
+    async def _async_download(self, url: str) -> bytes | None:
+        session = async_get_clientsession(self.hass)
+        try:
+            async with session.get(
+                url, raise_for_status=True, timeout=aiohttp.ClientTimeout(total=IMAGE_DOWNLOAD_TIMEOUT)
+            ) as resp:
+                return await resp.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            _LOGGER.debug("Meural: Could not download image %s: %s", url, err)
+            return None
+
+    def _async_schedule_eviction(self) -> None:
+        """Trim the cache in the executor, at most once per IMAGE_CACHE_EVICT_INTERVAL."""
+        if time.monotonic() - self._last_eviction < IMAGE_CACHE_EVICT_INTERVAL:
+            return
+        self._last_eviction = time.monotonic()
+        self.hass.async_create_task(self.async_evict())
+
+    async def async_evict(self) -> None:
+        """Remove expired and least recently used images beyond the size limit."""
+        self.files, self.bytes = await self.hass.async_add_executor_job(
+            _evict, self.directory, self.max_bytes, IMAGE_CACHE_MAX_AGE
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return cache statistics for diagnostics."""
+        return {
+            **self.stats.as_dict(),
+            "files": self.files,
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+        }
@@ -0,0 +1,176 @@
+"""In-memory search index of a Meural library."""
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Iterable
+import heapq
+from itertools import islice
+import re
+import unicodedata
+from typing import Any
+
+from .records import Gallery, Item
+
+KIND_ITEM = "item"
+KIND_GALLERY = "gallery"
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def normalize(text: str) -> str:
+    """Return text case-folded and without accents, for matching."""
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def tokenize(text: str) -> set[str]:
+    """Return the distinct normalized words of a text."""
+    return set(_TOKEN_RE.findall(normalize(text)))
+
+
+def _rank(phrase: str, name: str, record_id: str) -> tuple[bool, bool, str, str]:
+    """Return the sort key of a match: exact names first, then names containing the phrase, then by name."""
+    return name != phrase, phrase not in name, name, record_id
+
+
+def merge_results(query: str, results: Iterable[list[dict[str, Any]]], limit: int) -> list[dict[str, Any]]:
+    """Merge the search results of several indexes into the best limit matches."""
+    phrase = normalize(query.strip())
+    return list(
+        islice(
+            heapq.merge(*results, key=lambda result: _rank(phrase, normalize(result["name"] or ""), result["id"])),
+            limit,
+        )
+    )
+
+
+def _searchable_text(record: Gallery | Item) -> str:
+    """Return the name, artist, year and description of a record."""
+    if isinstance(record, Item):
+        fields = (record.name, record.artist, record.year, record.description)
+    else:
+        fields = (record.name, record.author, record.description)
+    return " ".join(field for field in fields if field)
+
+
+def _result(kind: str, record: Gallery | Item) -> dict[str, Any]:
+    """Return a search result for a record, without its description."""
+    if isinstance(record, Item):
+        return {
+            "type": kind,
+            "id": str(record.id),
+            "name": record.name,
+            "artist": record.artist,
+            "year": record.year,
+            "image": record.image,
+        }
+    return {
+        "type": kind,
+        "id": str(record.id),
+        "name": record.name,
+        "artist": record.author,
+        "image": record.cover,
+        "item_count": record.item_count,
+    }
+
+
+class LibraryIndex:
+    """Inverted index over the items and galleries of a Meural account.
+
+    Records are keyed by kind and ID. Updating a record that did not change is a
+    record comparison, so refreshing the whole library only re-indexes what changed.
+    Queries match records containing every query word, with each word matched as
+    a prefix, and never touch the cloud.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._records: dict[tuple[str, str], Gallery | Item] = {}
+        # Index words and normalized name of each record
+        self._tokens: dict[tuple[str, str], set[str]] = {}
+        self._names: dict[tuple[str, str], str] = {}
+        self._postings: dict[str, set[tuple[str, str]]] = {}
+        # Sorted index words for prefix lookups, rebuilt lazily after changes
+        self._vocabulary: list[str] | None = []
+
+    def __len__(self) -> int:
+        """Return the number of indexed records."""
+        return len(self._records)
+
+    def count(self, kind: str) -> int:
+        """Return the number of indexed records of a kind."""
+        return sum(1 for record_kind, _ in self._records if record_kind == kind)
+
+    def update(self, kind: str, record: Gallery | Item) -> bool:
+        """Index an item or gallery. Returns True if it changed."""
+        key = (kind, str(record.id))
+        if self._records.get(key) == record:
+            return False
+        self.remove(kind, record.id)
+        self._records[key] = record
+        self._names[key] = normalize(record.name or "")
+        tokens = self._tokens[key] = tokenize(_searchable_text(record))
+        for token in tokens:
+            postings = self._postings.get(token)
+            if postings is None:
+                postings = self._postings[token] = set()
+                self._vocabulary = None
+            postings.add(key)
+        return True
+
+    def remove(self, kind: str, record_id: str | int) -> None:
+        """Remove a record from the index, if present."""
+        key = (kind, str(record_id))
+        if self._records.pop(key, None) is None:
+            return
+        del self._names[key]
+        for token in self._tokens.pop(key):
+            postings = self._postings[token]
+            postings.discard(key)
+            if not postings:
+                del self._postings[token]
+                self._vocabulary = None
+
+    def retain(self, kind: str, record_ids: Iterable[str | int]) -> int:
+        """Remove records of a kind that are not in record_ids. Returns the number removed."""
+        keep = {str(record_id) for record_id in record_ids}
+        stale = [record_id for record_kind, record_id in self._records if record_kind == kind and record_id not in keep]
+        for record_id in stale:
+            self.remove(kind, record_id)
+        return len(stale)
+
+    def _prefix_matches(self, term: str) -> set[tuple[str, str]]:
+        """Return the keys of records with a word starting with term."""
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._postings)
+        vocabulary = self._vocabulary
+        matches: set[tuple[str, str]] = set()
+        index = bisect_left(vocabulary, term)
+        while index < len(vocabulary) and vocabulary[index].startswith(term):
+            matches |= self._postings[vocabulary[index]]
+            index += 1
+        return matches
+
+    def search(self, query: str, kind: str | None = None, limit: int = 20) -> list[dict[str, Any]]:
+        """Return up to limit records matching every word of the query.
+
+        Records named like the query come first, then records whose name
+        contains the whole query, then by name.
+        Descriptions are searched but not returned.
+        """
+        terms = tokenize(query)
+        if not terms:
+            return []
+        # Longer words usually match fewer records, which keeps intersections small
+        first, *rest = sorted(terms, key=len, reverse=True)
+        matches = self._prefix_matches(first)
+        for term in rest:
+            if not matches:
+                return []
+            matches &= self._prefix_matches(term)
+        if kind is not None:
+            matches = {key for key in matches if key[0] == kind}
+
+        phrase = normalize(query.strip())
+        best = heapq.nsmallest(limit, matches, key=lambda key: _rank(phrase, self._names[key], key[1]))
+        return [_result(key[0], self._records[key]) for key in best]
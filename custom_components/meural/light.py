@@ -13,12 +13,15 @@ from homeassistant.components.light import (
     LightEntity,
 )
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import STATE_ON
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import CloudDataUpdateCoordinator, LocalDataUpdateCoordinator
+from .watchdog import Watchdog, watched
 
 
 async def async_setup_entry(
@@ -42,12 +45,18 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class MeuralBacklightLight(CoordinatorEntity[LocalDataUpdateCoordinator], LightEntity):
-    """Backlight brightness control for a Meural Canvas device."""
+class MeuralBacklightLight(CoordinatorEntity[LocalDataUpdateCoordinator], LightEntity, RestoreEntity):
+    """Backlight brightness control for a Meural Canvas device.
+
+    Restores the last known on/off state and brightness, which are reported
+    until the local coordinator's first refresh completes.
+    """
 
     _attr_color_mode = ColorMode.BRIGHTNESS
     _attr_supported_color_modes = {ColorMode.BRIGHTNESS}
     _attr_icon = "mdi:image"
+    # Local data fields this light renders; state is only written when one changes.
+    _coordinator_fields = ("sleeping", "backlight")
 
     def __init__(
         self,
@@ -60,12 +69,30 @@ class MeuralBacklightLight(CoordinatorEntity[LocalDataUpdateCoordinator], LightE
         self._attr_name = f"{device['alias']} Backlight"
         self._attr_unique_id = f"{device['id']}_backlight"
         self._optimistic_brightness: int | None = None
-
+        self._restored_is_on: bool | None = None
+        self._restored_brightness: int | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Restore the last state and register the fields this light renders."""
+        await super().async_added_to_hass()
+        if (last_state := await self.async_get_last_state()) is not None:
+            self._restored_is_on = last_state.state == STATE_ON
+            self._restored_brightness = last_state.attributes.get(ATTR_BRIGHTNESS)
+        self.async_on_remove(self.coordinator.async_add_field_consumer(self._coordinator_fields))
+
+    @watched
     def _handle_coordinator_update(self) -> None:
         """Clear optimistic brightness once coordinator confirms the new value."""
+        if self._optimistic_brightness is None and not self.coordinator.has_changed(self._coordinator_fields):
+            return
         self._optimistic_brightness = None
         super()._handle_coordinator_update()
 
+    @property
+    def watchdog(self) -> Watchdog | None:
+        """Return the slow call watchdog, if enabled."""
+        return self.coordinator.watchdog
+
     @property
     def device_info(self) -> dict[str, Any]:
         """Return device information to link this entity to the Meural device."""
@@ -84,15 +111,19 @@ class MeuralBacklightLight(CoordinatorEntity[LocalDataUpdateCoordinator], LightE
             return None
 
     @property
-    def is_on(self) -> bool:
+    def is_on(self) -> bool | None:
         """Return true if the device is awake (backlight is on)."""
-        return self.coordinator.data is not None and not self.coordinator.sleeping
+        if self.coordinator.data is None:
+            return self._restored_is_on
+        return not self.coordinator.sleeping
 
     @property
     def brightness(self) -> int | None:
         """Return brightness scaled to HA range (0-255)."""
         if self._optimistic_brightness is not None:
             return self._optimistic_brightness
+        if self.coordinator.data is None:
+            return self._restored_brightness
         level = self._meural_brightness()
         if level is None:
             return None
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import timedelta
 import logging
 import asyncio
 import random
+import time
 from typing import Any
 
 import aiohttp
@@ -13,14 +15,15 @@ from homeassistant.components.media_player import MediaPlayerEntity
 from homeassistant.auth.models import RefreshToken
 from homeassistant.components import media_source
 from homeassistant.components.http.auth import async_sign_path
-from homeassistant.components.media_player import BrowseError, BrowseMedia
+from homeassistant.components.media_player import BrowseError, BrowseMedia, SearchMedia, SearchMediaQuery
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_platform
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.network import get_url
+from homeassistant.helpers.restore_state import ExtraStoredData, RestoreEntity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from homeassistant.components.media_player import MediaClass, MediaType
+from homeassistant.components.media_player import ATTR_INPUT_SOURCE, MediaClass, MediaType
 
 from homeassistant.const import (
     STATE_PLAYING,
@@ -32,9 +35,21 @@ from homeassistant.components.media_player.const import (
     MediaPlayerEntityFeature
 )
 
-from .const import DOMAIN, SD_CARD_FOLDER_MAX_ID
+from .const import (
+    BROWSE_PAGE_SIZE,
+    BROWSE_PREFETCH_TIMEOUT,
+    BROWSE_THUMBNAIL_SIZE,
+    DOMAIN,
+    MEDIA_IMAGE_SIZE,
+    OPTIMISTIC_ITEM_GRACE,
+    SD_CARD_FOLDER_MAX_ID,
+)
 from .coordinator import CloudDataUpdateCoordinator, LocalDataUpdateCoordinator
-from .pymeural import CannotConnect, InvalidAuth
+from .image_cache import ImageCache
+from .library import KIND_GALLERY, KIND_ITEM
+from .records import Gallery, Item
+from .pymeural import PRIORITY_BACKGROUND, PRIORITY_USER, CannotConnect, DeviceTurnedOff, InvalidAuth
+from .watchdog import Watchdog, watched
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -46,6 +61,7 @@ MEURAL_SUPPORT = (
     | MediaPlayerEntityFeature.PLAY
     | MediaPlayerEntityFeature.PLAY_MEDIA
     | MediaPlayerEntityFeature.PREVIOUS_TRACK
+    | MediaPlayerEntityFeature.SEARCH_MEDIA
     | MediaPlayerEntityFeature.SHUFFLE_SET
     | MediaPlayerEntityFeature.TURN_OFF
     | MediaPlayerEntityFeature.TURN_ON
@@ -75,6 +91,7 @@ async def async_setup_entry(
                 cloud_coordinator,
                 local_coordinator,
                 device,
+                entry_data["image_cache"],
             )
         )
 
@@ -170,8 +187,42 @@ async def async_setup_entry(
         "async_load_playlist",
     )
 
-class MeuralEntity(CoordinatorEntity[CloudDataUpdateCoordinator], MediaPlayerEntity):
-    """Representation of a Meural entity."""
+@dataclass
+class MeuralExtraStoredData(ExtraStoredData):
+    """Current item metadata stored to restore a Meural media player."""
+
+    current_item: dict[str, Any]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dict representation of the stored data."""
+        return {"current_item": self.current_item}
+
+    @classmethod
+    def from_dict(cls, restored: dict[str, Any]) -> MeuralExtraStoredData:
+        """Initialize the stored data from a dict."""
+        return cls(restored.get("current_item") or {})
+
+
+class MeuralEntity(CoordinatorEntity[CloudDataUpdateCoordinator], MediaPlayerEntity, RestoreEntity):
+    """Representation of a Meural entity.
+
+    Restores the last known state, source and current item metadata, which are
+    reported until the local coordinator's first refresh completes.
+    """
+
+    # Cloud device and local data fields this entity renders; state is only
+    # written when one of them changes.
+    _device_fields = (
+        "alias",
+        "frameModel",
+        "imageDuration",
+        "imageShuffle",
+        "localIp",
+        "status",
+        "version",
+        "galleries",
+    )
+    _coordinator_fields = ("sleeping", "galleries", "gallery_status", "version")
 
     def __init__(
         self,
@@ -179,18 +230,32 @@ class MeuralEntity(CoordinatorEntity[CloudDataUpdateCoordinator], MediaPlayerEnt
         cloud_coordinator: CloudDataUpdateCoordinator,
         local_coordinator: LocalDataUpdateCoordinator,
         device: dict[str, Any],
+        image_cache: ImageCache | None = None,
     ) -> None:
-        """Initialize the Meural entity."""
-        super().__init__(cloud_coordinator)
+        """Initialize the Meural entity.
+
+        With an image cache, artwork and browse thumbnails are served through
+        Home Assistant from the cache instead of directly from the Meural servers.
+        """
+        # Subscribe to this device's cloud updates only
+        super().__init__(cloud_coordinator, context=str(device["id"]))
 
         self.meural = meural
         self.cloud_coordinator = cloud_coordinator
         self.local_coordinator = local_coordinator
         self._meural_device = device
-        self._current_item: dict[str, Any] = {}
+        self.image_cache = image_cache
+        self._current_item: Item | None = None
         self._pause_duration = 0
         self._last_fetched_item_id: int | None = None
+        # Monotonic time until which an item shown optimistically after
+        # next/previous is kept while the Canvas still reports the previous one
+        self._optimistic_until = 0.0
         self._last_gsensor: str | None = None
+        # Local coordinator health the availability was last written with
+        self._local_health: tuple[bool, bool] | None = None
+        self._restored_state: str | None = None
+        self._restored_source: str | None = None
 
         # Start listening to local coordinator updates
         self.async_on_remove(
@@ -204,6 +269,11 @@ class MeuralEntity(CoordinatorEntity[CloudDataUpdateCoordinator], MediaPlayerEnt
             )
         )
 
+    @property
+    def watchdog(self) -> Watchdog | None:
+        """Return the slow call watchdog, if enabled."""
+        return self.coordinator.watchdog
+
     @property
     def meural_device_id(self) -> str:
         """Return the device ID."""
@@ -228,6 +298,11 @@ class MeuralEntity(CoordinatorEntity[CloudDataUpdateCoordinator], MediaPlayerEnt
             self.meural_device_id, self.local_coordinator
         )
 
+        # gsensor is polled while orientationMatch is enabled to detect rotation
+        self.async_on_remove(self.local_coordinator.async_add_field_consumer(("gsensor",)))
+
+        await self._async_restore_last_state()
+
         # Get device info from cloud coordinator
         device_id = self.meural_device_id
         if device_id in self.cloud_coordinator.data["devices"]:
@@ -238,6 +313,27 @@ class MeuralEntity(CoordinatorEntity[CloudDataUpdateCoordinator], MediaPlayerEnt
         # Fetch initial current item if needed
         await self._fetch_current_item_if_needed()
 
+    async def _async_restore_last_state(self) -> None:
+        """Restore state, source and current item metadata from before the restart."""
+        if (last_state := await self.async_get_last_state()) is not None:
+            if last_state.state in (STATE_PLAYING, STATE_PAUSED, STATE_OFF):
+                self._restored_state = last_state.state
+            self._restored_source = last_state.attributes.get(ATTR_INPUT_SOURCE)
+        if (last_extra_data := await self.async_get_last_extra_data()) is not None:
+            current_item = MeuralExtraStoredData.from_dict(last_extra_data.as_dict()).current_item
+            if current_item and self._current_item is None:
+                try:
+                    self._current_item = Item.from_api(current_item)
+                except (KeyError, TypeError, ValueError):
+                    return
+                # Skip refetching the restored item if the Canvas still shows it
+                self._last_fetched_item_id = self._current_item.id
+
+    @property
+    def extra_restore_state_data(self) -> MeuralExtraStoredData:
+        """Return current item metadata to be restored after a restart."""
+        return MeuralExtraStoredData(self._current_item.as_dict() if self._current_item else {})
+
     async def _fetch_current_item_if_needed(self) -> None:
         """Fetch current item information if not an SD-card folder."""
         if not self.local_coordinator.data:
@@ -258,17 +354,19 @@ class MeuralEntity(CoordinatorEntity[CloudDataUpdateCoordinator], MediaPlayerEnt
                         self.name,
                         current_item_id,
                     )
-                    self._current_item = await self.meural.get_item(current_item_id)
+                    self._current_item = await self.cloud_coordinator.async_get_item(current_item_id)
                     self._last_fetched_item_id = current_item_id
+                    self._optimistic_until = 0.0
                     # Update UI with new thumbnail
                     self.async_write_ha_state()
+                self.hass.async_create_task(self._async_prefetch_neighbours(current_gallery, current_item_id))
             except (aiohttp.ClientError, asyncio.TimeoutError, KeyError, InvalidAuth, CannotConnect) as err:
                 _LOGGER.warning(
                     "Meural device %s: Error getting current item information: %s",
                     self.name,
                     err,
                 )
-                self._current_item = {}
+                self._current_item = None
                 # Reset last fetched ID on error to retry next time
                 self._last_fetched_item_id = None
         else:
@@ -277,10 +375,76 @@ class MeuralEntity(CoordinatorEntity[CloudDataUpdateCoordinator], MediaPlayerEnt
                 self.name,
                 current_gallery,
             )
-            self._current_item = {}
+            self._current_item = None
             # Reset last fetched ID when in SD card folder
             self._last_fetched_item_id = None
 
+    def _reported_item_id(self) -> int | None:
+        """Return the item the Canvas reports, if it is in a cloud gallery."""
+        gallery_status = (self.local_coordinator.data or {}).get("gallery_status") or {}
+        try:
+            if int(gallery_status.get("current_gallery", 0)) <= SD_CARD_FOLDER_MAX_ID:
+                return None
+            return int(gallery_status.get("current_item", 0)) or None
+        except (TypeError, ValueError):
+            return None
+
+    def _show_cached_item(self, item_id: int) -> bool:
+        """Show an item from the cloud item cache. Returns False if it is not cached."""
+        if item_id != self._last_fetched_item_id:
+            item = self.cloud_coordinator.cached_item(item_id)
+            if item is None:
+                return False
+            self._current_item = item
+            self._last_fetched_item_id = item_id
+        self._optimistic_until = 0.0
+        return True
+
+    def _neighbour_item_ids(self, gallery_id: str | int, item_id: int) -> tuple[int | None, int | None]:
+        """Return the previous and next item of the Canvas' playlist order, from cache."""
+        items = self.local_coordinator.cached_gallery_items(gallery_id)
+        if not items or str(item_id) not in items:
+            return None, None
+        item_ids = list(items)
+        index = item_ids.index(str(item_id))
+        return int(item_ids[index - 1]), int(item_ids[(index + 1) % len(item_ids)])
+
+    async def _async_prefetch_neighbours(self, gallery_id: int, item_id: int) -> None:
+        """Fetch cloud metadata of the items before and after the current one.
+
+        Next, previous and natural advances can then show the new item from
+        cache as soon as the Canvas reports it.
+        """
+        if gallery_id <= SD_CARD_FOLDER_MAX_ID:
+            return
+        try:
+            await self.local_coordinator.async_get_gallery_items(gallery_id, str(item_id))
+        except (aiohttp.ClientError, asyncio.TimeoutError, DeviceTurnedOff):
+            return
+        neighbours = [neighbour for neighbour in self._neighbour_item_ids(gallery_id, item_id) if neighbour]
+        await self.cloud_coordinator.async_prefetch_items(neighbours)
+        if self.image_cache is not None:
+            items = [self.cloud_coordinator.cached_item(neighbour) for neighbour in neighbours]
+            await self.image_cache.async_prefetch([item.image for item in items if item and item.image], MEDIA_IMAGE_SIZE)
+
+    def _show_neighbour_optimistic(self, offset: int) -> None:
+        """Show the previous (-1) or next (1) item right away if its metadata is cached.
+
+        Shuffled playlists have no predictable next item. The item is kept for
+        OPTIMISTIC_ITEM_GRACE seconds or until the Canvas reports a change.
+        """
+        gallery_status = (self.local_coordinator.data or {}).get("gallery_status") or {}
+        item_id = self._reported_item_id()
+        if item_id is None or self._meural_device.get("imageShuffle"):
+            return
+        previous_id, next_id = self._neighbour_item_ids(gallery_status["current_gallery"], item_id)
+        neighbour = next_id if offset > 0 else previous_id
+        if neighbour is None or not self._show_cached_item(neighbour):
+            return
+        self._optimistic_until = time.monotonic() + OPTIMISTIC_ITEM_GRACE
+        self.async_write_ha_state()
+
+    @watched
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the cloud coordinator."""
         device_id = self.meural_device_id
@@ -290,13 +454,17 @@ class MeuralEntity(CoordinatorEntity[CloudDataUpdateCoordinator], MediaPlayerEnt
             # Update local coordinator's device reference
             self.local_coordinator.update_device(self._meural_device)
 
-        self.async_write_ha_state()
+        if self.coordinator.device_changed(device_id, self._device_fields):
+            self.async_write_ha_state()
 
+    @watched
     def _handle_local_coordinator_update(self) -> None:
         """Handle updated data from the local coordinator."""
-        # Notify cloud coordinator that sleep state may have changed
-        self.cloud_coordinator.notify_sleep_state_changed()
+        if self.local_coordinator.has_changed(("sleeping",)):
+            # Notify cloud coordinator that sleep state may have changed
+            self.cloud_coordinator.notify_sleep_state_changed()
 
+        item_shown = False
         if self.local_coordinator.data:
             # Detect physical rotation via gsensor when orientationMatch is enabled.
             # gallery_status.current_item does not update on orientationMatch switches,
@@ -314,19 +482,42 @@ class MeuralEntity(CoordinatorEntity[CloudDataUpdateCoordinator], MediaPlayerEnt
                     self._last_gsensor,
                     gsensor,
                 )
-                self._current_item = {}
+                self._current_item = None
                 self._last_fetched_item_id = None
                 self.hass.async_create_task(self._reload_gallery_on_orientation_change())
-            else:
+            elif (
+                self.local_coordinator.has_changed(("gallery_status",))
+                or self._last_fetched_item_id is None
+                or (self._optimistic_until and time.monotonic() >= self._optimistic_until)
+            ):
                 # When local data updates, fetch current item if it changed
+                # (or retry after a failed or skipped fetch, or revert an
+                # optimistic item the Canvas did not move to).
                 gallery_status = self.local_coordinator.data.get("gallery_status", {})
                 if gallery_status:
-                    # Schedule fetching current item in the background
-                    self.hass.async_create_task(self._fetch_current_item_if_needed())
+                    # Show a prefetched item right away; otherwise fetch it in the background
+                    item_id = self._reported_item_id()
+                    if item_id is None or not self._show_cached_item(item_id):
+                        self._optimistic_until = 0.0
+                        self.hass.async_create_task(self._fetch_current_item_if_needed())
+                    else:
+                        item_shown = True
+                        self.hass.async_create_task(
+                            self._async_prefetch_neighbours(int(gallery_status.get("current_gallery", 0)), item_id)
+                        )
             if gsensor is not None:
                 self._last_gsensor = gsensor
 
-        self.async_write_ha_state()
+        # A failed or recovered poll changes availability without changing any field
+        local_health = (
+            self.local_coordinator.last_update_success,
+            self.local_coordinator.last_fetch_error is None,
+        )
+        health_changed = local_health != self._local_health
+        self._local_health = local_health
+
+        if item_shown or health_changed or self.local_coordinator.has_changed(self._coordinator_fields):
+            self.async_write_ha_state()
 
 
     @property
@@ -350,12 +541,15 @@ class MeuralEntity(CoordinatorEntity[CloudDataUpdateCoordinator], MediaPlayerEnt
             "manufacturer": "NETGEAR",
             "model": self._meural_device["frameModel"]["name"],
             "sw_version": (self.local_coordinator.data or {}).get("version") or self._meural_device["version"],
-            "configuration_url": f"http://{self._meural_device['localIp']}/remote/",
+            "configuration_url": f"http://{self.local_coordinator.local_meural.ip}/remote/",
         }
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
+        if self.coordinator.local_first and not self.coordinator.last_update_success:
+            # The cloud is unreachable; the Canvas is still controlled over the LAN
+            return self.local_coordinator.last_update_success and self.local_coordinator.last_fetch_error is None
         # Entity is available if coordinators are working and device is not offline
         return (
             self.coordinator.last_update_success
@@ -366,6 +560,8 @@ class MeuralEntity(CoordinatorEntity[CloudDataUpdateCoordinator], MediaPlayerEnt
     @property
     def state(self) -> str:
         """Return the state of the entity."""
+        if self.local_coordinator.data is None and self._restored_state is not None:
+            return self._restored_state
         if self.local_coordinator.sleeping:
             return STATE_OFF
         elif self._meural_device.get("imageDuration", 0) == 0:
@@ -376,7 +572,7 @@ class MeuralEntity(CoordinatorEntity[CloudDataUpdateCoordinator], MediaPlayerEnt
     def source(self) -> str | None:
         """Name of the current playlist."""
         if not self.local_coordinator.data:
-            return None
+            return self._restored_source
         gallery_status = self.local_coordinator.data.get("gallery_status", {})
         return gallery_status.get("current_gallery_name")
 
@@ -385,24 +581,29 @@ class MeuralEntity(CoordinatorEntity[CloudDataUpdateCoordinator], MediaPlayerEnt
         """Flag media player features that are supported."""
         return MEURAL_SUPPORT
 
-    def _cloud_only_galleries(self) -> list[dict]:
-        """Return cloud galleries not yet loaded on this device."""
-        if not self.cloud_coordinator.data or not self.local_coordinator.data:
+    def _remote_galleries(self) -> list[dict]:
+        """Return the cloud galleries of this device and the user, without duplicates."""
+        if not self.cloud_coordinator.data:
             return []
 
-        local_ids = {int(g["id"]) for g in self.local_coordinator.data.get("galleries", [])}
-
         device_galleries = self.cloud_coordinator.data.get("device_galleries", {}).get(self.meural_device_id, [])
         user_galleries = self.cloud_coordinator.data.get("user_galleries", [])
 
         seen_ids: set[int] = set()
-        remote_galleries: list[dict] = []
+        remote_galleries: list[Gallery] = []
         for g in device_galleries + user_galleries:
-            if g["id"] not in seen_ids:
-                seen_ids.add(g["id"])
+            if g.id not in seen_ids:
+                seen_ids.add(g.id)
                 remote_galleries.append(g)
+        return remote_galleries
+
+    def _cloud_only_galleries(self) -> list[Gallery]:
+        """Return cloud galleries not yet loaded on this device."""
+        if not self.cloud_coordinator.data or not self.local_coordinator.data:
+            return []
 
-        return [g for g in remote_galleries if g["id"] not in local_ids]
+        local_ids = {int(g["id"]) for g in self.local_coordinator.data.get("galleries", [])}
+        return [g for g in self._remote_galleries() if g.id not in local_ids]
 
     @property
     def source_list(self) -> list[str]:
@@ -410,7 +611,7 @@ class MeuralEntity(CoordinatorEntity[CloudDataUpdateCoordinator], MediaPlayerEnt
         result = []
         if self.local_coordinator.data:
             result = [g["name"] for g in self.local_coordinator.data.get("galleries", [])]
-        result += [g["name"] for g in self._cloud_only_galleries()]
+        result += [g.name for g in self._cloud_only_galleries()]
         return result
 
     @property
@@ -430,20 +631,20 @@ class MeuralEntity(CoordinatorEntity[CloudDataUpdateCoordinator], MediaPlayerEnt
     @property
     def media_summary(self):
         """Return the summary of current playing media."""
-        return self._current_item.get("description")
+        return self._current_item.description if self._current_item else None
 
     @property
     def media_title(self):
         """Return the title of current playing media."""
-        return self._current_item.get("name")
+        return self._current_item.name if self._current_item else None
 
     @property
     def media_artist(self):
         """Artist of current playing media. Replaced with artist name and the artwork year."""
         if not self._current_item:
             return None
-        artist = self._current_item.get("artistName") or self._current_item.get("author")
-        year = self._current_item.get("year")
+        artist = self._current_item.artist
+        year = self._current_item.year
         if artist and year:
             return f"{artist}, {year}"
         if artist:
@@ -455,12 +656,68 @@ class MeuralEntity(CoordinatorEntity[CloudDataUpdateCoordinator], MediaPlayerEnt
     @property
     def media_image_url(self):
         """Image url of current playing media."""
-        return self._current_item.get("image")
+        return self._current_item.image if self._current_item else None
 
     @property
     def media_image_remotely_accessible(self) -> bool:
-        """If the image url is remotely accessible."""
-        return True
+        """If the image url is remotely accessible.
+
+        Artwork is proxied through Home Assistant when the image cache is enabled.
+        """
+        return self.image_cache is None
+
+    async def async_get_media_image(self) -> tuple[bytes | None, str | None]:
+        """Fetch the image of the current artwork, from the image cache if enabled."""
+        if self.image_cache is None or (url := self.media_image_url) is None:
+            return await super().async_get_media_image()
+        return await self.image_cache.async_get(url, MEDIA_IMAGE_SIZE)
+
+    def _browse_thumbnail(self, url: str | None, media_content_type: str, media_content_id: str) -> str | None:
+        """Return the thumbnail URL of a media browser node.
+
+        With the image cache enabled, this is a Home Assistant proxy URL resolved
+        by async_get_browse_image instead of the Meural image URL.
+        """
+        if url is None or self.image_cache is None:
+            return url
+        return self.get_browse_image_url(media_content_type, str(media_content_id))
+
+    async def _async_browse_image_url(self, media_content_type: str, media_content_id: str) -> str | None:
+        """Return the Meural image URL of an item or playlist in the media browser.
+
+        Only Meural artwork is resolved, so the proxy cannot be used to fetch
+        arbitrary URLs.
+        """
+        if not media_content_id.isdigit():
+            return None
+        if media_content_type == "item":
+            try:
+                item = await self.cloud_coordinator.async_get_item(media_content_id, PRIORITY_BACKGROUND)
+            except (aiohttp.ClientError, asyncio.TimeoutError, InvalidAuth, CannotConnect):
+                return None
+            return item.image
+        if media_content_type == MediaType.PLAYLIST:
+            cover = next((g.cover for g in self._remote_galleries() if str(g.id) == media_content_id), None)
+            if cover is not None:
+                return cover
+            items = self.local_coordinator.cached_gallery_items(media_content_id)
+            if items and (item := self.cloud_coordinator.cached_item(next(iter(items)))) is not None:
+                return item.image
+        return None
+
+    async def async_get_browse_image(
+        self,
+        media_content_type: str,
+        media_content_id: str,
+        media_image_id: str | None = None,
+    ) -> tuple[bytes | None, str | None]:
+        """Serve a media browser thumbnail from the image cache."""
+        if self.image_cache is None:
+            return None, None
+        url = await self._async_browse_image_url(media_content_type, media_content_id)
+        if url is None:
+            return None, None
+        return await self.image_cache.async_get(url, BROWSE_THUMBNAIL_SIZE)
 
     @property
     def shuffle(self):
@@ -579,17 +836,10 @@ class MeuralEntity(CoordinatorEntity[CloudDataUpdateCoordinator], MediaPlayerEnt
 
         if resolved_id is None:
             # Look up by name in cloud coordinator data
-            device_galleries = self.cloud_coordinator.data.get("device_galleries", {}).get(self.meural_device_id, [])
-            user_galleries = self.cloud_coordinator.data.get("user_galleries", [])
-            seen_ids: set[int] = set()
-            all_galleries: list[dict] = []
-            for g in device_galleries + user_galleries:
-                if g["id"] not in seen_ids:
-                    seen_ids.add(g["id"])
-                    all_galleries.append(g)
-            match = next((g for g in all_galleries if g["name"] == gallery_name), None)
+            all_galleries = self._remote_galleries()
+            match = next((g for g in all_galleries if g.name == gallery_name), None)
             if match is None:
-                available_names = [g["name"] for g in all_galleries]
+                available_names = [g.name for g in all_galleries]
                 _LOGGER.error(
                     "Meural device %s: Load playlist. Gallery '%s' not found in cloud data. Available galleries: %s",
                     self.name,
@@ -597,7 +847,7 @@ class MeuralEntity(CoordinatorEntity[CloudDataUpdateCoordinator], MediaPlayerEnt
                     available_names,
                 )
                 return
-            resolved_id = match["id"]
+            resolved_id = match.id
 
         _LOGGER.info(
             "Meural device %s: Load playlist. Loading gallery ID %s from cloud",
@@ -663,10 +913,10 @@ class MeuralEntity(CoordinatorEntity[CloudDataUpdateCoordinator], MediaPlayerEnt
                 return
 
         # Not on device — load via cloud API
-        cloud_gallery = next((g for g in self._cloud_only_galleries() if g["name"] == source), None)
+        cloud_gallery = next((g for g in self._cloud_only_galleries() if g.name == source), None)
         if cloud_gallery is not None:
-            _LOGGER.info("Meural device %s: Selecting source. Gallery %s not on device, loading via cloud API, ID %s", self.name, source, cloud_gallery["id"])
-            await self.meural.device_load_gallery(self.meural_device_id, cloud_gallery["id"])
+            _LOGGER.info("Meural device %s: Selecting source. Gallery %s not on device, loading via cloud API, ID %s", self.name, source, cloud_gallery.id)
+            await self.meural.device_load_gallery(self.meural_device_id, cloud_gallery.id)
             await self._refresh_after_user_action()
             return
 
@@ -678,6 +928,7 @@ class MeuralEntity(CoordinatorEntity[CloudDataUpdateCoordinator], MediaPlayerEnt
             await self.local_meural.send_key_right()
         else:
             await self.local_meural.send_key_left()
+        self._show_neighbour_optimistic(-1)
         # Refresh immediately to update thumbnail
         await self._refresh_after_user_action()
 
@@ -687,6 +938,7 @@ class MeuralEntity(CoordinatorEntity[CloudDataUpdateCoordinator], MediaPlayerEnt
             await self.local_meural.send_key_left()
         else:
             await self.local_meural.send_key_right()
+        self._show_neighbour_optimistic(1)
         # Refresh immediately to update thumbnail
         await self._refresh_after_user_action()
 
@@ -787,9 +1039,8 @@ class MeuralEntity(CoordinatorEntity[CloudDataUpdateCoordinator], MediaPlayerEnt
                     _LOGGER.warning("Meural device %s: Playing media. Current gallery not available", self.name)
                     return
 
-                currentitems = await self.local_meural.send_get_items_by_gallery(currentgallery_id)
-                in_playlist = next((g["title"] for g in currentitems if g["id"] == media_id), None)
-                if in_playlist is None:
+                currentitems = await self.local_coordinator.async_get_gallery_items(currentgallery_id, media_id)
+                if media_id not in currentitems:
                     _LOGGER.info("Meural device %s: Playing media. Item %s is not in current gallery, trying to display via Meural server", self.name, media_id)
                     try:
                         await self.meural.device_load_item(self.meural_device_id, media_id)
@@ -809,6 +1060,134 @@ class MeuralEntity(CoordinatorEntity[CloudDataUpdateCoordinator], MediaPlayerEnt
         else:
             _LOGGER.error("Meural device %s: Playing media. Does not support displaying this %s media with ID %s", self.name, media_type, media_id)
 
+    async def _async_browse_playlist(self, media_content_id: str) -> BrowseMedia:
+        """Return one page of the items of a playlist.
+
+        Media content IDs are the gallery ID, followed by /page for later pages.
+        Playlists on the Canvas are listed by the Canvas, with thumbnails from
+        the cloud; cloud-only playlists are paged from the cloud.
+        """
+        gallery_id, _, page_number = str(media_content_id).partition("/")
+        page = int(page_number) if page_number.isdigit() else 1
+        if not self.local_coordinator.data or not self.cloud_coordinator.data or not gallery_id.isdigit():
+            raise BrowseError(f"Media not found: {MediaType.PLAYLIST} / {media_content_id}")
+
+        local_gallery = next(
+            (g for g in self.local_coordinator.data.get("galleries", []) if str(g["id"]) == gallery_id), None
+        )
+        try:
+            if local_gallery is not None:
+                title = local_gallery["name"]
+                local_items = list((await self.local_coordinator.async_get_gallery_items(gallery_id)).values())
+                page_items = local_items[(page - 1) * BROWSE_PAGE_SIZE:page * BROWSE_PAGE_SIZE]
+                has_more = page * BROWSE_PAGE_SIZE < len(local_items)
+                if int(gallery_id) > SD_CARD_FOLDER_MAX_ID:
+                    await self._async_prefetch_thumbnails(gallery_id, page, [item["id"] for item in page_items])
+                items = [
+                    (str(item["id"]), item.get("title"), self.cloud_coordinator.cached_item(item["id"]))
+                    for item in page_items
+                ]
+            else:
+                gallery = next((g for g in self._cloud_only_galleries() if str(g.id) == gallery_id), None)
+                if gallery is None:
+                    raise BrowseError(f"Media not found: {MediaType.PLAYLIST} / {media_content_id}")
+                title = gallery.name
+                cloud_items = await self.cloud_coordinator.async_get_gallery_page(gallery_id, page, PRIORITY_USER)
+                item_count = gallery.item_count
+                has_more = (
+                    page * BROWSE_PAGE_SIZE < item_count
+                    if isinstance(item_count, int)
+                    else len(cloud_items) == BROWSE_PAGE_SIZE
+                )
+                items = [(str(item.id), item.name, item) for item in cloud_items]
+        except (aiohttp.ClientError, asyncio.TimeoutError, InvalidAuth, CannotConnect) as err:
+            raise BrowseError(f"Could not load playlist {gallery_id}: {err}") from err
+
+        _LOGGER.debug("Meural device %s: Browsing media. Playlist %s page %d has %d items", self.name, gallery_id, page, len(items))
+        children = [
+            BrowseMedia(
+                title=(item.name if item else None) or item_title or f"Item {item_id}",
+                media_class=MediaClass.IMAGE,
+                media_content_id=item_id,
+                media_content_type="item",
+                can_play=True,
+                can_expand=False,
+                thumbnail=self._browse_thumbnail(item.image if item else None, "item", item_id),
+            )
+            for item_id, item_title, item in items
+        ]
+        if has_more:
+            children.append(BrowseMedia(
+                title="More…",
+                media_class=MediaClass.DIRECTORY,
+                media_content_id=f"{gallery_id}/{page + 1}",
+                media_content_type=MediaType.PLAYLIST,
+                can_play=False,
+                can_expand=True,
+            ))
+        return BrowseMedia(
+            title=title if page == 1 else f"{title} ({page})",
+            media_class=MediaClass.PLAYLIST,
+            media_content_id=media_content_id,
+            media_content_type=MediaType.PLAYLIST,
+            can_play=page == 1,
+            can_expand=True,
+            children=children,
+        )
+
+    async def _async_prefetch_thumbnails(self, gallery_id: str, page: int, item_ids: list[str]) -> None:
+        """Fetch cloud metadata of the items on a page of a playlist on the Canvas.
+
+        A playlist that also exists in the cloud is first filled from the same
+        page there, in one request. Items still missing are fetched one by one
+        in the background; the page is shown without their thumbnails if that
+        takes longer than BROWSE_PREFETCH_TIMEOUT, and they are cached for the
+        next time it is opened.
+        """
+        if any(self.cloud_coordinator.cached_item(item_id) is None for item_id in item_ids):
+            if any(str(g.id) == gallery_id for g in self._remote_galleries()):
+                try:
+                    await self.cloud_coordinator.async_get_gallery_page(gallery_id, page, PRIORITY_USER)
+                except (aiohttp.ClientError, asyncio.TimeoutError, InvalidAuth, CannotConnect) as err:
+                    _LOGGER.debug("Meural device %s: Browsing media. Could not load cloud items of playlist %s: %s", self.name, gallery_id, err)
+        prefetch = self.hass.async_create_task(self.cloud_coordinator.async_prefetch_items(item_ids))
+        await asyncio.wait({prefetch}, timeout=BROWSE_PREFETCH_TIMEOUT)
+
+    @watched
+    async def async_search_media(self, query: SearchMediaQuery) -> SearchMedia:
+        """Search the artwork and playlists of the account in the library index."""
+        kinds = [KIND_ITEM, KIND_GALLERY]
+        if query.media_filter_classes:
+            kinds = [
+                kind
+                for kind, media_class in ((KIND_ITEM, MediaClass.IMAGE), (KIND_GALLERY, MediaClass.PLAYLIST))
+                if media_class in query.media_filter_classes
+            ]
+        results = []
+        if kinds:
+            results = self.cloud_coordinator.library.search(
+                query.search_query, kinds[0] if len(kinds) == 1 else None, BROWSE_PAGE_SIZE
+            )
+        _LOGGER.debug("Meural device %s: Searching media. %d results for %s", self.name, len(results), query.search_query)
+        return SearchMedia(
+            result=[
+                BrowseMedia(
+                    title=record["name"] or f"Item {record['id']}",
+                    media_class=MediaClass.IMAGE if record["type"] == KIND_ITEM else MediaClass.PLAYLIST,
+                    media_content_id=record["id"],
+                    media_content_type="item" if record["type"] == KIND_ITEM else MediaType.PLAYLIST,
+                    can_play=True,
+                    can_expand=record["type"] == KIND_GALLERY,
+                    thumbnail=self._browse_thumbnail(
+                        record["image"],
+                        "item" if record["type"] == KIND_ITEM else MediaType.PLAYLIST,
+                        record["id"],
+                    ),
+                )
+                for record in results
+            ]
+        )
+
     async def async_preview_image(self, content_url, content_type):
         """Preview image from URL."""
         if content_type in [ 'image/jpg', 'image/png', 'image/jpeg' ]:
@@ -817,6 +1196,7 @@ class MeuralEntity(CoordinatorEntity[CloudDataUpdateCoordinator], MediaPlayerEnt
         else:
             _LOGGER.error("Meural device %s: Previewing image. Does not support media type %s", self.name, content_type)
 
+    @watched
     async def async_browse_media(self, media_content_type=None, media_content_id=None):
         """Implement the websocket media browsing helper."""
         _LOGGER.debug("Meural device %s: Browsing media. Media_content_type is %s, media_content_id is %s", self.name, media_content_type, media_content_id)
@@ -874,27 +1254,20 @@ class MeuralEntity(CoordinatorEntity[CloudDataUpdateCoordinator], MediaPlayerEnt
                 await self.cloud_coordinator.async_refresh_galleries()
 
             local_galleries = self.local_coordinator.data.get("galleries", [])
-            device_galleries = self.cloud_coordinator.data.get("device_galleries", {}).get(self.meural_device_id, [])
-            user_galleries = self.cloud_coordinator.data.get("user_galleries", [])
-
-            # Combine device and user galleries
-            remote_galleries = device_galleries.copy()
-            for x in user_galleries:
-                if x not in remote_galleries:
-                    remote_galleries.append(x)
+            remote_galleries = self._remote_galleries()
 
             _LOGGER.info("Meural device %s: Browsing media. Has %d local galleries, %d remote galleries", self.name, len(local_galleries), len(remote_galleries))
 
             for g in local_galleries:
-                thumb = next((h["cover"] for h in remote_galleries if h["id"] == int(g["id"])), None)
+                thumb = next((h.cover for h in remote_galleries if h.id == int(g["id"])), None)
                 if thumb is None and (int(g["id"]) > SD_CARD_FOLDER_MAX_ID):
                     _LOGGER.debug("Meural device %s: Browsing media. Gallery %s misses thumbnail, getting gallery items", self.name, g["id"])
-                    album_items = await self.local_meural.send_get_items_by_gallery(g["id"])
+                    album_items = list((await self.local_coordinator.async_get_gallery_items(g["id"])).values())
                     if album_items:
                         _LOGGER.info("Meural device %s: Browsing media. Replacing missing thumbnail of gallery %s with first gallery item image. Getting information from Meural server for item %s", self.name, g["id"], album_items[0]["id"])
                         try:
-                            first_item = await self.meural.get_item(album_items[0]["id"])
-                            thumb = first_item["image"]
+                            first_item = await self.cloud_coordinator.async_get_item(album_items[0]["id"], PRIORITY_BACKGROUND)
+                            thumb = first_item.image
                         except (aiohttp.ClientError, asyncio.TimeoutError, KeyError) as err:
                             _LOGGER.warning(
                                 "Meural device %s: Browsing media. Could not fetch thumbnail for gallery %s item %s from Meural cloud: %s",
@@ -911,25 +1284,28 @@ class MeuralEntity(CoordinatorEntity[CloudDataUpdateCoordinator], MediaPlayerEnt
                     media_content_id=g["id"],
                     media_content_type=MediaType.PLAYLIST,
                     can_play=True,
-                    can_expand=False,
-                    thumbnail=thumb,
+                    can_expand=True,
+                    thumbnail=self._browse_thumbnail(thumb, MediaType.PLAYLIST, g["id"]),
                     )
                 )
 
             # Cloud-only galleries (not yet on device)
             for g in self._cloud_only_galleries():
                 response.children.append(BrowseMedia(
-                    title=g["name"],
+                    title=g.name,
                     media_class=MediaType.PLAYLIST,
-                    media_content_id=str(g["id"]),
+                    media_content_id=str(g.id),
                     media_content_type=MediaType.PLAYLIST,
                     can_play=True,
-                    can_expand=False,
-                    thumbnail=g.get("cover"),
+                    can_expand=True,
+                    thumbnail=self._browse_thumbnail(g.cover, MediaType.PLAYLIST, g.id),
                     )
                 )
             return response
 
+        elif media_content_type == MediaType.PLAYLIST:
+            return await self._async_browse_playlist(media_content_id)
+
         else:
             _LOGGER.error("Meural device %s: Browsing media. Media not found, media_content_type is %s, media_content_id is %s", self.name, media_content_type, media_content_id)
             raise BrowseError(
@@ -0,0 +1,167 @@
+"""On-demand CPU and asyncio task profiling of the Meural integration."""
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+import cProfile
+import io
+import os
+import pstats
+from typing import Any
+
+INTEGRATION_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Interval (in seconds) between samples of what the integration's tasks await
+TASK_SAMPLE_INTERVAL = 0.1
+
+# Number of rows of the full profile written to the report
+REPORT_ROWS = 80
+
+# API client methods that await aiohttp directly
+HTTP_CLIENT_METHODS = ("pymeural.py:request", "pymeural.py:_send_request", "pymeural.py:send_postcard")
+
+
+def _task_location(task: asyncio.Task[Any]) -> str | None:
+    """Return where a task of the integration is waiting, or None for other tasks.
+
+    Walks the chain of awaited coroutines down to the innermost one and names
+    the deepest integration coroutine and what it is awaiting.
+    """
+    awaitable: Any = task.get_coro()
+    integration_code = None
+    awaiting = None
+    while awaitable is not None:
+        frame = getattr(awaitable, "cr_frame", None) or getattr(awaitable, "gi_frame", None)
+        if frame is None:
+            # A future or a wrapped coroutine without an accessible frame
+            if integration_code is not None and awaiting is None:
+                awaiting = type(awaitable).__name__
+            break
+        code = frame.f_code
+        if code.co_filename.startswith(INTEGRATION_DIR):
+            integration_code = code
+            awaiting = None
+        elif integration_code is not None and awaiting is None:
+            awaiting = f"{os.sep.join(code.co_filename.split(os.sep)[-2:])}:{code.co_name}"
+        awaitable = getattr(awaitable, "cr_await", None) or getattr(awaitable, "gi_yieldfrom", None)
+    if integration_code is None:
+        return None
+    location = f"{os.path.relpath(integration_code.co_filename, INTEGRATION_DIR)}:{integration_code.co_name}"
+    return f"{location} awaiting {awaiting}" if awaiting else location
+
+
+class TaskSampler:
+    """Periodically count where the integration's asyncio tasks are waiting."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, exclude: asyncio.Task[Any] | None = None) -> None:
+        """Initialize the sampler, ignoring the task running the profile itself."""
+        self._loop = loop
+        self._exclude = exclude
+        self._handle: asyncio.TimerHandle | None = None
+        self.samples = 0
+        self.locations: Counter[str] = Counter()
+
+    def start(self) -> None:
+        """Start sampling."""
+        self._sample()
+
+    def stop(self) -> None:
+        """Stop sampling."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    def _sample(self) -> None:
+        self.samples += 1
+        for task in asyncio.all_tasks(self._loop):
+            if task is self._exclude:
+                continue
+            if (location := _task_location(task)) is not None:
+                self.locations[location] += 1
+        self._handle = self._loop.call_later(TASK_SAMPLE_INTERVAL, self._sample)
+
+
+def _is_http_wait(location: str) -> bool:
+    """Return True if a task location is an API client waiting on aiohttp."""
+    client_method, _, awaiting = location.partition(" awaiting ")
+    # aiohttp's request context manager hides its coroutine behind a wrapper
+    return client_method in HTTP_CLIENT_METHODS and (
+        awaiting == "coroutine_wrapper" or awaiting.startswith(f"aiohttp{os.sep}")
+    )
+
+
+def _is_integration(func: tuple[str, int, str]) -> bool:
+    return func[0].startswith(INTEGRATION_DIR)
+
+
+def _label(func: tuple[str, int, str]) -> str:
+    filename, line, name = func
+    if _is_integration(func):
+        filename = os.path.relpath(filename, INTEGRATION_DIR)
+    return f"{filename}:{line}({name})"
+
+
+def summarize(
+    profiler: cProfile.Profile, sampler: TaskSampler, duration: float, top: int
+) -> tuple[dict[str, Any], str]:
+    """Return a hot path summary and the full text report. Does CPU-heavy work."""
+    stream = io.StringIO()
+    stats = pstats.Stats(profiler, stream=stream)
+    entries: dict[tuple[str, int, str], tuple[Any, ...]] = stats.stats  # type: ignore[attr-defined]
+
+    integration_cpu = sum(tt for func, (_, _, tt, _, _) in entries.items() if _is_integration(func))
+    json_time = sum(
+        ct
+        for (filename, _, name), (_, _, _, ct, _) in entries.items()
+        if (filename.endswith(os.path.join("json", "__init__.py")) and name in ("loads", "dumps"))
+        or name in ("<built-in method orjson.loads>", "<built-in method orjson.dumps>")
+    )
+    state_write_time = sum(
+        ct
+        for (filename, _, name), (_, _, _, ct, _) in entries.items()
+        if name == "async_write_ha_state" and filename.endswith(os.path.join("helpers", "entity.py"))
+    )
+    task_samples = sum(sampler.locations.values())
+    http_samples = sum(
+        count for location, count in sampler.locations.items() if _is_http_wait(location)
+    )
+
+    hot_paths = sorted(
+        ((func, values) for func, values in entries.items() if _is_integration(func)),
+        key=lambda item: item[1][3],
+        reverse=True,
+    )[:top]
+    summary = {
+        "duration": duration,
+        "integration_cpu_ms": round(1000 * integration_cpu, 1),
+        "json_ms": round(1000 * json_time, 1),
+        "state_writes_ms": round(1000 * state_write_time, 1),
+        "http_wait_share": round(http_samples / task_samples, 3) if task_samples else None,
+        "hot_paths": [
+            {
+                "function": _label(func),
+                "calls": calls,
+                "own_ms": round(1000 * tt, 1),
+                "cumulative_ms": round(1000 * ct, 1),
+            }
+            for func, (_, calls, tt, ct, _) in hot_paths
+        ],
+        "waiting": [
+            {"location": location, "share": round(count / task_samples, 3)}
+            for location, count in sampler.locations.most_common(top)
+        ],
+    }
+
+    stream.write(f"Meural profile over {duration} seconds\n\n")
+    stream.write(f"Integration CPU time: {summary['integration_cpu_ms']} ms\n")
+    stream.write(f"JSON encoding/decoding (process-wide): {summary['json_ms']} ms\n")
+    stream.write(f"Entity state writes (process-wide): {summary['state_writes_ms']} ms\n")
+    stream.write(f"Task samples: {sampler.samples}, integration task observations: {task_samples}\n\n")
+    stream.write("Where integration tasks were waiting:\n")
+    for location, count in sampler.locations.most_common():
+        stream.write(f"  {count:6d}  {location}\n")
+    stream.write("\nIntegration functions by cumulative time:\n")
+    stats.sort_stats("cumulative").print_stats(INTEGRATION_DIR, REPORT_ROWS)
+    stream.write("\nAll functions by cumulative time:\n")
+    stats.sort_stats("cumulative").print_stats(REPORT_ROWS)
+    return summary, stream.getvalue()
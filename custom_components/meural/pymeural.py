@@ -1,20 +1,26 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import heapq
+import itertools
 import logging
 import json
+import random
 import time
+from collections.abc import AsyncIterator
 from typing import Any, Callable, NoReturn
 
 import aiohttp
 import async_timeout
-import boto3
-from botocore.exceptions import ClientError as BotoClientError
 
 from aiohttp.client_exceptions import ClientResponseError
 
 from homeassistant.exceptions import HomeAssistantError
 
+from .stats import RequestStats
+from .traffic import TrafficRecorder, local_host
+
 _LOGGER = logging.getLogger(__name__)
 
 BASE_URL = "https://api.meural.com/v0/"
@@ -29,8 +35,26 @@ AUTH_CLIENT_CLIENTID = "487bd4kvb1fnop6mbgk8gu5ibf"
 COGNITO_INVALID_CREDENTIAL_CODES = {"NotAuthorizedException", "UserNotFoundException"}
 
 
+@functools.cache
+def _cognito_client() -> Any:
+    """Return the Cognito client, importing boto3 on first use.
+
+    Importing boto3 and loading its service model takes long enough to stall
+    the event loop, so this only runs in the executor, and only once a token
+    actually needs to be fetched.
+    """
+    import boto3  # pylint: disable=import-outside-toplevel
+
+    return boto3.client(AUTH_CLIENT_NAME, region_name=AUTH_CLIENT_REGION)
+
+
 def _raise_for_auth_error(err: Exception) -> NoReturn:
-    """Classify an auth-request exception as InvalidAuth or CannotConnect."""
+    """Classify an auth-request exception as InvalidAuth or CannotConnect.
+
+    Called in the executor, where botocore has already been imported.
+    """
+    from botocore.exceptions import ClientError as BotoClientError  # pylint: disable=import-outside-toplevel
+
     if isinstance(err, BotoClientError):
         code = err.response.get("Error", {}).get("Code", "")
         if code in COGNITO_INVALID_CREDENTIAL_CODES:
@@ -63,6 +87,186 @@ def _get_auth_backoff_state(username: str) -> dict[str, Any]:
     )
 
 
+# Cloud request priorities. Lower values are served first by the account's rate
+# limiter, so user-initiated commands preempt background polls and prefetching.
+PRIORITY_USER = 0
+PRIORITY_POLL = 1
+PRIORITY_BACKGROUND = 2
+_PRIORITY_NAMES = {PRIORITY_USER: "user", PRIORITY_POLL: "poll", PRIORITY_BACKGROUND: "background"}
+
+# Token bucket pacing all cloud requests of one account: sustained requests per
+# second, and the burst size available after a quiet period. Background requests
+# only proceed while more than CLOUD_RATE_BACKGROUND_RESERVE tokens remain, so
+# gallery refreshes and thumbnail prefetching yield as soon as the bucket runs low.
+# They also draw from a sub-budget of their own, so a long gallery refresh never
+# uses more than CLOUD_BACKGROUND_RATE_LIMIT of the account's sustained rate and
+# polls and user commands keep the rest.
+CLOUD_RATE_LIMIT = 5.0
+CLOUD_RATE_BURST = 20
+CLOUD_RATE_BACKGROUND_RESERVE = 4
+CLOUD_BACKGROUND_RATE_LIMIT = 3.0
+CLOUD_BACKGROUND_RATE_BURST = 5
+
+# Retry policy for idempotent cloud GET requests: at most CLOUD_RETRY_MAX_ATTEMPTS
+# attempts with full-jitter exponential backoff, all within CLOUD_RETRY_DEADLINE
+# seconds. Latency-sensitive reads send a hedged copy after CLOUD_HEDGE_DELAY.
+CLOUD_REQUEST_TIMEOUT = 10
+CLOUD_RETRY_MAX_ATTEMPTS = 3
+CLOUD_RETRY_BACKOFF_BASE = 1.0
+CLOUD_RETRY_BACKOFF_MAX = 8.0
+CLOUD_RETRY_DEADLINE = 30
+CLOUD_HEDGE_DELAY = 1.5
+
+# Records per page when listing user items, galleries and devices. Lists are
+# streamed page by page until a short page, so large libraries are no longer
+# truncated and each response stays small.
+CLOUD_PAGE_SIZE = 100
+
+
+class CloudRateLimiter:
+    """Token bucket rate limiter with priority classes for cloud requests."""
+
+    def __init__(
+        self,
+        rate: float = CLOUD_RATE_LIMIT,
+        burst: int = CLOUD_RATE_BURST,
+        background_reserve: int = CLOUD_RATE_BACKGROUND_RESERVE,
+        background_rate: float = CLOUD_BACKGROUND_RATE_LIMIT,
+        background_burst: int = CLOUD_BACKGROUND_RATE_BURST,
+    ) -> None:
+        """Initialize the rate limiter with full buckets."""
+        self.rate = rate
+        self.burst = burst
+        self.background_reserve = background_reserve
+        self.background_rate = min(background_rate, rate)
+        self.background_burst = background_burst
+        self._tokens = float(burst)
+        self._background_tokens = float(background_burst)
+        self._last_refill = time.monotonic()
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+        self._wakeup: asyncio.TimerHandle | None = None
+        self._granted = {PRIORITY_USER: 0, PRIORITY_POLL: 0, PRIORITY_BACKGROUND: 0}
+        self._throttled = {PRIORITY_USER: 0, PRIORITY_POLL: 0, PRIORITY_BACKGROUND: 0}
+        self._wait_time = {PRIORITY_USER: 0.0, PRIORITY_POLL: 0.0, PRIORITY_BACKGROUND: 0.0}
+        self._max_queue_depth = 0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+        self._background_tokens = min(
+            self.background_burst, self._background_tokens + elapsed * self.background_rate
+        )
+        self._last_refill = now
+
+    def _required_tokens(self, priority: int) -> float:
+        """Return the tokens that must be available before serving this priority."""
+        return 1 + (self.background_reserve if priority >= PRIORITY_BACKGROUND else 0)
+
+    def _delay(self, priority: int) -> float:
+        """Return how long a request of this priority must wait for tokens, 0 if none."""
+        delay = max(0.0, (self._required_tokens(priority) - self._tokens) / self.rate)
+        if priority >= PRIORITY_BACKGROUND:
+            delay = max(delay, (1 - self._background_tokens) / self.background_rate)
+        return delay
+
+    def _take(self, priority: int) -> None:
+        self._tokens -= 1
+        if priority >= PRIORITY_BACKGROUND:
+            self._background_tokens -= 1
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of requests currently waiting for a token."""
+        return sum(1 for _, _, future in self._waiters if not future.done())
+
+    def queued_ahead(self, priority: int) -> int:
+        """Return the number of waiting requests of the given or a higher priority."""
+        return sum(1 for waiting, _, future in self._waiters if waiting <= priority and not future.done())
+
+    @property
+    def under_pressure(self) -> bool:
+        """Return True if requests are queued or the bucket is nearly empty."""
+        self._refill()
+        return bool(self.queue_depth) or self._tokens < self._required_tokens(PRIORITY_BACKGROUND)
+
+    async def acquire(self, priority: int = PRIORITY_POLL) -> None:
+        """Wait until a request of the given priority may be sent."""
+        self._refill()
+        if not self.queue_depth and not self._delay(priority):
+            self._take(priority)
+            self._granted[priority] += 1
+            return
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        self._throttled[priority] += 1
+        self._max_queue_depth = max(self._max_queue_depth, self.queue_depth)
+        _LOGGER.debug(
+            "Meural: Cloud rate limit reached, queueing %s request (%d waiting)",
+            _PRIORITY_NAMES[priority],
+            self.queue_depth,
+        )
+        started = time.monotonic()
+        self._schedule_dispatch()
+        try:
+            await future
+        finally:
+            self._wait_time[priority] += time.monotonic() - started
+            if future.cancelled():
+                # Let the next waiter take the slot this one was scheduled for.
+                self._schedule_dispatch()
+        self._granted[priority] += 1
+
+    def _schedule_dispatch(self) -> None:
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+            self._wakeup = None
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Release waiters in priority order while tokens are available."""
+        self._wakeup = None
+        self._refill()
+        while self._waiters:
+            priority, _, future = self._waiters[0]
+            if future.done():
+                heapq.heappop(self._waiters)
+                continue
+            delay = self._delay(priority)
+            if delay:
+                self._wakeup = asyncio.get_running_loop().call_later(delay, self._dispatch)
+                return
+            heapq.heappop(self._waiters)
+            self._take(priority)
+            future.set_result(None)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return limiter statistics for diagnostics."""
+        self._refill()
+        return {
+            "tokens": round(self._tokens, 2),
+            "background_tokens": round(self._background_tokens, 2),
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self._max_queue_depth,
+            "granted": {_PRIORITY_NAMES[p]: count for p, count in self._granted.items()},
+            "throttled": {_PRIORITY_NAMES[p]: count for p, count in self._throttled.items()},
+            "wait_seconds": {_PRIORITY_NAMES[p]: round(total, 3) for p, total in self._wait_time.items()},
+        }
+
+
+# Rate limiters keyed by account email, kept at module scope for the same reason as
+# _AUTH_BACKOFF_STATE: pacing must hold across PyMeural instances recreated by setup
+# retries and reloads, or a retry storm would start every burst with a full bucket.
+_RATE_LIMITERS: dict[str, CloudRateLimiter] = {}
+
+
+def get_rate_limiter(username: str) -> CloudRateLimiter:
+    """Return the cloud rate limiter shared by all clients of an account."""
+    return _RATE_LIMITERS.setdefault(username, CloudRateLimiter())
+
+
 async def authenticate(
     session: aiohttp.ClientSession, username: str, password: str
 ) -> tuple[str, str]:
@@ -70,18 +274,17 @@ async def authenticate(
     _LOGGER.info('Meural: Authenticating with username and password')
 
     def initiate_auth():
-        client = boto3.client(AUTH_CLIENT_NAME, region_name=AUTH_CLIENT_REGION)
-        return client.initiate_auth(
-            ClientId=AUTH_CLIENT_CLIENTID,
-            AuthFlow="USER_PASSWORD_AUTH",
-            AuthParameters={"USERNAME": username, "PASSWORD": password},
-        )
+        try:
+            return _cognito_client().initiate_auth(
+                ClientId=AUTH_CLIENT_CLIENTID,
+                AuthFlow="USER_PASSWORD_AUTH",
+                AuthParameters={"USERNAME": username, "PASSWORD": password},
+            )
+        except Exception as err:
+            _LOGGER.warning("Meural: Authentication request failed: %s", err)
+            _raise_for_auth_error(err)
 
-    try:
-        response = await asyncio.to_thread(initiate_auth)
-    except Exception as err:
-        _LOGGER.warning("Meural: Authentication request failed: %s", err)
-        _raise_for_auth_error(err)
+    response = await asyncio.to_thread(initiate_auth)
 
     if "AuthenticationResult" in response:
         auth_result = response["AuthenticationResult"]
@@ -104,18 +307,17 @@ async def refresh_access_token(
     _LOGGER.info('Meural: Refreshing access token using refresh token')
 
     def initiate_auth_refresh():
-        client = boto3.client(AUTH_CLIENT_NAME, region_name=AUTH_CLIENT_REGION)
-        return client.initiate_auth(
-            ClientId=AUTH_CLIENT_CLIENTID,
-            AuthFlow="REFRESH_TOKEN_AUTH",
-            AuthParameters={"REFRESH_TOKEN": refresh_token},
-        )
+        try:
+            return _cognito_client().initiate_auth(
+                ClientId=AUTH_CLIENT_CLIENTID,
+                AuthFlow="REFRESH_TOKEN_AUTH",
+                AuthParameters={"REFRESH_TOKEN": refresh_token},
+            )
+        except Exception as err:
+            _LOGGER.warning("Meural: Failed to refresh token: %s", err)
+            _raise_for_auth_error(err)
 
-    try:
-        response = await asyncio.to_thread(initiate_auth_refresh)
-    except Exception as err:
-        _LOGGER.warning("Meural: Failed to refresh token: %s", err)
-        _raise_for_auth_error(err)
+    response = await asyncio.to_thread(initiate_auth_refresh)
 
     if "AuthenticationResult" in response:
         access_token = response["AuthenticationResult"]["AccessToken"]
@@ -139,29 +341,145 @@ class PyMeural:
         token_update_callback: Callable[[str, str], None],
         session: aiohttp.ClientSession,
         refresh_token: str | None = None,
+        base_url: str = BASE_URL,
     ) -> None:
-        """Initialize PyMeural client."""
+        """Initialize PyMeural client.
+
+        base_url can point the client at another server, such as the offline
+        stand-in used by the benchmarks.
+        """
         self.username = username
         self.password = password
         self.session = session
+        self.base_url = base_url
         self.token = token
         self.refresh_token = refresh_token
         self.token_update_callback = token_update_callback
         self._auth_lock = asyncio.Lock()
+        self.rate_limiter = get_rate_limiter(username)
+        self.stats = RequestStats()
+        # Set while the record_traffic service captures requests
+        self.recorder: TrafficRecorder | None = None
 
-    async def request(self, method: str, path: str, data: dict[str, Any] | None = None) -> dict[str, Any]:
+    async def request(
+        self,
+        method: str,
+        path: str,
+        data: dict[str, Any] | None = None,
+        priority: int = PRIORITY_POLL,
+        hedge: bool = False,
+    ) -> dict[str, Any]:
+        """Send a request to the Meural cloud API and return its data.
+
+        Idempotent GET requests are retried on server errors, connection errors and
+        timeouts with jittered exponential backoff, within an overall deadline. With
+        hedge=True, a slow GET is raced against a second identical request.
+        """
+        deadline = time.monotonic() + CLOUD_RETRY_DEADLINE
+        attempt = 1
+        while True:
+            try:
+                if hedge and method == "get":
+                    return await self._send_hedged_request(path, data, priority)
+                return await self._send_request(method, path, data, priority)
+            except ClientResponseError as err:
+                delay = self._retry_delay(method, err, attempt, deadline, priority)
+                if delay is None:
+                    if err.status != 401:
+                        _LOGGER.error(
+                            "Meural: Sending request to %s failed with status %s: %s",
+                            path, err.status, err.message,
+                        )
+                    raise
+            except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+                delay = self._retry_delay(method, err, attempt, deadline, priority)
+                if delay is None:
+                    _LOGGER.error('Meural: Sending Request failed. Raising: %s', err)
+                    raise
+            _LOGGER.debug(
+                "Meural: Request to %s failed, retrying in %.1fs (attempt %d of %d)",
+                path, delay, attempt, CLOUD_RETRY_MAX_ATTEMPTS,
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def _retry_delay(
+        self, method: str, err: Exception, attempt: int, deadline: float, priority: int
+    ) -> float | None:
+        """Return how long to wait before retrying a failed request, or None to give up."""
+        if method != "get" or attempt >= CLOUD_RETRY_MAX_ATTEMPTS:
+            return None
+        # Client errors (including 401, 403 WAF blocks and 429 throttling) are not
+        # transient from our side; retrying them would only add load.
+        if isinstance(err, ClientResponseError) and err.status < 500:
+            return None
+        # Never amplify load while the account is backing off from failed
+        # authentication (e.g. during an upstream block) or while requests of
+        # the same or a higher priority are already queued behind the rate
+        # limiter. Queued background work does not block retries of polls and
+        # user commands, which are served before it anyway.
+        if (
+            _get_auth_backoff_state(self.username)["failure_count"]
+            or self.rate_limiter.queued_ahead(priority)
+        ):
+            return None
+        delay = random.uniform(
+            0, min(CLOUD_RETRY_BACKOFF_MAX, CLOUD_RETRY_BACKOFF_BASE * 2 ** (attempt - 1))
+        )
+        if time.monotonic() + delay + CLOUD_REQUEST_TIMEOUT > deadline:
+            return None
+        return delay
+
+    async def _send_hedged_request(
+        self, path: str, data: dict[str, Any] | None, priority: int
+    ) -> dict[str, Any]:
+        """Send a GET request, racing a second copy if the first one is slow."""
+        primary = asyncio.ensure_future(self._send_request("get", path, data, priority))
+        pending = {primary}
+        # Cancel whatever is still running if the caller is cancelled, so no
+        # orphaned request keeps holding a rate limiter token.
+        try:
+            done, _ = await asyncio.wait(pending, timeout=CLOUD_HEDGE_DELAY)
+            if done or self.rate_limiter.under_pressure:
+                return await primary
+
+            _LOGGER.debug("Meural: Request to %s is slow, sending hedged request", path)
+            hedged = asyncio.ensure_future(self._send_request("get", path, data, priority))
+            pending = {primary, hedged}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+            # Both requests failed; report the original failure.
+            return primary.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _send_request(
+        self,
+        method: str,
+        path: str,
+        data: dict[str, Any] | None,
+        priority: int,
+    ) -> dict[str, Any]:
+        """Send a single request, re-authenticating once if the token was rejected."""
         fetched_new_token = self.token is None
         if self.token is None:
             await self.get_new_token()
-        url = f"{BASE_URL}{path}"
+        await self.rate_limiter.acquire(priority)
+        url = f"{self.base_url}{path}"
         kwargs = {}
         if data:
             if method == "get":
                 kwargs["params"] = data
             else:
                 kwargs["json"] = data
-        with async_timeout.timeout(10):
-            try:
+        bytes_out = len(url) + (len(json.dumps(data)) if data else 0)
+        started = time.monotonic()
+        try:
+            with async_timeout.timeout(CLOUD_REQUEST_TIMEOUT):
                 resp = await self.session.request(
                     method,
                     url,
@@ -172,28 +490,48 @@ class PyMeural:
                     raise_for_status=True,
                     **kwargs,
                 )
-            except ClientResponseError as err:
-                if err.status != 401:
-                    _LOGGER.error(
-                        "Meural: Sending request to %s failed with status %s: %s",
-                        path, err.status, err.message,
-                    )
-                    raise
-                # If a new token was just fetched and it fails again, just raise
-                if fetched_new_token:
-                    _LOGGER.error(
-                        "Meural: Sending request to %s failed. Freshly fetched token was rejected (401): %s",
-                        path, err.message,
-                    )
-                    raise
-                _LOGGER.info('Meural: Sending Request failed. Re-Authenticating')
-                self.token = None
-                return await self.request(method, path, data)
-            except Exception as err:
-                _LOGGER.error('Meural: Sending Request failed. Raising: %s', err)
+                body = await resp.read()
+        except ClientResponseError as err:
+            duration = time.monotonic() - started
+            self.stats.record(path, duration, bytes_out=bytes_out, error=True)
+            if self.recorder is not None:
+                self.recorder.record("cloud", method, path, data, err.status, duration, None)
+            if err.status != 401:
+                raise
+            # If a new token was just fetched and it fails again, just raise
+            if fetched_new_token:
+                _LOGGER.error(
+                    "Meural: Sending request to %s failed. Freshly fetched token was rejected (401): %s",
+                    path, err.message,
+                )
                 raise
-        response = await resp.json()
-        return response["data"]
+            _LOGGER.info('Meural: Sending Request failed. Re-Authenticating')
+            self.token = None
+            return await self._send_request(method, path, data, priority)
+        except asyncio.TimeoutError:
+            self.stats.record(path, time.monotonic() - started, bytes_out=bytes_out, timeout=True)
+            raise
+        except aiohttp.ClientError:
+            self.stats.record(path, time.monotonic() - started, bytes_out=bytes_out, error=True)
+            raise
+        duration = time.monotonic() - started
+        self.stats.record(path, duration, bytes_in=len(body), bytes_out=bytes_out)
+        if self.recorder is not None:
+            self.recorder.record("cloud", method, path, data, resp.status, duration, body)
+        return json.loads(body)["data"]
+
+    def auth_backoff_as_dict(self) -> dict[str, Any]:
+        """Return the account's authentication backoff state for diagnostics."""
+        backoff_state = _get_auth_backoff_state(self.username)
+        remaining = 0.0
+        if backoff_state["last_failure"]:
+            backoff = _auth_backoff_seconds(backoff_state["failure_count"])
+            remaining = max(0.0, backoff - (time.monotonic() - backoff_state["last_failure"]))
+        return {
+            "failure_count": backoff_state["failure_count"],
+            "error_type": backoff_state["error_type"].__name__,
+            "backoff_remaining": round(remaining, 1),
+        }
 
     async def get_new_token(self) -> None:
         """Fetch and store a new authentication token."""
@@ -231,6 +569,7 @@ class PyMeural:
                     try:
                         _LOGGER.debug("Meural: Attempting to refresh access token")
                         self.token = await refresh_access_token(self.session, self.refresh_token)
+                        self.stats.auth_refreshes += 1
                         # Update only access token, keep existing refresh token
                         self.token_update_callback(self.token, self.refresh_token)
                         return
@@ -243,8 +582,10 @@ class PyMeural:
                 self.token, self.refresh_token = await authenticate(
                     self.session, self.username, self.password
                 )
+                self.stats.auth_full += 1
                 self.token_update_callback(self.token, self.refresh_token)
             except (InvalidAuth, CannotConnect) as err:
+                self.stats.auth_failures += 1
                 backoff_state["last_failure"] = time.monotonic()
                 backoff_state["failure_count"] += 1
                 backoff_state["error_type"] = type(err)
@@ -268,17 +609,65 @@ class PyMeural:
         """Get user information."""
         return await self.request("get", "user")
 
+    async def paginate(
+        self, path: str, priority: int = PRIORITY_POLL, page_size: int = CLOUD_PAGE_SIZE
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Yield the pages of a list endpoint, stopping after an empty or short page.
+
+        Stops as well if a page starts with the same record as the previous
+        one, in case the endpoint ignores the page parameter.
+        """
+        page = 1
+        previous_first = None
+        while True:
+            records = await self.request("get", path, {"page": page, "count": page_size}, priority)
+            if not records or (page > 1 and records[0].get("id") == previous_first):
+                return
+            yield records
+            if len(records) < page_size:
+                return
+            previous_first = records[0].get("id")
+            page += 1
+
+    async def _get_all(self, path: str, priority: int = PRIORITY_POLL) -> list[dict[str, Any]]:
+        """Get every record of a list endpoint."""
+        return [record async for page in self.paginate(path, priority) for record in page]
+
+    def iter_user_items(self, page_size: int = CLOUD_PAGE_SIZE) -> AsyncIterator[list[dict[str, Any]]]:
+        """Yield pages of user items."""
+        return self.paginate("user/items", PRIORITY_BACKGROUND, page_size)
+
+    def iter_user_galleries(self, page_size: int = CLOUD_PAGE_SIZE) -> AsyncIterator[list[dict[str, Any]]]:
+        """Yield pages of user galleries."""
+        return self.paginate("user/galleries", PRIORITY_BACKGROUND, page_size)
+
+    def iter_user_devices(self, page_size: int = CLOUD_PAGE_SIZE) -> AsyncIterator[list[dict[str, Any]]]:
+        """Yield pages of user devices."""
+        return self.paginate("user/devices", PRIORITY_POLL, page_size)
+
+    def iter_device_galleries(
+        self, device_id: str | int, page_size: int = CLOUD_PAGE_SIZE
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Yield pages of device galleries."""
+        return self.paginate(f"devices/{device_id}/galleries", PRIORITY_BACKGROUND, page_size)
+
+    def iter_gallery_items(
+        self, gallery_id: str | int, page_size: int = CLOUD_PAGE_SIZE
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Yield pages of the items in a gallery."""
+        return self.paginate(f"galleries/{gallery_id}/items", PRIORITY_BACKGROUND, page_size)
+
     async def get_user_items(self) -> list[dict[str, Any]]:
         """Get user items."""
-        return await self.request("get", "user/items", {"count": 1000})
+        return await self._get_all("user/items", PRIORITY_BACKGROUND)
 
     async def get_user_galleries(self) -> list[dict[str, Any]]:
         """Get user galleries."""
-        return await self.request("get", "user/galleries", {"count": 1000})
+        return await self._get_all("user/galleries", PRIORITY_BACKGROUND)
 
     async def get_user_devices(self) -> list[dict[str, Any]]:
         """Get user devices."""
-        return await self.request("get", "user/devices", {"count": 1000})
+        return await self._get_all("user/devices")
 
     async def get_user_feedback(self) -> dict[str, Any]:
         """Get user feedback."""
@@ -286,40 +675,57 @@ class PyMeural:
 
     async def device_load_gallery(self, device_id: str | int, gallery_id: str | int) -> dict[str, Any]:
         """Load a gallery on a device."""
-        return await self.request("post", f"devices/{device_id}/galleries/{gallery_id}")
+        return await self.request("post", f"devices/{device_id}/galleries/{gallery_id}", priority=PRIORITY_USER)
 
     async def device_load_item(self, device_id: str | int, item_id: str | int) -> dict[str, Any]:
         """Load an item on a device."""
-        return await self.request("post", f"devices/{device_id}/items/{item_id}")
+        return await self.request("post", f"devices/{device_id}/items/{item_id}", priority=PRIORITY_USER)
 
-    async def get_device(self, device_id: str | int) -> dict[str, Any]:
+    async def get_device(self, device_id: str | int, priority: int = PRIORITY_POLL) -> dict[str, Any]:
         """Get device information."""
-        return await self.request("get", f"devices/{device_id}")
+        return await self.request("get", f"devices/{device_id}", priority=priority)
 
     async def get_device_galleries(self, device_id: str | int) -> list[dict[str, Any]]:
         """Get device galleries."""
-        return await self.request("get", f"devices/{device_id}/galleries", {"count": 1000})
+        return await self._get_all(f"devices/{device_id}/galleries", PRIORITY_BACKGROUND)
 
     async def update_device(self, device_id: str | int, data: dict[str, Any]) -> dict[str, Any]:
         """Update device settings."""
-        return await self.request("put", f"devices/{device_id}", data)
+        return await self.request("put", f"devices/{device_id}", data, PRIORITY_USER)
 
     async def sync_device(self, device_id: str | int) -> dict[str, Any]:
         """Synchronize device with Meural server."""
-        return await self.request("post", f"devices/{device_id}/sync")
+        return await self.request("post", f"devices/{device_id}/sync", priority=PRIORITY_USER)
+
+    async def get_gallery_items(
+        self, gallery_id: str | int, page: int = 1, count: int = 50, priority: int = PRIORITY_POLL
+    ) -> list[dict[str, Any]]:
+        """Get a page of the items in a gallery."""
+        return await self.request(
+            "get", f"galleries/{gallery_id}/items", {"page": page, "count": count}, priority
+        )
 
-    async def get_item(self, item_id: str | int) -> dict[str, Any]:
-        """Get item information."""
-        return await self.request("get", f"items/{item_id}")
+    async def get_item(self, item_id: str | int, priority: int = PRIORITY_POLL) -> dict[str, Any]:
+        """Get item information, hedging the request unless it is background work."""
+        return await self.request(
+            "get", f"items/{item_id}", priority=priority, hedge=priority != PRIORITY_BACKGROUND
+        )
 
 class LocalMeural:
     """Client for Meural local device API."""
 
-    def __init__(self, device: dict[str, Any], session: aiohttp.ClientSession) -> None:
-        """Initialize LocalMeural client."""
-        self.ip: str = device["localIp"]
+    def __init__(
+        self, device: dict[str, Any], session: aiohttp.ClientSession, host: str | None = None
+    ) -> None:
+        """Initialize LocalMeural client, using host instead of the device's localIp if given."""
+        self.ip: str = host or device["localIp"]
+        # A configured host is never replaced by the address reported by the cloud
+        self.configured_host = host
         self.device = device
         self.session = session
+        self.stats = RequestStats()
+        # Set while the record_traffic service captures requests
+        self.recorder: TrafficRecorder | None = None
 
     async def request(self, method: str, path: str, data: dict[str, Any] | None = None) -> dict[str, Any]:
         url = f"http://{self.ip}/remote/{path}"
@@ -329,6 +735,7 @@ class LocalMeural:
                 kwargs["params"] = data
             else:
                 kwargs["data"] = data
+        started = time.monotonic()
         try:
             with async_timeout.timeout(10):
                 resp = await self.session.request(
@@ -337,10 +744,26 @@ class LocalMeural:
                     raise_for_status=True,
                     **kwargs,
                 )
-            response = await resp.json(content_type=None)
-            return response["response"]
-        except aiohttp.client_exceptions.ClientConnectorError:
-            raise DeviceTurnedOff
+                body = await resp.read()
+        except asyncio.TimeoutError:
+            self.stats.record(path, time.monotonic() - started, bytes_out=len(url), timeout=True)
+            raise
+        except aiohttp.ClientError as err:
+            duration = time.monotonic() - started
+            self.stats.record(path, duration, bytes_out=len(url), error=True)
+            if self.recorder is not None and isinstance(err, ClientResponseError):
+                self.recorder.record(
+                    local_host(self.device["id"]), method, path, data, err.status, duration, None
+                )
+            if isinstance(err, aiohttp.client_exceptions.ClientConnectorError):
+                raise DeviceTurnedOff
+            raise
+        duration = time.monotonic() - started
+        self.stats.record(path, duration, bytes_in=len(body), bytes_out=len(url))
+        if self.recorder is not None:
+            self.recorder.record(local_host(self.device["id"]), method, path, data, resp.status, duration, body)
+        response = json.loads(body)
+        return response["response"]
 
     async def send_key_right(self) -> dict[str, Any]:
         """Send key right command."""
@@ -446,6 +869,7 @@ class LocalMeural:
 
         data = aiohttp.FormData()
         data.add_field('photo', image, content_type=content_type)
+        started = time.monotonic()
         response = await self.session.post(f"http://{self.ip}/remote/postcard", data=data)
         _LOGGER.info(
             "Meural device %s: Sending postcard. Response: %s",
@@ -453,6 +877,9 @@ class LocalMeural:
             response,
         )
         text = await response.text()
+        self.stats.record(
+            "postcard", time.monotonic() - started, bytes_in=len(text), bytes_out=len(image)
+        )
 
         r = json.loads(text)
         _LOGGER.info(
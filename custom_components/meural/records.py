@@ -0,0 +1,99 @@
+"""Compact records of the Meural cloud data the integration keeps in memory.
+
+Cloud API payloads carry many fields the integration never reads. Galleries and
+items are converted to slotted records at parse time and the payloads are
+discarded; device payloads are trimmed to the fields in DEVICE_FIELDS, and stay
+dicts because entities update them in place and they are saved for local-first
+startup.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+# Device fields read by the coordinators and entities
+DEVICE_FIELDS = (
+    "id",
+    "name",
+    "alias",
+    "productKey",
+    "serialNumber",
+    "localIp",
+    "frameModel",
+    "version",
+    "status",
+    "frameStatus",
+    "orientationMatch",
+    "imageDuration",
+    "imageShuffle",
+    "gestureFlip",
+)
+
+
+def compact_device(raw: dict[str, Any]) -> dict[str, Any]:
+    """Return a device payload without the fields the integration does not read."""
+    return {field: raw[field] for field in DEVICE_FIELDS if field in raw}
+
+
+@dataclass(frozen=True, slots=True)
+class Gallery:
+    """A Meural gallery (playlist or album)."""
+
+    id: int
+    name: str
+    cover: str | None = None
+    item_count: int | None = None
+    author: str | None = None
+    description: str | None = None
+    updated_at: str | None = None
+
+    @classmethod
+    def from_api(cls, raw: dict[str, Any]) -> Gallery:
+        """Create a record from a cloud API gallery."""
+        return cls(
+            id=int(raw["id"]),
+            name=raw.get("name") or "",
+            cover=raw.get("cover"),
+            item_count=raw.get("itemCount"),
+            author=raw.get("author"),
+            description=raw.get("description"),
+            updated_at=raw.get("updatedAt"),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class Item:
+    """A Meural artwork."""
+
+    id: int
+    name: str | None = None
+    artist: str | None = None
+    year: str | None = None
+    description: str | None = None
+    image: str | None = None
+    updated_at: str | None = None
+
+    @classmethod
+    def from_api(cls, raw: dict[str, Any]) -> Item:
+        """Create a record from a cloud API item, or from as_dict() output."""
+        year = raw.get("year")
+        return cls(
+            id=int(raw["id"]),
+            name=raw.get("name"),
+            artist=raw.get("artistName") or raw.get("author"),
+            year=str(year) if year is not None else None,
+            description=raw.get("description"),
+            image=raw.get("image"),
+            updated_at=raw.get("updatedAt"),
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the item with cloud API field names, for restoring state."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "artistName": self.artist,
+            "year": self.year,
+            "description": self.description,
+            "image": self.image,
+        }
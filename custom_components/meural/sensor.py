@@ -2,26 +2,43 @@
 from __future__ import annotations
 
 import logging
+import time
 from datetime import datetime
 from typing import Any
 
 _LOGGER = logging.getLogger(__name__)
 
 from homeassistant.components.sensor import (
+    RestoreSensor,
     SensorDeviceClass,
     SensorEntity,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import LIGHT_LUX, SIGNAL_STRENGTH_DECIBELS_MILLIWATT, UnitOfInformation
+from homeassistant.const import (
+    LIGHT_LUX,
+    SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+    UnitOfInformation,
+    UnitOfTime,
+)
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util.dt import parse_datetime
 
-from .const import DOMAIN
+from .const import (
+    CONF_LUX_THRESHOLD,
+    CONF_SENSOR_MIN_WRITE_INTERVAL,
+    CONF_WIFI_SIGNAL_THRESHOLD,
+    DEFAULT_LATENCY_THRESHOLD,
+    DEFAULT_LUX_THRESHOLD,
+    DEFAULT_SENSOR_MIN_WRITE_INTERVAL,
+    DEFAULT_WIFI_SIGNAL_THRESHOLD,
+    DOMAIN,
+)
 from .coordinator import CloudDataUpdateCoordinator, LocalDataUpdateCoordinator
+from .watchdog import Watchdog, watched
 
 
 async def async_setup_entry(
@@ -35,15 +52,39 @@ async def async_setup_entry(
     local_coordinators: dict[str, LocalDataUpdateCoordinator] = entry_data["local_coordinators"]
 
     devices = list(cloud_coordinator.data["devices"].values())
+    options = config_entry.options
+    min_write_interval = options.get(CONF_SENSOR_MIN_WRITE_INTERVAL, DEFAULT_SENSOR_MIN_WRITE_INTERVAL)
 
     entities = []
     for device in devices:
         _LOGGER.info("Adding Meural sensors for device %s", device["alias"])
         local_coordinator = local_coordinators[str(device["id"])]
-        entities.append(MeuralLuxSensor(local_coordinator, device))
+        entities.append(
+            MeuralLuxSensor(
+                local_coordinator,
+                device,
+                options.get(CONF_LUX_THRESHOLD, DEFAULT_LUX_THRESHOLD),
+                min_write_interval,
+            )
+        )
         entities.append(MeuralFreeSpaceSensor(local_coordinator, device))
-        entities.append(MeuralWifiSignalSensor(local_coordinator, device))
+        entities.append(
+            MeuralWifiSignalSensor(
+                local_coordinator,
+                device,
+                options.get(CONF_WIFI_SIGNAL_THRESHOLD, DEFAULT_WIFI_SIGNAL_THRESHOLD),
+                min_write_interval,
+            )
+        )
         entities.append(MeuralLastSeenSensor(cloud_coordinator, device))
+        entities.append(
+            MeuralLocalLatencySensor(
+                local_coordinator,
+                device,
+                DEFAULT_LATENCY_THRESHOLD,
+                min_write_interval,
+            )
+        )
 
     async_add_entities(entities)
 
@@ -51,15 +92,30 @@ async def async_setup_entry(
 class MeuralCloudSensorBase(CoordinatorEntity[CloudDataUpdateCoordinator], SensorEntity):
     """Base class for Meural cloud-sourced sensor entities."""
 
+    # Cloud device fields this sensor renders; state is only written when one changes.
+    _device_fields: tuple[str, ...] = ()
+
     def __init__(
         self,
         coordinator: CloudDataUpdateCoordinator,
         device: dict[str, Any],
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        # Subscribe to this device's cloud updates only
+        super().__init__(coordinator, context=str(device["id"]))
         self._device = device
 
+    @watched
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when a device field this sensor renders has changed."""
+        if self.coordinator.device_changed(str(self._device["id"]), self._device_fields):
+            super()._handle_coordinator_update()
+
+    @property
+    def watchdog(self) -> Watchdog | None:
+        """Return the slow call watchdog, if enabled."""
+        return self.coordinator.watchdog
+
     @property
     def device_info(self) -> dict[str, Any]:
         """Return device information to link this entity to the Meural device."""
@@ -68,8 +124,15 @@ class MeuralCloudSensorBase(CoordinatorEntity[CloudDataUpdateCoordinator], Senso
         }
 
 
-class MeuralSensorBase(CoordinatorEntity[LocalDataUpdateCoordinator], SensorEntity):
-    """Base class for Meural sensor entities."""
+class MeuralSensorBase(CoordinatorEntity[LocalDataUpdateCoordinator], RestoreSensor):
+    """Base class for Meural sensor entities.
+
+    Restores the last known value, which is reported until the local
+    coordinator's first refresh completes.
+    """
+
+    # Local data fields this sensor renders; state is only written when one changes.
+    _coordinator_fields: tuple[str, ...] = ()
 
     def __init__(
         self,
@@ -79,6 +142,25 @@ class MeuralSensorBase(CoordinatorEntity[LocalDataUpdateCoordinator], SensorEnti
         """Initialize the sensor."""
         super().__init__(coordinator)
         self._device = device
+        self._restored_value: Any = None
+
+    async def async_added_to_hass(self) -> None:
+        """Restore the last value and register the fields this sensor renders."""
+        await super().async_added_to_hass()
+        if (last_sensor_data := await self.async_get_last_sensor_data()) is not None:
+            self._restored_value = last_sensor_data.native_value
+        self.async_on_remove(self.coordinator.async_add_field_consumer(self._coordinator_fields))
+
+    @watched
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when a field this sensor renders has changed."""
+        if self.coordinator.has_changed(self._coordinator_fields):
+            super()._handle_coordinator_update()
+
+    @property
+    def watchdog(self) -> Watchdog | None:
+        """Return the slow call watchdog, if enabled."""
+        return self.coordinator.watchdog
 
     @property
     def device_info(self) -> dict[str, Any]:
@@ -88,21 +170,68 @@ class MeuralSensorBase(CoordinatorEntity[LocalDataUpdateCoordinator], SensorEnti
         }
 
 
-class MeuralLuxSensor(MeuralSensorBase):
+class MeuralThrottledSensorBase(MeuralSensorBase):
+    """Base class for noisy sensors that only write state on meaningful change."""
+
+    def __init__(
+        self,
+        coordinator: LocalDataUpdateCoordinator,
+        device: dict[str, Any],
+        threshold: float,
+        min_write_interval: float,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, device)
+        self._threshold = threshold
+        self._min_write_interval = min_write_interval
+        self._written_value: float | None = None
+        self._last_write = 0.0
+
+    async def async_added_to_hass(self) -> None:
+        """Record the value written when the entity is added."""
+        await super().async_added_to_hass()
+        self._written_value = self.native_value
+        self._last_write = time.monotonic()
+
+    @watched
+    def _handle_coordinator_update(self) -> None:
+        """Write state once the value moved past the threshold and the interval elapsed.
+
+        Compares against the last written value rather than the coordinator's
+        changed fields, so a change held back by the interval is written later.
+        """
+        value = self.native_value
+        if value is None or self._written_value is None:
+            if value == self._written_value:
+                return
+        elif (
+            abs(value - self._written_value) < self._threshold
+            or time.monotonic() - self._last_write < self._min_write_interval
+        ):
+            return
+        self._written_value = value
+        self._last_write = time.monotonic()
+        self.async_write_ha_state()
+
+
+class MeuralLuxSensor(MeuralThrottledSensorBase):
     """Ambient light sensor for a Meural Canvas device."""
 
     _attr_device_class = SensorDeviceClass.ILLUMINANCE
     _attr_native_unit_of_measurement = LIGHT_LUX
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_suggested_display_precision = 0
+    _coordinator_fields = ("lux",)
 
     def __init__(
         self,
         coordinator: LocalDataUpdateCoordinator,
         device: dict[str, Any],
+        threshold: float = DEFAULT_LUX_THRESHOLD,
+        min_write_interval: float = DEFAULT_SENSOR_MIN_WRITE_INTERVAL,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator, device)
+        super().__init__(coordinator, device, threshold, min_write_interval)
         self._attr_name = f"{device['alias']} Ambient Light"
         self._attr_unique_id = f"{device['id']}_lux"
 
@@ -110,7 +239,7 @@ class MeuralLuxSensor(MeuralSensorBase):
     def native_value(self) -> float | None:
         """Return the current lux value."""
         if not self.coordinator.data:
-            return None
+            return self._restored_value
         raw = self.coordinator.data.get("lux")
         try:
             return float(raw) if raw is not None else None
@@ -127,6 +256,7 @@ class MeuralFreeSpaceSensor(MeuralSensorBase):
     _attr_native_unit_of_measurement = UnitOfInformation.MEGABYTES
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_suggested_display_precision = 0
+    _coordinator_fields = ("free_space",)
 
     def __init__(
         self,
@@ -142,11 +272,11 @@ class MeuralFreeSpaceSensor(MeuralSensorBase):
     def native_value(self) -> int | None:
         """Return the current free space in MB."""
         if not self.coordinator.data:
-            return None
+            return self._restored_value
         return self.coordinator.data.get("free_space")
 
 
-class MeuralWifiSignalSensor(MeuralSensorBase):
+class MeuralWifiSignalSensor(MeuralThrottledSensorBase):
     """WiFi signal strength sensor for a Meural Canvas device."""
 
     _attr_device_class = SensorDeviceClass.SIGNAL_STRENGTH
@@ -155,14 +285,17 @@ class MeuralWifiSignalSensor(MeuralSensorBase):
     _attr_native_unit_of_measurement = SIGNAL_STRENGTH_DECIBELS_MILLIWATT
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_suggested_display_precision = 0
+    _coordinator_fields = ("wifi_signal",)
 
     def __init__(
         self,
         coordinator: LocalDataUpdateCoordinator,
         device: dict[str, Any],
+        threshold: float = DEFAULT_WIFI_SIGNAL_THRESHOLD,
+        min_write_interval: float = DEFAULT_SENSOR_MIN_WRITE_INTERVAL,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator, device)
+        super().__init__(coordinator, device, threshold, min_write_interval)
         self._attr_name = f"{device['alias']} WiFi Signal"
         self._attr_unique_id = f"{device['id']}_wifi_signal"
 
@@ -170,7 +303,7 @@ class MeuralWifiSignalSensor(MeuralSensorBase):
     def native_value(self) -> float | None:
         """Return the current WiFi signal strength in dBm."""
         if not self.coordinator.data:
-            return None
+            return self._restored_value
         raw = self.coordinator.data.get("wifi_signal")
         try:
             return float(raw) if raw is not None else None
@@ -184,6 +317,7 @@ class MeuralLastSeenSensor(MeuralCloudSensorBase):
     _attr_device_class = SensorDeviceClass.TIMESTAMP
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_entity_registry_enabled_default = False
+    _device_fields = ("frameStatus",)
 
     def __init__(
         self,
@@ -208,3 +342,34 @@ class MeuralLastSeenSensor(MeuralCloudSensorBase):
             return None
         return parse_datetime(raw)
 
+
+
+class MeuralLocalLatencySensor(MeuralThrottledSensorBase):
+    """Local API response time sensor for a Meural Canvas device."""
+
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_suggested_display_precision = 0
+
+    def __init__(
+        self,
+        coordinator: LocalDataUpdateCoordinator,
+        device: dict[str, Any],
+        threshold: float = DEFAULT_LATENCY_THRESHOLD,
+        min_write_interval: float = DEFAULT_SENSOR_MIN_WRITE_INTERVAL,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, device, threshold, min_write_interval)
+        self._attr_name = f"{device['alias']} Local API Latency"
+        self._attr_unique_id = f"{device['id']}_local_latency"
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the moving average of recent local API response times in ms."""
+        latency = self.coordinator.local_meural.stats.recent_latency
+        if latency is None:
+            return self._restored_value
+        return round(latency * 1000, 1)
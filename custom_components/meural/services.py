@@ -0,0 +1,186 @@
+"""Integration-wide services for Meural."""
+from __future__ import annotations
+
+import asyncio
+import cProfile
+import logging
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DEFAULT_PROFILE_DURATION,
+    DEFAULT_PROFILE_TOP,
+    DEFAULT_RECORD_DURATION,
+    DEFAULT_SEARCH_LIMIT,
+    DOMAIN,
+    MAX_PROFILE_DURATION,
+    MAX_RECORD_DURATION,
+    MAX_SEARCH_LIMIT,
+    SERVICE_PROFILE,
+    SERVICE_RECORD_TRAFFIC,
+    SERVICE_SEARCH,
+)
+from .library import KIND_GALLERY, KIND_ITEM, merge_results
+from .profiler import TaskSampler, summarize
+from .traffic import TrafficRecorder
+
+_LOGGER = logging.getLogger(__name__)
+
+RECORD_TRAFFIC_SCHEMA = vol.Schema(
+    {
+        vol.Optional("duration", default=DEFAULT_RECORD_DURATION): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=MAX_RECORD_DURATION)
+        ),
+    }
+)
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional("duration", default=DEFAULT_PROFILE_DURATION): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=MAX_PROFILE_DURATION)
+        ),
+        vol.Optional("top", default=DEFAULT_PROFILE_TOP): vol.All(vol.Coerce(int), vol.Range(min=1, max=100)),
+    }
+)
+
+SEARCH_SCHEMA = vol.Schema(
+    {
+        vol.Required("query"): vol.All(str, vol.Length(min=1)),
+        vol.Optional("type"): vol.In([KIND_ITEM, KIND_GALLERY]),
+        vol.Optional("limit", default=DEFAULT_SEARCH_LIMIT): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=MAX_SEARCH_LIMIT)
+        ),
+    }
+)
+
+
+def _write_text(path: str, text: str) -> None:
+    with open(path, "w", encoding="utf-8") as report:
+        report.write(text)
+
+
+def _api_clients(hass: HomeAssistant) -> list[Any]:
+    """Return the cloud and local API clients of all loaded config entries."""
+    clients = []
+    for entry in hass.config_entries.async_entries(DOMAIN):
+        entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+        if entry_data is None:
+            continue
+        clients.append(entry_data["meural"])
+        clients.extend(
+            local_coordinator.local_meural for local_coordinator in entry_data["local_coordinators"].values()
+        )
+    return clients
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration-wide services."""
+    recording: dict[str, TrafficRecorder] = {}
+
+    async def async_record_traffic(call: ServiceCall) -> None:
+        """Record redacted API traffic of all Canvas frames to a fixture file."""
+        if recording:
+            raise HomeAssistantError("Meural traffic is already being recorded")
+        clients = _api_clients(hass)
+        if not clients:
+            raise HomeAssistantError("No Meural account is loaded")
+
+        duration = call.data["duration"]
+        recorder = recording["active"] = TrafficRecorder()
+        for client in clients:
+            client.recorder = recorder
+        path = hass.config.path(f"meural_traffic_{dt_util.now().strftime('%Y%m%d_%H%M%S')}.json")
+        _LOGGER.info("Meural: Recording API traffic for %d seconds to %s", duration, path)
+
+        async def async_finish_recording() -> None:
+            try:
+                await asyncio.sleep(duration)
+            finally:
+                for client in clients:
+                    if client.recorder is recorder:
+                        client.recorder = None
+                recording.clear()
+            await hass.async_add_executor_job(recorder.save, path)
+            _LOGGER.info("Meural: Recorded %d API requests to %s", len(recorder.entries), path)
+
+        hass.async_create_background_task(async_finish_recording(), "meural_record_traffic")
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_RECORD_TRAFFIC, async_record_traffic, schema=RECORD_TRAFFIC_SCHEMA
+    )
+
+    profiling: dict[str, cProfile.Profile] = {}
+
+    async def async_profile(call: ServiceCall) -> ServiceResponse:
+        """Profile the integration for a while and return its hot paths."""
+        if profiling:
+            raise HomeAssistantError("The Meural integration is already being profiled")
+        duration = call.data["duration"]
+        profiler = profiling["active"] = cProfile.Profile()
+        sampler = TaskSampler(hass.loop, asyncio.current_task())
+        try:
+            profiler.enable()
+        except ValueError as err:
+            # Only one profiler can be active at a time, e.g. Home Assistant's own
+            profiling.clear()
+            raise HomeAssistantError(f"Cannot start profiling: {err}") from err
+        sampler.start()
+        _LOGGER.info("Meural: Profiling the integration for %d seconds", duration)
+        try:
+            await asyncio.sleep(duration)
+        finally:
+            profiler.disable()
+            sampler.stop()
+            profiling.clear()
+
+        summary, report = await hass.async_add_executor_job(
+            summarize, profiler, sampler, duration, call.data["top"]
+        )
+        path = hass.config.path(f"meural_profile_{dt_util.now().strftime('%Y%m%d_%H%M%S')}")
+        await hass.async_add_executor_job(_write_text, f"{path}.txt", report)
+        await hass.async_add_executor_job(profiler.dump_stats, f"{path}.prof")
+        _LOGGER.info("Meural: Profile written to %s.txt and %s.prof", path, path)
+        return {"report": f"{path}.txt", "stats": f"{path}.prof", **summary}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE,
+        async_profile,
+        schema=PROFILE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def async_search(call: ServiceCall) -> ServiceResponse:
+        """Search the indexed items and galleries of all loaded accounts."""
+        entries = [
+            entry_data
+            for entry in hass.config_entries.async_entries(DOMAIN)
+            if (entry_data := hass.data.get(DOMAIN, {}).get(entry.entry_id)) is not None
+        ]
+        if not entries:
+            raise HomeAssistantError("No Meural account is loaded")
+        query, limit = call.data["query"], call.data["limit"]
+        # Each account's results are ranked; merge them so the best matches of
+        # every account compete for the limit
+        results = merge_results(
+            query,
+            (
+                entry_data["cloud_coordinator"].library.search(query, call.data.get("type"), limit)
+                for entry_data in entries
+            ),
+            limit,
+        )
+        return {"results": results}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SEARCH,
+        async_search,
+        schema=SEARCH_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
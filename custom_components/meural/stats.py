@@ -0,0 +1,197 @@
+"""Request, refresh and cache statistics for the Meural integration."""
+from __future__ import annotations
+
+import bisect
+import re
+from datetime import datetime
+from typing import Any
+
+# Upper bounds (in seconds) of the latency histogram buckets. Requests slower
+# than the last bound are counted in an extra overflow bucket.
+LATENCY_BUCKETS = (0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Weight of each new request in the moving average of recent latency
+RECENT_LATENCY_WEIGHT = 0.2
+
+_NUMERIC_SEGMENT = re.compile(r"(?<=/)\d+(?=/|$)|^\d+(?=/|$)")
+
+
+def path_template(path: str) -> str:
+    """Return the request path with numeric IDs replaced, e.g. items/{id}."""
+    return _NUMERIC_SEGMENT.sub("{id}", path)
+
+
+class EndpointStats:
+    """Counters and latency histogram for a single endpoint."""
+
+    __slots__ = (
+        "requests",
+        "errors",
+        "timeouts",
+        "bytes_in",
+        "bytes_out",
+        "total_time",
+        "max_time",
+        "buckets",
+    )
+
+    def __init__(self) -> None:
+        """Initialize empty statistics."""
+        self.requests = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def percentile(self, fraction: float) -> float | None:
+        """Return the upper bound of the bucket holding the given fraction of requests."""
+        if not self.requests:
+            return None
+        rank = fraction * self.requests
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if seen >= rank:
+                if index < len(LATENCY_BUCKETS):
+                    return min(LATENCY_BUCKETS[index], self.max_time)
+                return self.max_time
+        return self.max_time
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics for diagnostics, with times in milliseconds."""
+        p50 = self.percentile(0.5)
+        p95 = self.percentile(0.95)
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "mean_ms": round(1000 * self.total_time / self.requests, 1) if self.requests else None,
+            "p50_ms": round(1000 * p50, 1) if p50 is not None else None,
+            "p95_ms": round(1000 * p95, 1) if p95 is not None else None,
+            "max_ms": round(1000 * self.max_time, 1),
+            "histogram": {
+                **{f"le_{int(bound * 1000)}ms": count for bound, count in zip(LATENCY_BUCKETS, self.buckets)},
+                "overflow": self.buckets[-1],
+            },
+        }
+
+
+class RequestStats:
+    """Per-endpoint request statistics of one API client.
+
+    Recording a request is a dict lookup and a few integer updates, cheap
+    enough to stay enabled permanently.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty statistics."""
+        self.endpoints: dict[str, EndpointStats] = {}
+        self.auth_refreshes = 0
+        self.auth_full = 0
+        self.auth_failures = 0
+        self.recent_latency: float | None = None
+
+    def record(
+        self,
+        path: str,
+        duration: float,
+        *,
+        bytes_in: int = 0,
+        bytes_out: int = 0,
+        error: bool = False,
+        timeout: bool = False,
+    ) -> None:
+        """Record a finished request."""
+        template = path_template(path)
+        endpoint = self.endpoints.get(template)
+        if endpoint is None:
+            endpoint = self.endpoints[template] = EndpointStats()
+        endpoint.requests += 1
+        endpoint.errors += error
+        endpoint.timeouts += timeout
+        endpoint.bytes_in += bytes_in
+        endpoint.bytes_out += bytes_out
+        endpoint.total_time += duration
+        endpoint.max_time = max(endpoint.max_time, duration)
+        endpoint.buckets[bisect.bisect_left(LATENCY_BUCKETS, duration)] += 1
+        if self.recent_latency is None:
+            self.recent_latency = duration
+        else:
+            self.recent_latency += RECENT_LATENCY_WEIGHT * (duration - self.recent_latency)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return all statistics for diagnostics."""
+        return {
+            "recent_latency_ms": (
+                round(1000 * self.recent_latency, 1) if self.recent_latency is not None else None
+            ),
+            "auth_refreshes": self.auth_refreshes,
+            "auth_full": self.auth_full,
+            "auth_failures": self.auth_failures,
+            "endpoints": {
+                template: endpoint.as_dict() for template, endpoint in sorted(self.endpoints.items())
+            },
+        }
+
+
+class UpdateStats:
+    """Duration and outcome of the refreshes of one coordinator or background task."""
+
+    def __init__(self) -> None:
+        """Initialize empty statistics."""
+        self.count = 0
+        self.failures = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.last_duration: float | None = None
+        self.last_started: datetime | None = None
+        self.last_success: datetime | None = None
+
+    def record(self, started: datetime, duration: float, success: bool) -> None:
+        """Record a finished refresh."""
+        self.count += 1
+        self.failures += not success
+        self.total_time += duration
+        self.max_time = max(self.max_time, duration)
+        self.last_duration = duration
+        self.last_started = started
+        if success:
+            self.last_success = started
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics for diagnostics, with times in milliseconds."""
+        return {
+            "count": self.count,
+            "failures": self.failures,
+            "success_rate": round(1 - self.failures / self.count, 3) if self.count else None,
+            "mean_ms": round(1000 * self.total_time / self.count, 1) if self.count else None,
+            "max_ms": round(1000 * self.max_time, 1),
+            "last_ms": round(1000 * self.last_duration, 1) if self.last_duration is not None else None,
+            "last_started": self.last_started.isoformat() if self.last_started else None,
+            "last_success": self.last_success.isoformat() if self.last_success else None,
+        }
+
+
+class CacheStats:
+    """Hit and miss counters of a cache."""
+
+    __slots__ = ("hits", "misses")
+
+    def __init__(self) -> None:
+        """Initialize empty counters."""
+        self.hits = 0
+        self.misses = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters and hit rate for diagnostics."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else None,
+        }
@@ -0,0 +1,119 @@
+"""Opt-in recording of Meural API traffic to replayable fixture files."""
+from __future__ import annotations
+
+import json
+import time
+from typing import Any
+
+FIXTURE_VERSION = 1
+
+REDACTED = "**REDACTED**"
+REDACTED_KEYS = {
+    "email",
+    "password",
+    "token",
+    "refresh_token",
+    "username",
+    "serialNumber",
+    "productKey",
+    "ssid",
+    "mac",
+    "macAddress",
+    "firstName",
+    "lastName",
+    "fullName",
+    "displayName",
+    "phone",
+    "phoneNumber",
+    "address",
+    "city",
+    "postalCode",
+    "birthday",
+}
+# Objects describing a person, whose name is redacted as well. Names elsewhere
+# are gallery, item and device names, which replays need.
+PERSON_KEYS = {"user", "users", "owner", "owners", "createdBy", "updatedBy", "sharedWith", "members"}
+
+
+def local_host(device_id: str | int) -> str:
+    """Return the placeholder host recorded for a Canvas' local IP address."""
+    return f"canvas-{device_id}.invalid"
+
+
+def _redacted_key(key: str, person: bool) -> bool:
+    return key in REDACTED_KEYS or "email" in key.lower() or (person and key == "name")
+
+
+def redact(value: Any, person: bool = False) -> Any:
+    """Return a copy of a JSON value with credentials and personal data removed.
+
+    With person=True, value describes a person and its name is removed too.
+    Local IP addresses are replaced with a placeholder host per device, so a
+    replay can still route local requests to the right recorded Canvas.
+    """
+    if isinstance(value, list):
+        return [redact(item, person) for item in value]
+    if not isinstance(value, dict):
+        return value
+    redacted = {
+        key: REDACTED if _redacted_key(key, person) else redact(item, key in PERSON_KEYS)
+        for key, item in value.items()
+    }
+    if "localIp" in redacted and "id" in redacted:
+        redacted["localIp"] = local_host(redacted["id"])
+    return redacted
+
+
+class TrafficRecorder:
+    """Collect redacted request and response pairs of the cloud and local clients."""
+
+    def __init__(self) -> None:
+        """Initialize an empty recording."""
+        self.started = time.monotonic()
+        self.entries: list[dict[str, Any]] = []
+
+    def record(
+        self,
+        host: str,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None,
+        status: int,
+        duration: float,
+        body: bytes | str | None,
+    ) -> None:
+        """Record a finished request.
+
+        host is "cloud" for the cloud API or local_host() of the Canvas.
+        """
+        response: Any = None
+        if body:
+            try:
+                response = json.loads(body)
+                if host == "cloud" and path.strip("/") == "user" and isinstance(response, dict):
+                    # The user endpoint describes the account holder
+                    response["data"] = redact(response.get("data"), person=True)
+                response = redact(response)
+            except ValueError:
+                response = None
+        self.entries.append(
+            {
+                "host": host,
+                "method": method.lower(),
+                "path": path,
+                "params": redact(params) if params else None,
+                "status": status,
+                "offset": round(time.monotonic() - self.started - duration, 4),
+                "duration": round(duration, 4),
+                "response": response,
+            }
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the recording in fixture file format."""
+        return {"version": FIXTURE_VERSION, "entries": self.entries}
+
+    def save(self, path: str) -> None:
+        """Write the recording to a fixture file. Does blocking I/O."""
+        with open(path, "w", encoding="utf-8") as fixture:
+            json.dump(self.as_dict(), fixture, indent=1)
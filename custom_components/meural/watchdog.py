@@ -0,0 +1,142 @@
+"""Optional watchdog for slow Meural handlers and event loop lag."""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Callable
+import functools
+import logging
+import time
+from typing import Any, TypeVar
+
+from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+EVENT_SLOW_CALL = "meural_slow_call"
+
+# Number of recent durations per handler kept to compute percentiles
+WATCHDOG_WINDOW = 1000
+# Interval (in seconds) of the event loop lag probe
+LOOP_LAG_INTERVAL = 1.0
+# Minimum time (in seconds) between warnings logged for the same handler
+WARNING_INTERVAL = 600
+
+LOOP_LAG = "event_loop_lag"
+
+_FuncT = TypeVar("_FuncT", bound=Callable[..., Any])
+
+
+class HandlerStats:
+    """Recent durations of one watched handler."""
+
+    __slots__ = ("count", "slow", "max_time", "recent", "last_warning")
+
+    def __init__(self) -> None:
+        """Initialize empty statistics."""
+        self.count = 0
+        self.slow = 0
+        self.max_time = 0.0
+        self.recent: deque[float] = deque(maxlen=WATCHDOG_WINDOW)
+        self.last_warning = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics for diagnostics, with times in milliseconds."""
+        ordered = sorted(self.recent)
+        p99 = ordered[min(len(ordered) - 1, int(0.99 * len(ordered)))] if ordered else None
+        return {
+            "count": self.count,
+            "slow": self.slow,
+            "max_ms": round(1000 * self.max_time, 1),
+            "p99_ms": round(1000 * p99, 1) if p99 is not None else None,
+        }
+
+
+class Watchdog:
+    """Time watched handlers and report those that exceed a threshold.
+
+    Synchronous callbacks run on the event loop, so their duration is the time
+    the loop was blocked. For coroutines the duration also includes time spent
+    waiting for I/O; a slow coroutine is worth investigating but does not by
+    itself mean the loop was blocked. The loop lag probe covers that case.
+    """
+
+    def __init__(self, hass: HomeAssistant, threshold: float) -> None:
+        """Initialize the watchdog with a threshold in seconds."""
+        self.hass = hass
+        self.threshold = threshold
+        self.handlers: dict[str, HandlerStats] = {}
+
+    def record(self, name: str, duration: float) -> None:
+        """Record a finished call and report it if it was slow."""
+        stats = self.handlers.get(name)
+        if stats is None:
+            stats = self.handlers[name] = HandlerStats()
+        stats.count += 1
+        stats.recent.append(duration)
+        stats.max_time = max(stats.max_time, duration)
+        if duration < self.threshold:
+            return
+        stats.slow += 1
+        self.hass.bus.async_fire(
+            EVENT_SLOW_CALL,
+            {"handler": name, "duration_ms": round(1000 * duration, 1), "threshold_ms": round(1000 * self.threshold)},
+        )
+        now = time.monotonic()
+        if now - stats.last_warning >= WARNING_INTERVAL:
+            stats.last_warning = now
+            _LOGGER.warning(
+                "Meural: %s took %.0f ms (threshold %.0f ms); further slow calls are logged at debug level for %d minutes",
+                name, 1000 * duration, 1000 * self.threshold, WARNING_INTERVAL // 60,
+            )
+        else:
+            _LOGGER.debug("Meural: %s took %.0f ms", name, 1000 * duration)
+
+    async def async_monitor_loop_lag(self) -> None:
+        """Measure how late the event loop wakes up a periodic sleeper, until cancelled."""
+        while True:
+            started = time.monotonic()
+            await asyncio.sleep(LOOP_LAG_INTERVAL)
+            self.record(LOOP_LAG, max(0.0, time.monotonic() - started - LOOP_LAG_INTERVAL))
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics of all watched handlers for diagnostics."""
+        return {
+            "threshold_ms": round(1000 * self.threshold),
+            "handlers": {name: stats.as_dict() for name, stats in sorted(self.handlers.items())},
+        }
+
+
+def watched(func: _FuncT) -> _FuncT:
+    """Time a method with the watchdog of its object, if one is enabled.
+
+    The object must have a `watchdog` attribute, which is None while the
+    watchdog is disabled.
+    """
+    if asyncio.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            watchdog: Watchdog | None = self.watchdog
+            if watchdog is None:
+                return await func(self, *args, **kwargs)
+            started = time.perf_counter()
+            try:
+                return await func(self, *args, **kwargs)
+            finally:
+                watchdog.record(f"{type(self).__name__}.{func.__name__}", time.perf_counter() - started)
+
+        return async_wrapper  # type: ignore[return-value]
+
+    @functools.wraps(func)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        watchdog: Watchdog | None = self.watchdog
+        if watchdog is None:
+            return func(self, *args, **kwargs)
+        started = time.perf_counter()
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            watchdog.record(f"{type(self).__name__}.{func.__name__}", time.perf_counter() - started)
+
+    return wrapper  # type: ignore[return-value]